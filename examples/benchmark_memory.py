@@ -0,0 +1,99 @@
+"""
+Measures the memory footprint of the ``Stop`` and ``Route`` models, as it is the dominant cost on the heuristics
+which generate many conjectured routes (like ``GRASP``), and compares it with the one of un-slotted stand-ins of the
+same classes (which store their attributes on a ``__dict__``, as the models did before declaring ``__slots__``).
+"""
+
+import gc
+import logging
+import sys
+import tracemalloc
+from random import (
+    seed,
+    uniform,
+)
+
+import jinete as jit
+
+logging.basicConfig(level=logging.INFO)
+
+logger = logging.getLogger(__name__)
+
+ROUTES_COUNT = 1000
+PLANNED_TRIPS_COUNT = 10
+
+
+def shallow_size(obj) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def build_trips(surface: jit.Surface, n: int):
+    trips = list()
+    for i in range(n):
+        origin = jit.Service(position=surface.get_or_create_position([uniform(-100, 100), uniform(-100, 100)]))
+        destination = jit.Service(position=surface.get_or_create_position([uniform(-100, 100), uniform(-100, 100)]))
+        trips.append(jit.Trip(identifier=str(i), origin=origin, destination=destination))
+    return trips
+
+
+def unslotted(cls: type) -> type:
+    slots = set(getattr(cls, "__slots__", ()))
+    namespace = {key: value for key, value in vars(cls).items() if key != "__slots__" and key not in slots}
+    return type(cls)(f"Unslotted{cls.__name__}", cls.__bases__, namespace)
+
+
+def build_routes(vehicle: jit.Vehicle, trips, n: int, stop_cls: type, planned_trip_cls: type, route_cls: type):
+    routes = list()
+    for _ in range(n):
+        first = stop_cls(vehicle, vehicle.origin_position, None)
+        last = stop_cls(vehicle, vehicle.destination_position, first)
+        route = route_cls(vehicle, [first, last])
+        for trip in trips:
+            pickup = stop_cls(vehicle, trip.origin_position, route.current_stop)
+            delivery = stop_cls(vehicle, trip.destination_position, pickup)
+            route.append_planned_trip(planned_trip_cls(vehicle, trip, pickup, delivery))
+        route.schedule  # noqa
+        routes.append(route)
+    return routes
+
+
+def measure(name: str, vehicle: jit.Vehicle, trips, stop_cls: type, planned_trip_cls: type, route_cls: type) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    routes = build_routes(vehicle, trips, ROUTES_COUNT, stop_cls, planned_trip_cls, route_cls)
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stops_count = sum(len(route.stops) for route in routes)
+    route = routes[0]
+    logger.info(f"{name} Stop instance: {shallow_size(route.stops[1])} bytes.")
+    logger.info(f"{name} PlannedTrip instance: {shallow_size(next(route.planned_trips))} bytes.")
+    logger.info(f"{name} Route instance: {shallow_size(route)} bytes.")
+    logger.info(f"{name} total: {(after - before) / stops_count:.1f} bytes per stop ({stops_count} stops).")
+    logger.info(f"{name} total: {(after - before) / len(routes):.1f} bytes per route ({len(routes)} routes).")
+    return (after - before) / stops_count
+
+
+def main():
+    seed(56)
+    surface = jit.GeometricSurface(jit.DistanceMetric.EUCLIDEAN)
+    vehicle = jit.Vehicle("0", jit.Service(surface.get_or_create_position([0, 0])), capacity=PLANNED_TRIPS_COUNT)
+    trips = build_trips(surface, PLANNED_TRIPS_COUNT)
+
+    slotted = measure("Slotted", vehicle, trips, jit.Stop, jit.PlannedTrip, jit.Route)
+    baseline = measure(
+        "Un-slotted", vehicle, trips, unslotted(jit.Stop), unslotted(jit.PlannedTrip), unslotted(jit.Route),
+    )
+    logger.info(
+        f"Slots save {baseline - slotted:.1f} bytes per stop ({100 * (baseline - slotted) / baseline:.1f}%) "
+        f"over the un-slotted stand-ins."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ from ._version import (
 )
 from .algorithms import (
     Algorithm,
+    BestInsertionStrategy,
     BestStatelessInsertionIterator,
     GraspAlgorithm,
     InsertionAlgorithm,
@@ -20,6 +21,7 @@ from .algorithms import (
     OneShiftLocalSearchStrategy,
     RankingInsertionIterator,
     ReallocationLocalSearchStrategy,
+    RegretInsertionIterator,
     SamplingInsertionStrategy,
     SequentialAlgorithm,
     StatelessInsertionIterator,
@@ -50,17 +52,28 @@ from .models import (
     MAX_INT,
     MIN_FLOAT,
     MIN_INT,
+    CompatibilityGraph,
+    ConjecturedPlannedTrip,
+    ConjecturedRoute,
+    ContractionHierarchy,
+    ContractionHierarchySurface,
     DialARideObjective,
     DistanceMetric,
     EarliestLastDepartureTimeRouteCriterion,
     Fleet,
     GeometricPosition,
     GeometricSurface,
+    GraphPosition,
+    GraphSurface,
     HashCodeObjective,
     HashCodeRouteCriterion,
+    InsertionCandidate,
     Job,
+    JobPreprocessor,
     LongestTimeRouteCriterion,
     LongestUtilTimeRouteCriterion,
+    MatrixPosition,
+    MatrixSurface,
     Objective,
     OptimizationDirection,
     PlannedTrip,
@@ -69,13 +82,17 @@ from .models import (
     Result,
     Route,
     RouteCriterion,
+    Schedule,
     Service,
     ShortestAveragePlannerTripDurationCriterion,
     ShortestTimeRouteCriterion,
+    SpeedProfile,
     Stop,
     Surface,
     TaxiSharingObjective,
+    TimeDependentSurface,
     Trip,
+    TripIndex,
     Vehicle,
 )
 from .solvers import (
@@ -7,6 +7,7 @@ from .exacts import (
     MilpAlgorithm,
 )
 from .heuristics import (
+    BestInsertionStrategy,
     BestStatelessInsertionIterator,
     InsertionAlgorithm,
     InsertionIterator,
@@ -17,6 +18,7 @@ from .heuristics import (
     OneShiftLocalSearchStrategy,
     RankingInsertionIterator,
     ReallocationLocalSearchStrategy,
+    RegretInsertionIterator,
     SamplingInsertionStrategy,
     StatelessInsertionIterator,
     TailInsertionStrategy,
@@ -15,11 +15,13 @@ from typing import (
     TYPE_CHECKING,
 )
 
+import numpy as np
 import pulp as lp
 from cached_property import (
     cached_property,
 )
 from jinete.models import (
+    JobPreprocessor,
     PlannedTrip,
     Route,
     Stop,
@@ -42,6 +44,7 @@ if TYPE_CHECKING:
         Trip,
         Vehicle,
         Position,
+        Surface,
     )
 
 logger = logging.getLogger(__name__)
@@ -87,6 +90,7 @@ class ThreeIndexLinearModel(LinearModel):
                 self._connectivity_constraints,
                 self._time_constraints,
                 self._feasibility_constraints,
+                self._arc_constraints,
             ],
             [],
         )
@@ -130,6 +134,10 @@ class ThreeIndexLinearModel(LinearModel):
             w.append(w_k)
         return w
 
+    @cached_property
+    def _preprocessor(self) -> JobPreprocessor:
+        return JobPreprocessor(self.job, self.fleet)
+
     @cached_property
     def _vehicles(self) -> Tuple[Vehicle, ...]:
         return tuple(self.fleet.vehicles)
@@ -149,18 +157,28 @@ class ThreeIndexLinearModel(LinearModel):
         return positions
 
     @cached_property
-    def _costs(self):
-        costs = list()
-        for origin in self._positions:
-            origin_costs = list()
-            for destination in self._positions:
-                if origin == destination:
-                    cost = BIG
-                else:
-                    cost = origin.distance_to(destination)
-                origin_costs.append(cost)
-            costs.append(origin_costs)
-        return costs
+    def _costs(self) -> List[List[float]]:
+        costs = self._surface.distance_many(*self._position_pairs).reshape(len(self._positions), -1)
+
+        identifiers = dict()
+        identifiers = np.array([identifiers.setdefault(position, len(identifiers)) for position in self._positions])
+        costs[identifiers[:, np.newaxis] == identifiers[np.newaxis, :]] = BIG
+
+        return costs.tolist()
+
+    @cached_property
+    def _travel_times(self) -> List[List[float]]:
+        return self._surface.time_many(*self._position_pairs).reshape(len(self._positions), -1).tolist()
+
+    @property
+    def _surface(self) -> Surface:
+        return self._positions[0].surface
+
+    @property
+    def _position_pairs(self) -> Tuple[List[Position], List[Position]]:
+        pairs = product(self._positions, repeat=2)
+        origins, destinations = zip(*pairs)
+        return list(origins), list(destinations)
 
     @property
     def _pickups_indexer(self) -> Iterable[int]:
@@ -187,6 +205,22 @@ class ThreeIndexLinearModel(LinearModel):
             return None
         return self._trips[(idx % self._n) - 1]
 
+    def _node_by_position_idx(self, idx: int) -> Optional[Tuple[Trip, bool]]:
+        trip = self._trip_by_position_idx(idx)
+        if trip is None:
+            return None
+        return trip, idx <= self._n
+
+    def _infeasible_arc(self, i: int, j: int) -> bool:
+        last = len(self._positions) - 1
+        if j == 0 or i == last:
+            return True
+        if i == 0:
+            return self._n < j < last
+        if j == last:
+            return i <= self._n
+        return (self._node_by_position_idx(i), self._node_by_position_idx(j)) in self._preprocessor.infeasible_arcs
+
     def _idx_by_position(self, position: Position):
         return self._positions.index(position)
 
@@ -268,7 +302,7 @@ class ThreeIndexLinearModel(LinearModel):
         for k in self._routes_indexer:
             for i, j in product(self._positions_indexer, self._positions_indexer):
                 load_time_i = self._load_time_by_position_idx(i)
-                travel_time = self._positions[i].time_to(self._positions[j])
+                travel_time = self._travel_times[i][j]
 
                 earliest_i, latest_i = self._time_window_by_position_idx(i)
                 earliest_j, latest_j = self._time_window_by_position_idx(j)
@@ -303,7 +337,7 @@ class ThreeIndexLinearModel(LinearModel):
             for i in self._pickups_indexer:
                 load_time = self._load_time_by_position_idx(i)
                 timeout = self._timeout_by_position_idx(i)
-                travel_time = self._positions[i].time_to(self._positions[i + self._n])
+                travel_time = self._travel_times[i][i + self._n]
 
                 constraints.extend(
                     [
@@ -324,6 +358,15 @@ class ThreeIndexLinearModel(LinearModel):
 
         return constraints
 
+    @cached_property
+    def _arc_constraints(self) -> List[lp.LpConstraint]:
+        constraints = list()
+        for i, j in product(self._positions_indexer, self._positions_indexer):
+            if i == j or not self._infeasible_arc(i, j):
+                continue
+            constraints.extend(self._x[k][i][j] == 0 for k in self._routes_indexer)
+        return constraints
+
     def solve(self) -> Set[Route]:
         """Perform a optimization based on the linear model.
 
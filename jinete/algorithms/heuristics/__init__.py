@@ -1,12 +1,14 @@
 """Set of solving methods with reasonable space and time complexity."""
 
 from .insertion import (
+    BestInsertionStrategy,
     BestStatelessInsertionIterator,
     InsertionAlgorithm,
     InsertionIterator,
     InsertionStrategy,
     IntensiveInsertionStrategy,
     RankingInsertionIterator,
+    RegretInsertionIterator,
     SamplingInsertionStrategy,
     StatelessInsertionIterator,
     TailInsertionStrategy,
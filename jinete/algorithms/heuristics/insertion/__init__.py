@@ -7,9 +7,11 @@ from .iterators import (
     BestStatelessInsertionIterator,
     InsertionIterator,
     RankingInsertionIterator,
+    RegretInsertionIterator,
     StatelessInsertionIterator,
 )
 from .strategies import (
+    BestInsertionStrategy,
     InsertionStrategy,
     IntensiveInsertionStrategy,
     SamplingInsertionStrategy,
@@ -7,9 +7,6 @@ from typing import (
     TYPE_CHECKING,
 )
 
-from ....models import (
-    Planning,
-)
 from ...abc import (
     Algorithm,
 )
@@ -19,7 +16,7 @@ from .iterators import (
 
 if TYPE_CHECKING:
     from typing import Type
-    from ....models import Result
+    from ....models import Planning, Result
     from .iterators import InsertionIterator
 
 logger = logging.getLogger(__name__)
@@ -43,10 +40,10 @@ class InsertionAlgorithm(Algorithm):
     def _optimize(self) -> Planning:
         iterator = self._build_iterator()
 
-        for route in iterator:
-            if not route.feasible:
+        for candidate in iterator:
+            if not candidate.feasible:
                 break
+            route = candidate.materialize()
             iterator._set_route(route)
 
-        planning = Planning(iterator._routes)
-        return planning
+        return iterator.planning
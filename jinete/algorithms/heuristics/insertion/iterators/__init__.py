@@ -6,6 +6,9 @@ from .abc import (
 from .ranking import (
     RankingInsertionIterator,
 )
+from .regret import (
+    RegretInsertionIterator,
+)
 from .stateless import (
     BestStatelessInsertionIterator,
     StatelessInsertionIterator,
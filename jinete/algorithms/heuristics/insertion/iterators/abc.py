@@ -19,6 +19,7 @@ from cached_property import (
 )
 
 from .....models import (
+    Planning,
     Route,
 )
 
@@ -27,8 +28,11 @@ if TYPE_CHECKING:
         Set,
         Type,
         Dict,
+        Iterable,
+        List,
     )
     from .....models import (
+        InsertionCandidate,
         PlannedTrip,
         Vehicle,
         Fleet,
@@ -45,7 +49,7 @@ class InsertionIterator(ABC):
     fleet: Fleet
     job: Job
     criterion_cls: Type[RouteCriterion]
-    routes_container: Dict[Vehicle, Route]
+    planning: Planning
 
     def __init__(
         self,
@@ -68,7 +72,7 @@ class InsertionIterator(ABC):
 
         pending_trips = set(job.trips)
         if routes is None:
-            routes = set(Route(vehicle) for vehicle in fleet.vehicles)
+            routes = [Route(vehicle) for vehicle in fleet.vehicles]
         else:
             routes = deepcopy(routes)
             for route in routes:
@@ -76,7 +80,7 @@ class InsertionIterator(ABC):
 
         self.fleet = fleet
         self.job = job
-        self.routes_container = {route.vehicle: route for route in routes}
+        self.planning = Planning(routes)
         self.__attractive_routes = None
         self.pending_trips = pending_trips
 
@@ -86,9 +90,13 @@ class InsertionIterator(ABC):
         self.args = args
         self.kwargs = kwargs
 
+    @property
+    def routes_container(self) -> Dict[Vehicle, Route]:
+        return self.planning.vehicle_routes
+
     @property
     def _routes(self) -> Set[Route]:
-        return set(self.routes_container.values())
+        return self.planning.routes
 
     @property
     def _attractive_routes(self) -> Set[Route]:
@@ -96,7 +104,11 @@ class InsertionIterator(ABC):
             self.__attractive_routes = set(route for route in self._routes if any(route.planned_trips))
 
         if not any(any(route.planned_trips) for route in self.__attractive_routes):
-            empty_route = next((route for route in self._routes if not any(route.planned_trips)), None)
+            empty_route = min(
+                (route for route in self.routes_container.values() if not any(route.planned_trips)),
+                key=lambda route: str(route.vehicle_identifier),
+                default=None,
+            )
             if empty_route is not None:
                 self.__attractive_routes.add(empty_route)
         return self.__attractive_routes
@@ -104,11 +116,11 @@ class InsertionIterator(ABC):
     def _set_route(self, route: Route) -> None:
         vehicle = route.vehicle
         logger.debug(f'Updating route for vehicle with "{vehicle.identifier}" identifier...')
-        old_trips = set(self.routes_container[vehicle].trips)
-        self.routes_container[vehicle] = route
-        for planned_trip in route.planned_trips:
-            if planned_trip.trip in old_trips:
-                continue
+        planned_trips = [
+            planned_trip for planned_trip in route.planned_trips if not self.planning.contains_trip(planned_trip.trip)
+        ]
+        self.planning.set_route(route)
+        for planned_trip in planned_trips:
             self._mark_planned_trip_as_done(planned_trip)
 
     @cached_property
@@ -127,11 +139,15 @@ class InsertionIterator(ABC):
     def _trips(self) -> Set[Trip]:
         return self.job.trips
 
+    def _compatible_trips(self, route: Route, trips: Iterable[Trip]) -> List[Trip]:
+        graph = self.job.compatibility_graph
+        return [trip for trip in trips if graph.compatible_with(trip, route)]
+
     def __iter__(self):
         return self
 
     @abstractmethod
-    def __next__(self) -> Route:
+    def __next__(self) -> InsertionCandidate:
         pass
 
     def _mark_planned_trip_as_done(self, planned_trip: PlannedTrip) -> None:
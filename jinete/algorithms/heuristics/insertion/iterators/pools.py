@@ -0,0 +1,319 @@
+"""
+Contains the pool of worker processes used by the insertion iterators to evaluate the insertions in parallel.
+"""
+
+from __future__ import (
+    annotations,
+)
+
+import logging
+import weakref
+from concurrent.futures import (
+    ProcessPoolExecutor,
+)
+from typing import (
+    TYPE_CHECKING,
+)
+
+from .....models import (
+    InsertionCandidate,
+    PlannedTrip,
+    Route,
+    Stop,
+)
+
+if TYPE_CHECKING:
+    from typing import (
+        Any,
+        Dict,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Sequence,
+        Tuple,
+        Type,
+    )
+    from .....models import RouteCriterion, Trip, Vehicle
+    from ..strategies import InsertionStrategy
+
+    RouteRecord = Tuple[int, Tuple[Tuple[Optional[float], Tuple[int, ...], Tuple[int, ...]], ...]]
+    CandidateRecord = Tuple[int, int, int, int, float, bool]
+
+logger = logging.getLogger(__name__)
+
+_WORKER_STATE = None
+
+
+def _initialize_worker(
+    trips: Tuple[Trip, ...],
+    vehicles: Tuple[Vehicle, ...],
+    strategy_cls: Type[InsertionStrategy],
+    criterion_cls: Type[RouteCriterion],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = (trips, vehicles, strategy_cls, criterion_cls(*args, **kwargs), args, kwargs)
+
+
+def _build_route(record: RouteRecord, trips: Sequence[Trip], vehicles: Sequence[Vehicle]) -> Route:
+    vehicle_idx, stop_records = record
+    vehicle = vehicles[vehicle_idx]
+
+    planned_trips = dict()
+    stops = list()
+    for idx, (starting_time, pickups, deliveries) in enumerate(stop_records):
+        if idx == 0:
+            position = vehicle.origin_position
+        elif idx == len(stop_records) - 1:
+            position = vehicle.destination_position
+        elif pickups:
+            position = trips[pickups[0]].origin_position
+        else:
+            position = trips[deliveries[0]].destination_position
+
+        stop = Stop(vehicle, position, stops[-1] if stops else None, starting_time=starting_time)
+        for trip_idx in pickups:
+            planned_trips[trip_idx] = PlannedTrip(vehicle, trips[trip_idx], pickup=stop)
+        for trip_idx in deliveries:
+            planned_trip = planned_trips[trip_idx]
+            planned_trip.delivery = stop
+            stop.append_delivery(planned_trip)
+        stops.append(stop)
+
+    return Route(vehicle, stops)
+
+
+def _build_strategy(
+    strategy_cls: Type[InsertionStrategy], args: Tuple[Any, ...], kwargs: Dict[str, Any], seed: int
+) -> InsertionStrategy:
+    return strategy_cls(*args, **{**kwargs, "seed": seed})
+
+
+def _records(
+    candidates: Iterable[InsertionCandidate], trip_indices: Dict[Trip, int], vehicle_indices: Dict[Vehicle, int]
+) -> List[CandidateRecord]:
+    return [
+        (
+            vehicle_indices[candidate.vehicle],
+            trip_indices[candidate.trip],
+            candidate.previous_idx,
+            candidate.following_idx,
+            candidate.scoring,
+            candidate.feasible,
+        )
+        for candidate in candidates
+    ]
+
+
+def rank(
+    route: Route, trips: Iterable[Trip], strategy: InsertionStrategy, criterion: RouteCriterion
+) -> List[InsertionCandidate]:
+    """
+    Computes the insertion candidates of the given trips into a route, sorted by the criterion.
+
+    :param route: The route in which the trips are inserted.
+    :param trips: The trips to be inserted.
+    :param strategy: The strategy used to generate the candidates.
+    :param criterion: The criterion used to sort the candidates.
+    :return: A sorted list of candidates.
+    """
+    sub_ranking = strategy.compute(route, trips, criterion=criterion)
+    criterion.sorted(sub_ranking, inplace=True)
+    return sub_ranking
+
+
+def _compute_sub_ranking(route_record: RouteRecord, trip_indices: List[int], seed: int) -> List[CandidateRecord]:
+    trips, vehicles, strategy_cls, criterion, args, kwargs = _WORKER_STATE
+    route = _build_route(route_record, trips, vehicles)
+    strategy = _build_strategy(strategy_cls, args, kwargs, seed)
+
+    indices = {trips[idx]: idx for idx in trip_indices}
+    sub_ranking = rank(route, indices.keys(), strategy, criterion)
+    return _records(sub_ranking, indices, {route.vehicle: route_record[0]})
+
+
+def _compute_nbest(
+    route_records: List[RouteRecord], pairs: List[Tuple[int, int]], n: int, seed: int
+) -> List[CandidateRecord]:
+    trips, vehicles, strategy_cls, criterion, args, kwargs = _WORKER_STATE
+    routes = {record[0]: _build_route(record, trips, vehicles) for record in route_records}
+    strategy = _build_strategy(strategy_cls, args, kwargs, seed)
+
+    candidates = (
+        candidate
+        for vehicle_idx, trip_idx in pairs
+        for candidate in strategy.compute(routes[vehicle_idx], trips[trip_idx], criterion=criterion)
+    )
+    best = criterion.nbest(n, candidates)
+    trip_indices = {trips[trip_idx]: trip_idx for _, trip_idx in pairs}
+    vehicle_indices = {route.vehicle: vehicle_idx for vehicle_idx, route in routes.items()}
+    return _records(best, trip_indices, vehicle_indices)
+
+
+class WorkerPool(object):
+    """
+    Evaluates insertion candidates over a pool of worker processes on behalf of an insertion iterator.
+
+    The trips and the vehicles (and so their surface) are sent to each worker only once, when it starts. Then, the
+    routes are sent as compact records (the starting time and the indices of the trips picked up and delivered on each
+    stop), and the candidates are received as compact records too, which are rebuilt over the iterator's routes. As
+    the workers build their own strategies, each task is given a seed, so its result does not depend on which worker
+    computes it.
+    """
+
+    __slots__ = (
+        "processes",
+        "trips",
+        "vehicles",
+        "strategy_cls",
+        "criterion_cls",
+        "args",
+        "kwargs",
+        "trip_indices",
+        "vehicle_indices",
+        "_executor",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        processes: int,
+        trips: Iterable[Trip],
+        vehicles: Iterable[Vehicle],
+        strategy_cls: Type[InsertionStrategy],
+        criterion_cls: Type[RouteCriterion],
+        args: Tuple[Any, ...] = tuple(),
+        kwargs: Dict[str, Any] = None,
+    ):
+        """
+        Constructor of the class.
+
+        :param processes: The number of worker processes.
+        :param trips: The trips which can be inserted.
+        :param vehicles: The vehicles whose routes are evaluated.
+        :param strategy_cls: The class of the insertion strategy built by the workers.
+        :param criterion_cls: The class of the route criterion built by the workers.
+        :param args: The positional arguments of the strategy and the criterion.
+        :param kwargs: The named arguments of the strategy and the criterion.
+        """
+        if kwargs is None:
+            kwargs = dict()
+
+        self.processes = processes
+        self.trips = tuple(trips)
+        self.vehicles = tuple(vehicles)
+        self.strategy_cls = strategy_cls
+        self.criterion_cls = criterion_cls
+        self.args = args
+        self.kwargs = kwargs
+
+        self.trip_indices = {trip: idx for idx, trip in enumerate(self.trips)}
+        self.vehicle_indices = {vehicle: idx for idx, vehicle in enumerate(self.vehicles)}
+
+        self._executor = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """
+        Retrieves the executor of the pool, which is started on the first access.
+
+        :return: A process pool executor.
+        """
+        if self._executor is None:
+            logger.info(f"Starting a pool of {self.processes} worker processes...")
+            self._executor = ProcessPoolExecutor(
+                self.processes,
+                initializer=_initialize_worker,
+                initargs=(self.trips, self.vehicles, self.strategy_cls, self.criterion_cls, self.args, self.kwargs),
+            )
+            weakref.finalize(self, self._executor.shutdown)
+        return self._executor
+
+    def strategy(self, seed: int) -> InsertionStrategy:
+        """
+        Builds a strategy as the workers do, to compute the tasks which are not worth sending to them.
+
+        :param seed: The seed of the strategy.
+        :return: An insertion strategy.
+        """
+        return _build_strategy(self.strategy_cls, self.args, self.kwargs, seed)
+
+    def route_record(self, route: Route) -> RouteRecord:
+        """
+        Encodes a route as a compact record to be sent to the workers.
+
+        :param route: The route to be encoded.
+        :return: A record which can be rebuilt by the workers.
+        """
+        stop_records = tuple(
+            (
+                stop._starting_time,
+                tuple(self.trip_indices[planned_trip.trip] for planned_trip in stop.pickup_planned_trips),
+                tuple(self.trip_indices[planned_trip.trip] for planned_trip in stop.delivery_planned_trips),
+            )
+            for stop in route.stops
+        )
+        return self.vehicle_indices[route.vehicle], stop_records
+
+    def candidates(
+        self, records: Iterable[CandidateRecord], routes: Dict[Vehicle, Route], strategy: InsertionStrategy
+    ) -> List[InsertionCandidate]:
+        """
+        Rebuilds the candidates received from the workers over the given routes.
+
+        :param records: The records of the candidates.
+        :param routes: The routes in which the candidates are inserted, by vehicle.
+        :param strategy: The strategy used to materialize the candidates.
+        :return: A list of candidates.
+        """
+        return [
+            InsertionCandidate(routes[self.vehicles[vehicle_idx]], self.trips[trip_idx], *values, strategy=strategy)
+            for vehicle_idx, trip_idx, *values in records
+        ]
+
+    def sub_rankings(
+        self, routes: List[Route], neighborhoods: List[List[Trip]], seeds: List[int]
+    ) -> Iterator[List[CandidateRecord]]:
+        """
+        Computes the sorted candidates of each route over its neighborhood, distributing the routes over the workers.
+
+        :param routes: The routes in which the trips are inserted.
+        :param neighborhoods: The trips to be inserted into each route.
+        :param seeds: The seed of the strategy of each route.
+        :return: The candidate records of each route, on the same order.
+        """
+        return self.executor.map(
+            _compute_sub_ranking,
+            [self.route_record(route) for route in routes],
+            [[self.trip_indices[trip] for trip in neighborhood] for neighborhood in neighborhoods],
+            seeds,
+            chunksize=max(len(routes) // self.processes, 1),
+        )
+
+    def nbest(
+        self, n: int, chunks: List[List[Tuple[Route, Trip]]], seeds: List[int]
+    ) -> Iterator[List[CandidateRecord]]:
+        """
+        Computes the ``n`` best candidates of each chunk of route and trip pairs, distributing the chunks over the
+        workers. Each chunk is sent along with the records of its own routes only.
+
+        :param n: The number of candidates of each chunk.
+        :param chunks: The pairs of route and trip to be evaluated on each chunk.
+        :param seeds: The seed of the strategy of each chunk.
+        :return: The candidate records of each chunk, on the same order.
+        """
+        route_records = dict()
+        chunk_routes, chunk_pairs = list(), list()
+        for chunk in chunks:
+            routes = dict()
+            for route, _ in chunk:
+                if route.vehicle not in route_records:
+                    route_records[route.vehicle] = self.route_record(route)
+                routes[route.vehicle] = route_records[route.vehicle]
+            chunk_routes.append(list(routes.values()))
+            chunk_pairs.append(
+                [(self.vehicle_indices[route.vehicle], self.trip_indices[trip]) for route, trip in chunk]
+            )
+        return self.executor.map(_compute_nbest, chunk_routes, chunk_pairs, [n] * len(chunks), seeds)
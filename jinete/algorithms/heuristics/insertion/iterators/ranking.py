@@ -2,8 +2,12 @@ from __future__ import (
     annotations,
 )
 
-import itertools as it
 import logging
+from heapq import (
+    heapify,
+    heappop,
+    heappush,
+)
 from random import (
     Random,
 )
@@ -11,24 +15,69 @@ from typing import (
     TYPE_CHECKING,
 )
 
+from .....models import (
+    OptimizationDirection,
+    TripIndex,
+)
 from .abc import (
     InsertionIterator,
 )
+from .pools import (
+    WorkerPool,
+    rank,
+)
 
 if TYPE_CHECKING:
     from typing import (
+        Any,
         Dict,
+        Iterable,
         List,
     )
-    from .....models import PlannedTrip, Route, Vehicle
+    from .....models import InsertionCandidate, PlannedTrip, Route, Trip, Vehicle
 
 logger = logging.getLogger(__name__)
 
 
 class RankingInsertionIterator(InsertionIterator):
-    ranking: Dict[Vehicle, List[Route]]
-
-    def __init__(self, neighborhood_max_size: int = 24, randomized_size: int = 1, seed: int = 56, *args, **kwargs):
+    """
+    Keeps a ranking of insertion candidates for each attractive route, which is only rebuilt for the route on which
+    the last candidate was inserted.
+
+    Each ranking is computed over a neighborhood of (at most ``neighborhood_max_size``) pending trips, chosen as the
+    ones which can be picked up sooner from the current end of the route through a spatio-temporal index.
+
+    All the rankings are merged on a single heap keyed by the criterion's scoring. Each entry is stamped with the
+    version of its vehicle's ranking, so the entries of a rebuilt ranking are not removed eagerly, but discarded when
+    they reach the top of the heap. The entries are also indexed by their trip, so the ones of a trip which is
+    already done are invalidated exactly once it is marked as done, without scanning the other rankings. Ties are
+    broken by the order in which the vehicles were first ranked and then by the position on their own ranking. The
+    heap is compacted once the stale entries outnumber the live ones.
+
+    If ``processes`` is greater than one, the sub-rankings of several vehicles which must be computed at once (as on
+    the initialization) are distributed over a pool of worker processes, which receive the trips and the vehicles
+    (and so their surface) only once, and then exchange compact records of the routes and the candidates. On this
+    mode, each sub-ranking is computed by its own strategy, seeded from ``seed`` in the vehicles' identifier order,
+    so the results are deterministic and do not depend on the number of processes (although they differ from the
+    ones of the sequential mode, on which all the sub-rankings share a single strategy).
+    """
+
+    ranking: List[List[Any]]
+    pending_index: TripIndex
+    candidates: Dict[Trip, List[List[Any]]]
+    _versions: Dict[Vehicle, int]
+    _sizes: Dict[Vehicle, int]
+    _orders: Dict[Vehicle, int]
+
+    def __init__(
+        self,
+        neighborhood_max_size: int = 24,
+        randomized_size: int = 1,
+        seed: int = 56,
+        processes: int = 1,
+        *args,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
 
         if neighborhood_max_size is None:
@@ -39,66 +88,148 @@ class RankingInsertionIterator(InsertionIterator):
         self.randomized_size = randomized_size
         self.random = Random(seed)
 
-        self.ranking = dict()
+        self.pending_index = TripIndex(self.pending_trips)
+
+        self.processes = processes
+        self._seeds = Random(seed)
+        self._pool = None
+        if processes > 1:
+            self._pool = WorkerPool(
+                processes,
+                self._trips,
+                self.routes_container,
+                self.strategy_cls,
+                self.criterion_cls,
+                self.args,
+                self.kwargs,
+            )
+
+        self.ranking = list()
+        self.candidates = dict()
+        self._versions = dict()
+        self._sizes = dict()
+        self._orders = dict()
         self._initialize_ranking()
 
     def _initialize_ranking(self) -> None:
         logger.info("Initializing ranking...")
-        for route in self._attractive_routes:
-            self.ranking[route.vehicle] = self._create_sub_ranking(route)
-            logger.info(f"Added sub ranking! Currently {len(self.ranking)}.")
+        self._push_sub_rankings(self._attractive_routes)
+        logger.info(f"Added sub rankings! Currently {len(self._versions)}.")
 
     def _mark_planned_trip_as_done(self, planned_trip: PlannedTrip) -> None:
         super()._mark_planned_trip_as_done(planned_trip)
         self._update_ranking(planned_trip)
 
+    def _mark_trip_as_done(self, trip: Trip) -> None:
+        super()._mark_trip_as_done(trip)
+        self.pending_index.remove(trip)
+        self._invalidate_candidates(trip)
+
+    def _invalidate_candidates(self, trip: Trip) -> None:
+        for entry in self.candidates.pop(trip, ()):
+            candidate = entry[-1]
+            if candidate is None:
+                continue
+            if self._versions[candidate.vehicle] == entry[-2]:
+                self._sizes[candidate.vehicle] -= 1
+            entry[-1] = None
+
     def _update_ranking(self, planned_trip: PlannedTrip) -> None:
         logger.debug(f'Updating all rankings due to planned trip with "{planned_trip.trip_identifier}" trip...')
+        routes = list()
         for route in self._attractive_routes:
-            self._update_vehicle_ranking(planned_trip, route.vehicle)
-
-    def _update_vehicle_ranking(self, planned_trip: PlannedTrip, vehicle: Vehicle):
-        logger.debug(f'Updating ranking for vehicle with "{vehicle.identifier}" identifier...')
-        if vehicle is planned_trip.vehicle or vehicle not in self.ranking:
-            self.ranking[vehicle] = self._create_sub_ranking(self.routes_container[vehicle])
+            vehicle = route.vehicle
+            if vehicle is planned_trip.vehicle or vehicle not in self._versions:
+                logger.debug(f'Updating ranking for vehicle with "{vehicle.identifier}" identifier...')
+                routes.append(self.routes_container[vehicle])
+        self._push_sub_rankings(routes)
+
+        if sum(self._sizes.values()) < len(self.ranking) // 2:
+            self._compact_ranking()
+
+    def _push_sub_rankings(self, routes: Iterable[Route]) -> None:
+        if self._pool is not None:
+            routes = sorted(routes, key=lambda route: str(route.vehicle_identifier))
+            sub_rankings = self._compute_sub_rankings(routes)
         else:
-            self.ranking[vehicle] = [route for route in self.ranking[vehicle] if planned_trip.trip not in route.trips]
+            sub_rankings = (self._create_sub_ranking(route) for route in routes)
+
+        for route, sub_ranking in zip(routes, sub_rankings):
+            self._push_sub_ranking(route, sub_ranking)
+
+    def _push_sub_ranking(self, route: Route, sub_ranking: List[InsertionCandidate]) -> None:
+        vehicle = route.vehicle
+        version = self._versions.get(vehicle, -1) + 1
+        self._versions[vehicle] = version
+
+        order = self._orders.setdefault(vehicle, len(self._orders))
+
+        self._sizes[vehicle] = len(sub_ranking)
+        for position, candidate in enumerate(sub_ranking):
+            entry = [self._key(candidate), order, position, version, candidate]
+            self.candidates.setdefault(candidate.trip, list()).append(entry)
+            heappush(self.ranking, entry)
+
+    def _compact_ranking(self) -> None:
+        logger.debug("Compacting ranking...")
+        self.ranking = [entry for entry in self.ranking if self._alive(entry)]
+        heapify(self.ranking)
+
+        self.candidates = dict()
+        for entry in self.ranking:
+            self.candidates.setdefault(entry[-1].trip, list()).append(entry)
+
+    def _key(self, candidate: InsertionCandidate) -> float:
+        scoring = self._criterion._scoring(candidate)
+        if self._criterion.direction == OptimizationDirection.MAXIMIZATION:
+            return -scoring
+        return scoring
+
+    def _alive(self, entry: List[Any]) -> bool:
+        *_, version, candidate = entry
+        return candidate is not None and self._versions[candidate.vehicle] == version
+
+    def _neighborhood(self, route: Route) -> List[Trip]:
+        if len(self.pending_trips) <= self.neighborhood_max_size:
+            pending_trips = self.pending_trips
+        else:
+            pending_trips = self.pending_index.nearest(
+                route.current_position, route.current_departure_time, self.neighborhood_max_size,
+            )
+        return self._compatible_trips(route, pending_trips)
 
-    def _create_sub_ranking(self, route: Route) -> List[Route]:
+    def _create_sub_ranking(self, route: Route) -> List[InsertionCandidate]:
         logger.debug(f'Creating sub_ranking for vehicle "{route.vehicle_identifier}"...')
-        pending_trips = it.islice(self.pending_trips, self.neighborhood_max_size)
-
-        raw_sub_ranking = self._strategy.compute(route, pending_trips)
-
-        self._criterion.sorted(raw_sub_ranking, inplace=True)
-
-        return raw_sub_ranking
-
-    def __next__(self) -> Route:
-        if not any(self.ranking):
+        return rank(route, self._neighborhood(route), self._strategy, self._criterion)
+
+    def _compute_sub_rankings(self, routes: List[Route]) -> List[List[InsertionCandidate]]:
+        seeds = [self._seeds.getrandbits(32) for _ in routes]
+        neighborhoods = [self._neighborhood(route) for route in routes]
+
+        if len(routes) < 2:
+            return [
+                rank(route, neighborhood, self._pool.strategy(seed), self._criterion)
+                for route, neighborhood, seed in zip(routes, neighborhoods, seeds)
+            ]
+
+        records = self._pool.sub_rankings(routes, neighborhoods, seeds)
+        return [
+            self._pool.candidates(sub_ranking, {route.vehicle: route}, self._strategy)
+            for route, sub_ranking in zip(routes, records)
+        ]
+
+    def __next__(self) -> InsertionCandidate:
+        entries = list()
+        while self.ranking and len(entries) < self.randomized_size:
+            entry = heappop(self.ranking)
+            if self._alive(entry):
+                entries.append(entry)
+
+        if not any(entries):
             raise StopIteration
 
-        candidates = list()
-        for sub_ranking in self.ranking.values():
-            if not any(sub_ranking):
-                continue
-
-            for current in sub_ranking:
-                if (
-                    len(candidates) == self.randomized_size
-                    and self._criterion.best(candidates[-1], current) == candidates[-1]
-                ):
-                    break
-
-                if self.randomized_size <= len(candidates):
-                    candidates.pop()
-
-                candidates.append(current)
-
-            self._criterion.sorted(candidates, inplace=True)
-
-        if not any(candidates):
-            raise StopIteration
+        for entry in entries:
+            heappush(self.ranking, entry)
 
-        best = self.random.choice(candidates)
+        best = self.random.choice([candidate for *_, candidate in entries])
         return best
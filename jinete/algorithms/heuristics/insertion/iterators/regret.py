@@ -0,0 +1,169 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+from heapq import (
+    nsmallest,
+)
+from random import (
+    Random,
+)
+from typing import (
+    TYPE_CHECKING,
+)
+
+from .....models import (
+    MAX_FLOAT,
+    OptimizationDirection,
+    TripIndex,
+)
+from .abc import (
+    InsertionIterator,
+)
+
+if TYPE_CHECKING:
+    from typing import (
+        Dict,
+        Optional,
+        Set,
+        Tuple,
+    )
+    from .....models import InsertionCandidate, PlannedTrip, Route, Trip, Vehicle
+
+logger = logging.getLogger(__name__)
+
+
+class RegretInsertionIterator(InsertionIterator):
+    """
+    Inserts first the pending trip with the highest regret, this is, the one which loses the most if it is not
+    inserted now on its best route (Ropke & Pisinger, 2006).
+
+    The insertion cost of a trip on a route is the increase of the criterion's scoring over the one of the route
+    without the trip, and its regret is the sum of the gaps between the cost of its best route insertion and the
+    costs of the following ``regret_size - 1`` ones. The trips which have fewer feasible routes than ``regret_size``
+    are considered to have an infinite regret (so they are inserted first), and the ties are broken by the cost of the
+    best insertion.
+
+    The empty routes are opened one by one, and the cost of inserting a trip on an empty route also includes the idle
+    time of the vehicle before serving it. Then, with a regret over only two routes, the regret of the late trips is
+    the idle time of the last opened route, so they are packed first into the busy ones and the remaining trips run
+    out of feasible routes. With the default ``regret_size`` of three, the trips are inserted in increasing cost order
+    until they have enough feasible routes, which serves as many trips as the absolute scorings on most of the
+    Cordeau-Laporte instances (and more on some of the largest ones), over shorter routes.
+
+    If ``absolute`` is set, the absolute scorings of the insertions are compared instead (as the other iterators rank
+    the candidates), so the regret also measures how loaded the routes already are.
+
+    The best insertion of each pending trip on each attractive route is cached, so after each insertion only the
+    ones of the modified route are recomputed. By default they are computed over all the pending trips, but (as in
+    the ``RankingInsertionIterator``) they can be restricted to a neighborhood of at most ``neighborhood_max_size``
+    pending trips, chosen as the ones which can be picked up sooner from the current end of the route. Then, the
+    trips which are out of every neighborhood have no cached insertion and wait until some route gets close to them.
+    """
+
+    insertions: Dict[Trip, Dict[Vehicle, InsertionCandidate]]
+    pending_index: TripIndex
+    _ranked_vehicles: Set[Vehicle]
+    _base_scorings: Dict[Vehicle, float]
+
+    def __init__(
+        self,
+        regret_size: int = 3,
+        neighborhood_max_size: Optional[int] = None,
+        randomized_size: int = 1,
+        seed: int = 56,
+        absolute: bool = False,
+        *args,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+
+        self.regret_size = regret_size
+        self.absolute = absolute
+
+        if neighborhood_max_size is None:
+            neighborhood_max_size = len(self._trips)
+
+        self.neighborhood_max_size = min(neighborhood_max_size, len(self._trips))
+
+        self.randomized_size = randomized_size
+        self.random = Random(seed)
+
+        self.pending_index = TripIndex(self.pending_trips)
+
+        self.insertions = {trip: dict() for trip in self.pending_trips}
+        self._ranked_vehicles = set()
+        self._base_scorings = dict()
+        self._initialize_insertions()
+
+    def _initialize_insertions(self) -> None:
+        logger.info("Initializing insertions...")
+        for route in self._attractive_routes:
+            self._update_route_insertions(self.routes_container[route.vehicle])
+
+    def _mark_planned_trip_as_done(self, planned_trip: PlannedTrip) -> None:
+        super()._mark_planned_trip_as_done(planned_trip)
+        self._update_insertions(planned_trip)
+
+    def _mark_trip_as_done(self, trip: Trip) -> None:
+        super()._mark_trip_as_done(trip)
+        self.pending_index.remove(trip)
+        self.insertions.pop(trip, None)
+
+    def _update_insertions(self, planned_trip: PlannedTrip) -> None:
+        logger.debug(f'Updating insertions due to planned trip with "{planned_trip.trip_identifier}" trip...')
+        for route in self._attractive_routes:
+            vehicle = route.vehicle
+            if vehicle is planned_trip.vehicle or vehicle not in self._ranked_vehicles:
+                self._update_route_insertions(self.routes_container[vehicle])
+
+    def _update_route_insertions(self, route: Route) -> None:
+        vehicle = route.vehicle
+        logger.debug(f'Updating insertions for vehicle with "{vehicle.identifier}" identifier...')
+        self._ranked_vehicles.add(vehicle)
+        self._base_scorings[vehicle] = self._criterion.scoring(route)
+
+        for insertions in self.insertions.values():
+            insertions.pop(vehicle, None)
+
+        if len(self.pending_trips) <= self.neighborhood_max_size:
+            pending_trips = self.pending_trips
+        else:
+            pending_trips = self.pending_index.nearest(
+                route.current_position, route.current_departure_time, self.neighborhood_max_size,
+            )
+        pending_trips = self._compatible_trips(route, pending_trips)
+        for candidate in self._strategy.compute(route, pending_trips, criterion=self._criterion):
+            if not candidate.feasible:
+                continue
+            insertions = self.insertions[candidate.trip]
+            insertions[vehicle] = self._criterion.best(insertions.get(vehicle), candidate)
+
+    def _cost(self, candidate: InsertionCandidate) -> float:
+        scoring = self._criterion._scoring(candidate)
+        if not self.absolute:
+            scoring -= self._base_scorings[candidate.vehicle]
+        if self._criterion.direction == OptimizationDirection.MAXIMIZATION:
+            return -scoring
+        return scoring
+
+    def _priority(self, trip: Trip) -> Tuple[float, float, InsertionCandidate]:
+        insertions = sorted(self.insertions[trip].values(), key=self._cost)
+        best = insertions[0]
+        best_cost = self._cost(best)
+        if len(insertions) < self.regret_size:
+            regret = MAX_FLOAT
+        else:
+            regret = sum(self._cost(insertion) - best_cost for insertion in insertions[1 : self.regret_size])
+        return -regret, best_cost, best
+
+    def __next__(self) -> InsertionCandidate:
+        priorities = (self._priority(trip) for trip, insertions in self.insertions.items() if any(insertions))
+        candidates = [candidate for *_, candidate in nsmallest(self.randomized_size, priorities, key=lambda p: p[:2])]
+
+        if not any(candidates):
+            raise StopIteration
+
+        best = self.random.choice(candidates)
+        return best
@@ -18,11 +18,17 @@ from cached_property import (
 from .abc import (
     InsertionIterator,
 )
+from .pools import (
+    WorkerPool,
+)
 
 if TYPE_CHECKING:
-    from typing import Iterator
+    from typing import (
+        Iterator,
+        List,
+    )
     from .....models import (
-        Route,
+        InsertionCandidate,
         Trip,
     )
 
@@ -31,12 +37,16 @@ logger = logging.getLogger(__name__)
 
 class StatelessInsertionIterator(InsertionIterator):
     @cached_property
-    def iterator(self) -> Iterator[Route]:
-        for route, trip in it.product(self._attractive_routes, self.pending_trips):
+    def iterator(self) -> Iterator[InsertionCandidate]:
+        graph = self.job.compatibility_graph
+        routes = [self.routes_container[route.vehicle] for route in self._attractive_routes]
+        for route, trip in it.product(routes, self.pending_trips):
+            if not graph.compatible_with(trip, route):
+                continue
             logger.debug(f"Yielding ({route}, {trip})...")
-            yield from self._strategy.compute(route, trip)
+            yield from self._strategy.compute(route, trip, criterion=self._criterion)
 
-    def __next__(self) -> Route:
+    def __next__(self) -> InsertionCandidate:
         return next(self.iterator)
 
     def _mark_trip_as_done(self, trip: Trip):
@@ -49,13 +59,60 @@ class StatelessInsertionIterator(InsertionIterator):
 
 
 class BestStatelessInsertionIterator(StatelessInsertionIterator):
-    def __init__(self, randomized_size: int = 1, seed: int = 56, *args, **kwargs):
+    """
+    Chooses the next insertion randomly among the ``randomized_size`` best candidates of all the attractive routes
+    and pending trips.
+
+    The candidates are streamed into the criterion's bounded heap, so only the best ``randomized_size`` ones are held
+    at once. If ``processes`` is greater than one, the compatible pairs of route and trip are split into chunks of
+    ``chunk_size`` pairs, whose best candidates are computed by a pool of worker processes and then merged. On this
+    mode, each chunk is evaluated by its own strategy, seeded from ``seed``, and the chunks are built in the
+    vehicles' identifier order, so the results are deterministic and do not depend on the number of processes
+    (although the ties may be broken differently than on the sequential mode).
+    """
+
+    def __init__(
+        self, randomized_size: int = 1, seed: int = 56, processes: int = 1, chunk_size: int = 256, *args, **kwargs
+    ):
         super().__init__(*args, **kwargs)
         self.randomized_size = randomized_size
         self.random = Random(seed)
 
-    def __next__(self) -> Route:
-        candidates = self._criterion.nbest(self.randomized_size, *self.iterator)
+        self.processes = processes
+        self.chunk_size = chunk_size
+        self._seeds = Random(seed)
+        self._pool = None
+        if processes > 1:
+            self._pool = WorkerPool(
+                processes,
+                self._trips,
+                self.routes_container,
+                self.strategy_cls,
+                self.criterion_cls,
+                self.args,
+                self.kwargs,
+            )
+
+    def _compute_nbest(self) -> List[InsertionCandidate]:
+        routes = sorted(
+            (self.routes_container[route.vehicle] for route in self._attractive_routes),
+            key=lambda route: str(route.vehicle_identifier),
+        )
+        pending_trips = [trip for trip in self._pool.trips if trip in self.pending_trips]
+        pairs = [(route, trip) for route in routes for trip in self._compatible_trips(route, pending_trips)]
+
+        chunks = [pairs[idx : idx + self.chunk_size] for idx in range(0, len(pairs), self.chunk_size)]
+        seeds = [self._seeds.getrandbits(32) for _ in chunks]
+        records = it.chain.from_iterable(self._pool.nbest(self.randomized_size, chunks, seeds))
+
+        candidates = self._pool.candidates(records, {route.vehicle: route for route in routes}, self._strategy)
+        return self._criterion.nbest(self.randomized_size, candidates)
+
+    def __next__(self) -> InsertionCandidate:
+        if self._pool is not None:
+            candidates = self._compute_nbest()
+        else:
+            candidates = self._criterion.nbest(self.randomized_size, self.iterator)
 
         if not any(candidates):
             raise StopIteration
@@ -3,6 +3,9 @@
 from .abc import (
     InsertionStrategy,
 )
+from .best import (
+    BestInsertionStrategy,
+)
 from .intensive import (
     IntensiveInsertionStrategy,
 )
@@ -11,6 +11,8 @@ from typing import (
 )
 
 from .....models import (
+    ConjecturedRoute,
+    InsertionCandidate,
     PlannedTrip,
     RouteCloner,
     Stop,
@@ -23,7 +25,10 @@ if TYPE_CHECKING:
         List,
         Union,
     )
-    from .....models import Route
+    from .....models import (
+        Route,
+        RouteCriterion,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -39,9 +44,10 @@ class InsertionStrategy(object):
         previous_idx: int = None,
         following_idx: int = None,
         only_feasible: bool = None,
+        criterion: RouteCriterion = None,
         *args,
         **kwargs
-    ) -> List[Route]:
+    ) -> Union[List[Route], List[InsertionCandidate]]:
         assert previous_idx < following_idx
 
         if only_feasible is None:
@@ -50,10 +56,46 @@ class InsertionStrategy(object):
         if isinstance(trips, Trip):
             trips = [trips]
 
+        if only_feasible:
+            trips = (trip for trip in trips if route.feasible_insertion(trip, previous_idx, following_idx))
+
+        if criterion is not None:
+            candidates = (
+                self._compute_candidate(route, trip, previous_idx, following_idx, criterion, *args, **kwargs)
+                for trip in trips
+            )
+            return [c for c in candidates if not only_feasible or c.feasible]
+
         routes = (self._compute_one(route, trip, previous_idx, following_idx, *args, **kwargs) for trip in trips)
         routes = [r for r in routes if not only_feasible or r.feasible]
         return routes
 
+    def materialize(self, candidate: InsertionCandidate) -> Route:
+        route = self._compute_one(candidate.route, candidate.trip, candidate.previous_idx, candidate.following_idx)
+        route.schedule.bind()
+        return route
+
+    def _compute_candidate(
+        self,
+        route: Route,
+        trip: Trip,
+        previous_idx: int,
+        following_idx: int,
+        criterion: RouteCriterion,
+        *args,
+        **kwargs
+    ) -> InsertionCandidate:
+        conjectured_route = ConjecturedRoute(route, trip, previous_idx, following_idx, self)
+        return InsertionCandidate(
+            route,
+            trip,
+            previous_idx,
+            following_idx,
+            criterion.scoring(conjectured_route),
+            conjectured_route.feasible,
+            self,
+        )
+
     def _compute_one(self, route: Route, trip: Trip, previous_idx: int, following_idx: int, *args, **kwargs) -> Route:
         cloner = RouteCloner(route, previous_idx + 1)
         route = cloner.clone()
@@ -68,9 +110,9 @@ class InsertionStrategy(object):
         return route
 
     def _improve_ride_times(self, route: Route, idx: int) -> None:
-        if route.stops[1].waiting_time != 0:
-            route.stops[0].starting_time = route.stops[1].waiting_time
-            route.stops[0].flush(), route.stops[1].flush()
+        if idx == 0 and route.stops[1].waiting_time != 0:
+            first = route.stops[0]
+            first.starting_time = first.starting_time + route.stops[1].waiting_time
 
         if route.feasible:
             return
@@ -83,10 +125,6 @@ class InsertionStrategy(object):
 
             stop.starting_time += max(planned_trip.duration - planned_trip.timeout, 0)
 
-            for s in route.stops[i:]:
-                s.flush()
-
-        route.flush()
         if route.feasible:
             # print(f'feasible!')
             pass
@@ -0,0 +1,315 @@
+from __future__ import (
+    annotations,
+)
+
+import itertools as it
+import logging
+from bisect import (
+    bisect_right,
+)
+from heapq import (
+    heapify,
+    heappop,
+    heappush,
+)
+from typing import (
+    TYPE_CHECKING,
+)
+
+from .....models import (
+    ERROR_BOUND,
+    MAX_FLOAT,
+    Trip,
+)
+from .abc import (
+    InsertionStrategy,
+)
+
+if TYPE_CHECKING:
+    from typing import (
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Tuple,
+        Union,
+    )
+    from .....models import Route
+
+logger = logging.getLogger(__name__)
+
+
+class BestInsertionStrategy(InsertionStrategy):
+    """
+    Inserts each trip on the feasible pickup and delivery positions which minimize the travelled distance increase.
+
+    The position pairs which pass the time window and capacity checks (performed over the forward time slacks,
+    cumulative waiting times and loads of the route's schedule) are ranked by their cost, and then they are evaluated
+    in increasing cost order only until one of them is feasible, so the result is the best insertion.
+
+    The pairs are found with a single sweep over the delivery positions, in which the pickup positions are kept as a
+    Pareto frontier between their distance increase and the delay that they push forward. If the trip or the trips of
+    the route have a bounded ride time, the frontier also keeps the departure time from each pickup (as a later one
+    shortens the ride time of the trip), and a pickup only dominates the other ones if the delay that it pushes does not
+    exceed the remaining ride time slack of the trips that are picked up before it and delivered after it. The ride
+    times are also checked (as necessary conditions) over the travelling and loading times between both positions.
+
+    On time dependent surfaces the pushed delays are not preserved along the route, so all the pairs are checked. The
+    sweep only considers the pickups on the frontier, but it is still quadratic on the worst case (when all of them
+    remain on the frontier), as is the full check.
+    """
+
+    def compute(self, route: Route, trips: Union[Trip, Iterable[Trip]], *args, **kwargs) -> List[Route]:
+        if isinstance(trips, Trip):
+            trips = [trips]
+
+        routes = list()
+        for trip in trips:
+            for previous_idx, following_idx in self._ranked_positions(route, trip):
+                conjectured_routes = super().compute(route, trip, previous_idx, following_idx, *args, **kwargs)
+                if not any(conjectured_routes):
+                    continue
+                routes += conjectured_routes
+                break
+        return routes
+
+    def _ranked_positions(self, route: Route, trip: Trip) -> Iterator[Tuple[int, int]]:
+        if trip.origin_position.surface.time_dependent:
+            ranking = self._checked_positions(route, trip)
+        else:
+            ranking = self._swept_positions(route, trip)
+
+        heapify(ranking)
+        while ranking:
+            _, previous_idx, following_idx = heappop(ranking)
+            yield previous_idx, following_idx
+
+    @staticmethod
+    def _checked_positions(route: Route, trip: Trip) -> List[Tuple[float, int, int]]:
+        schedule = route.schedule
+        positions = schedule.positions
+        origin, destination = trip.origin_position, trip.destination_position
+
+        pickup_costs, delivery_costs = list(), list()
+        for previous_position, following_position in zip(positions[:-1], positions[1:]):
+            distance = previous_position.distance_to(following_position)
+            pickup_costs.append(
+                previous_position.distance_to(origin) + origin.distance_to(following_position) - distance
+            )
+            delivery_costs.append(
+                previous_position.distance_to(destination) + destination.distance_to(following_position) - distance
+            )
+        direct_distance = origin.distance_to(destination)
+
+        ranking = list()
+        for previous_idx, following_idx in it.combinations(range(len(positions)), 2):
+            if not schedule.feasible_insertion(trip, previous_idx, following_idx):
+                continue
+            if previous_idx + 1 == following_idx:
+                cost = positions[previous_idx].distance_to(origin) + direct_distance
+                cost += destination.distance_to(positions[following_idx])
+                cost -= positions[previous_idx].distance_to(positions[following_idx])
+            else:
+                cost = pickup_costs[previous_idx] + delivery_costs[following_idx - 1]
+            ranking.append((cost, previous_idx, following_idx))
+        return ranking
+
+    def _swept_positions(self, route: Route, trip: Trip) -> List[Tuple[float, int, int]]:
+        schedule = route.schedule
+        positions, capacities = schedule.positions, schedule.capacities
+        starting_times, departure_times = schedule.starting_times, schedule.departure_times
+        forward_slacks, waiting_times = schedule.forward_slacks, schedule.cumulative_waiting_times
+
+        origin, destination = trip.origin_position, trip.destination_position
+        capacity_limit = route.vehicle.capacity - trip.capacity + ERROR_BOUND
+        timeout = trip.timeout
+
+        busy_slacks, delay_bounds, last_pickups = self._crossing_slacks(route)
+        bounded = timeout < MAX_FLOAT or last_pickups is not None
+
+        ranking = list()
+        lower_idx = 0
+        frontier_keys, frontier = list(), list()
+        for following_idx in range(1, len(positions)):
+            previous_position, following_position = positions[following_idx - 1], positions[following_idx]
+
+            if schedule.feasible_insertion(trip, following_idx - 1, following_idx):
+                cost = previous_position.distance_to(origin)
+                cost += origin.distance_to(destination)
+                cost += destination.distance_to(following_position)
+                cost -= previous_position.distance_to(following_position)
+                ranking.append((cost, following_idx - 1, following_idx))
+
+            if not capacities[following_idx - 1] <= capacity_limit:
+                lower_idx = following_idx
+                frontier_keys, frontier = list(), list()
+                continue
+
+            previous_idx = following_idx - 2
+            if lower_idx <= previous_idx:
+                pickup = self._evaluate_pickup(route, trip, previous_idx, busy_slacks)
+                if pickup is not None:
+                    cost, push, departure_time = pickup
+                    key = push + waiting_times[previous_idx + 1]
+                    if not timeout < MAX_FLOAT:
+                        departure_time = 0.0
+                    if not bounded:
+                        self._add_to_frontier(frontier_keys, frontier, key, cost, previous_idx)
+                    else:
+                        clean = delay_bounds is None or key <= delay_bounds[previous_idx] + ERROR_BOUND
+                        last_pickup = -1 if last_pickups is None else last_pickups[previous_idx]
+                        self._add_to_bounded_frontier(
+                            frontier_keys, frontier, key, cost, previous_idx, departure_time, clean, last_pickup,
+                        )
+
+            if not frontier_keys:
+                continue
+
+            departure_time = departure_times[following_idx - 1]
+            arrival_time = departure_time + previous_position.time_to(destination, departure_time)
+            latest = starting_times[following_idx] + forward_slacks[following_idx] - trip.destination_duration
+            latest -= destination.time_to(following_position, latest)
+            latest = min(latest, trip.destination_latest)
+            if not trip.destination_earliest <= latest + ERROR_BOUND:
+                continue
+            max_push = latest - arrival_time
+            if not 0 <= max_push + ERROR_BOUND:
+                continue
+
+            if busy_slacks is not None:
+                detour = arrival_time - departure_time + trip.destination_duration
+                detour += destination.time_to(following_position) - previous_position.time_to(following_position)
+                if not detour <= busy_slacks[following_idx - 1] + ERROR_BOUND:
+                    continue
+
+            delivery_cost = previous_position.distance_to(destination)
+            delivery_cost += destination.distance_to(following_position)
+            delivery_cost -= previous_position.distance_to(following_position)
+
+            # The travelling and loading times from the stop which follows the pickup up to the delivery.
+            ride_time = arrival_time - waiting_times[following_idx - 1]
+
+            frontier_idx = bisect_right(frontier_keys, max_push + waiting_times[following_idx - 1] + ERROR_BOUND)
+            for key, (cost, previous_idx, departure_time, _, _) in zip(frontier_keys, frontier[:frontier_idx]):
+                if not key - departure_time + ride_time <= timeout + ERROR_BOUND:
+                    continue
+                if not schedule.feasible_insertion(trip, previous_idx, following_idx):
+                    continue
+                ranking.append((cost + delivery_cost, previous_idx, following_idx))
+
+        return ranking
+
+    @staticmethod
+    def _crossing_slacks(
+        route: Route,
+    ) -> Tuple[Optional[List[float]], Optional[List[float]], Optional[List[int]]]:
+        schedule = route.schedule
+        starting_times, departure_times = schedule.starting_times, schedule.departure_times
+        waiting_times = schedule.cumulative_waiting_times
+
+        pickup_indices = dict()
+        crossings = [list() for _ in range(len(schedule.positions))]
+        for idx, stop in enumerate(route.stops):
+            for planned_trip in stop.pickup_planned_trips:
+                pickup_indices[planned_trip] = idx
+            for planned_trip in stop.delivery_planned_trips:
+                if not planned_trip.timeout < MAX_FLOAT:
+                    continue
+                pickup_idx = pickup_indices[planned_trip]
+                ride_time = starting_times[idx] - departure_times[pickup_idx]
+                busy_time = ride_time - (waiting_times[idx] - waiting_times[pickup_idx])
+                crossings[pickup_idx].append(
+                    (planned_trip.timeout - busy_time, planned_trip.timeout - ride_time + waiting_times[idx], idx),
+                )
+        if not any(crossings):
+            return None, None, None
+
+        busy_slacks, delay_bounds, last_pickups = list(), list(), list()
+        busy_heap, delay_heap, pickup_heap = list(), list(), list()
+        for idx in range(len(crossings) - 1):
+            for busy_slack, delay_bound, delivery_idx in crossings[idx]:
+                heappush(busy_heap, (busy_slack, delivery_idx))
+                heappush(delay_heap, (delay_bound, delivery_idx))
+                heappush(pickup_heap, (-idx, delivery_idx))
+            for heap in (busy_heap, delay_heap, pickup_heap):
+                while heap and heap[0][1] <= idx:
+                    heappop(heap)
+            busy_slacks.append(busy_heap[0][0] if busy_heap else MAX_FLOAT)
+            delay_bounds.append(delay_heap[0][0] if delay_heap else MAX_FLOAT)
+            last_pickups.append(-pickup_heap[0][0] if pickup_heap else -1)
+        return busy_slacks, delay_bounds, last_pickups
+
+    @staticmethod
+    def _evaluate_pickup(
+        route: Route, trip: Trip, previous_idx: int, busy_slacks: Optional[List[float]] = None,
+    ) -> Optional[Tuple[float, float, float]]:
+        schedule = route.schedule
+        previous_position, following_position = schedule.positions[previous_idx], schedule.positions[previous_idx + 1]
+        origin = trip.origin_position
+
+        departure_time = schedule.departure_times[previous_idx]
+        travel_time = previous_position.time_to(origin, departure_time)
+        starting_time = max(departure_time + travel_time, trip.origin_earliest)
+        if not starting_time <= trip.origin_latest + ERROR_BOUND:
+            return None
+        departure_time = starting_time + trip.origin_duration
+
+        following_time = origin.time_to(following_position, departure_time)
+        push = departure_time + following_time - schedule.starting_times[previous_idx + 1]
+        if not push <= schedule.forward_slacks[previous_idx + 1] + ERROR_BOUND:
+            return None
+
+        if busy_slacks is not None:
+            detour = travel_time + trip.origin_duration + following_time
+            detour -= previous_position.time_to(following_position)
+            if not detour <= busy_slacks[previous_idx] + ERROR_BOUND:
+                return None
+
+        cost = previous_position.distance_to(origin)
+        cost += origin.distance_to(following_position)
+        cost -= previous_position.distance_to(following_position)
+        return cost, push, departure_time
+
+    @staticmethod
+    def _add_to_frontier(
+        keys: List[float], frontier: List[Tuple[float, int, float, bool, int]], key: float, cost: float, idx: int,
+    ):
+        position = bisect_right(keys, key)
+        if 0 < position and frontier[position - 1][0] <= cost:
+            return
+
+        end = position
+        while end < len(keys) and cost <= frontier[end][0]:
+            end += 1
+        del keys[position:end], frontier[position:end]
+
+        keys.insert(position, key)
+        frontier.insert(position, (cost, idx, 0.0, True, -1))
+
+    @staticmethod
+    def _add_to_bounded_frontier(
+        keys: List[float],
+        frontier: List[Tuple[float, int, float, bool, int]],
+        key: float,
+        cost: float,
+        idx: int,
+        departure_time: float,
+        clean: bool,
+        last_pickup: int,
+    ):
+        position = bisect_right(keys, key)
+        for other_cost, _, other_departure_time, other_clean, _ in frontier[:position]:
+            if other_clean and other_cost <= cost and departure_time <= other_departure_time:
+                return
+
+        if clean:
+            end = position
+            while end < len(keys):
+                other_cost, other_idx, other_departure_time, _, _ = frontier[end]
+                if last_pickup <= other_idx and cost <= other_cost and other_departure_time <= departure_time:
+                    del keys[end], frontier[end]
+                    continue
+                end += 1
+
+        keys.insert(position, key)
+        frontier.insert(position, (cost, idx, departure_time, clean, last_pickup))
@@ -59,8 +59,6 @@ class LocalSearchStrategy(ABC):
         pass
 
     def _update_routes(self, overwritten_routes: Set[Route]):
-        if any(overwritten_routes):
-            overwritten_vehicles = {route.vehicle for route in overwritten_routes}
-            routes = {route for route in self._planning.routes if route.vehicle not in overwritten_vehicles}
-            routes |= overwritten_routes
-            self._planning.routes = routes
+        for route in overwritten_routes:
+            route.schedule.bind()
+            self._planning.set_route(route)
@@ -17,6 +17,7 @@ class ReallocationLocalSearchStrategy(LocalSearchStrategy):
         from ....insertion import InsertionStrategy  # FIXME Should this import come from "insertion" module?
 
         strategy = InsertionStrategy()
+        graph = self.result.job.compatibility_graph
         logger.info(f'Starting to improve "Result" with "{self.__class__.__name__}"...')
         overwritten_routes = set()
         base_cost = self._objective.optimization_function(self._planning)[-1]
@@ -28,10 +29,12 @@ class ReallocationLocalSearchStrategy(LocalSearchStrategy):
             partial_cost -= self._objective.optimization_function(destination)[-1]
 
             for trip in origin.trips:
+                if not graph.compatible_with(trip, destination):
+                    continue
+
                 new_origin = origin.clone()
                 new_origin.remove_trip(trip)
 
-                new_origin.flush()
                 if not new_origin.feasible:
                     continue
 
@@ -23,11 +23,8 @@ class TwoOPTLocalSearchStrategy(LocalSearchStrategy):
             for i, k in combinations(range(1, len(route.stops) - 1), 2):
                 j = k + 1
                 condition = any(
-                    any(
-                        delivery in chain.from_iterable(b.pickup_planned_trips for b in route.stops[i : j + 1])
-                        for delivery in a.delivery_planned_trips
-                    )
-                    for a in route.stops[i : j + 1]
+                    i <= route.get_stop_index(delivery.pickup)
+                    for delivery in chain.from_iterable(a.delivery_planned_trips for a in route.stops[i : j + 1])
                 )
                 if condition:
                     continue
@@ -36,14 +36,16 @@ if TYPE_CHECKING:
 class Loader(ABC):
     """Load a problem instance from external sources and build the needed class hierarchy to generate solutions."""
 
-    def __init__(self, formatter_cls: Type[LoaderFormatter] = None):
+    def __init__(self, formatter_cls: Type[LoaderFormatter] = None, preprocess: bool = True):
         """Construct a new instance.
 
         :param formatter_cls: The formatter from raw data to the problem instance's class hierarchy.
+        :param preprocess: Indicates if the time windows of the loaded job must be tightened (see ``JobPreprocessor``).
         """
         if formatter_cls is None:
             formatter_cls = CordeauLaporteLoaderFormatter
         self._formatter_cls = formatter_cls
+        self.preprocess = preprocess
 
     @property
     @abstractmethod
@@ -16,6 +16,9 @@ from cached_property import (
     cached_property,
 )
 
+from ..models import (
+    JobPreprocessor,
+)
 from .abc import (
     Loader,
 )
@@ -33,11 +36,13 @@ logger = logging.getLogger(__name__)
 class FileLoader(Loader):
     """Load a problem instance from a file and build the needed class hierarchy to generate solutions."""
 
-    def __init__(self, file_path: Path, *args, **kwargs):
+    def __init__(self, file_path: Path, *args, surface: Surface = None, **kwargs):
         """Construct a new instance.
 
         :param file_path: The path to load the problem instance.
         :param args: Additional positional arguments.
+        :param surface: The surface to which the loaded instance is attached (like a ``MatrixSurface``). If it is not
+            given, the formatter's default one is built.
         :param kwargs: Additional named arguments.
         """
         super().__init__(*args, **kwargs)
@@ -49,7 +54,7 @@ class FileLoader(Loader):
 
         self._fleet = None
         self._job = None
-        self._surface = None
+        self._surface = surface
 
     @property
     def _data(self):
@@ -71,7 +76,10 @@ class FileLoader(Loader):
 
         :return: A surface instance from the loaded instance.
         """
-        return self._formatter.job(surface=self.surface)
+        job = self._formatter.job(surface=self.surface)
+        if self.preprocess:
+            JobPreprocessor(job, self.fleet).tighten()
+        return job
 
     @cached_property
     def surface(self) -> Surface:
@@ -79,4 +87,6 @@ class FileLoader(Loader):
 
         :return: A surface instance from the loaded instance.
         """
+        if self._surface is not None:
+            return self._surface
         return self._formatter.surface()
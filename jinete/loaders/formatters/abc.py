@@ -12,11 +12,19 @@ from typing import (
     TYPE_CHECKING,
 )
 
+from ...models import (
+    MatrixSurface,
+)
+
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import (
+        Any,
+        Sequence,
+    )
     from ...models import (
         Fleet,
         Job,
+        Position,
         Surface,
     )
 
@@ -62,3 +70,16 @@ class LoaderFormatter(ABC):
         :return: A surface instance from the loaded instance.
         """
         pass
+
+    @staticmethod
+    def _get_or_create_position(surface: Surface, node: int, coordinates: Sequence[float]) -> Position:
+        """Retrieve the position of a location of the on load instance.
+
+        :param surface: The surface object for the current on load instance.
+        :param node: The location's index on the instance, used as the row of the ``MatrixSurface``'s matrices.
+        :param coordinates: The location's coordinates, used by any other surface.
+        :return: A position instance.
+        """
+        if isinstance(surface, MatrixSurface):
+            return surface.get_or_create_position(node)
+        return surface.get_or_create_position(coordinates)
@@ -15,7 +15,6 @@ from ...models import (
     Fleet,
     GeometricSurface,
     Job,
-    Service,
     Trip,
     Vehicle,
 )
@@ -44,9 +43,9 @@ class CordeauLaporteLoaderFormatter(LoaderFormatter):
         m = int(row[0])
 
         depot_row = self.data[1]
-        depot_position = surface.get_or_create_position(depot_row[1:3])
+        depot_position = self._get_or_create_position(surface, 0, depot_row[1:3])
 
-        origin = Service(depot_position)
+        origin = surface.get_or_create_service(depot_position)
 
         capacity = row[3]
         timeout = row[2]
@@ -82,16 +81,16 @@ class CordeauLaporteLoaderFormatter(LoaderFormatter):
     def _build_trip(self, surface: Surface, idx: int, n: int) -> Trip:
         origin_idx = idx + 2
         origin_row = self.data[origin_idx]
-        origin = Service(
-            position=surface.get_or_create_position(origin_row[1:3]),
+        origin = surface.get_or_create_service(
+            position=self._get_or_create_position(surface, origin_idx - 1, origin_row[1:3]),
             earliest=origin_row[5],
             latest=origin_row[6],
             duration=origin_row[3],
         )
 
         destination_row = self.data[origin_idx + n]
-        destination = Service(
-            position=surface.get_or_create_position(destination_row[1:3]),
+        destination = surface.get_or_create_service(
+            position=self._get_or_create_position(surface, origin_idx + n - 1, destination_row[1:3]),
             earliest=destination_row[5],
             latest=destination_row[6],
             duration=destination_row[3],
@@ -104,7 +103,14 @@ class CordeauLaporteLoaderFormatter(LoaderFormatter):
 
         timeout = self.data[0][4]
 
-        trip = Trip(identifier=identifier, origin=origin, destination=destination, capacity=capacity, timeout=timeout,)
+        trip = Trip(
+            identifier=identifier,
+            origin=origin,
+            destination=destination,
+            capacity=capacity,
+            timeout=timeout,
+            index=idx,
+        )
         return trip
 
     def surface(self, *args, **kwargs) -> Surface:
@@ -114,6 +120,6 @@ class CordeauLaporteLoaderFormatter(LoaderFormatter):
         :param kwargs: Additional named arguments.
         :return: A surface instance from the loaded instance.
         """
-        surface = GeometricSurface(DistanceMetric.EUCLIDEAN)
+        surface = GeometricSurface(DistanceMetric.EUCLIDEAN, *args, **kwargs)
         logger.info("Created surface!")
         return surface
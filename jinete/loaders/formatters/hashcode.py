@@ -8,7 +8,6 @@ from ...models import (
     GeometricSurface,
     HashCodeObjective,
     Job,
-    Service,
     Surface,
     Trip,
     Vehicle,
@@ -34,7 +33,7 @@ class HashCodeLoaderFormatter(LoaderFormatter):
         row = self.data[0]
         n, latest, capacity = int(row[2]), row[5], 1.0
 
-        origin = Service(surface.get_or_create_position([0, 0]), latest=latest)
+        origin = surface.get_or_create_service(self._get_or_create_position(surface, 0, [0, 0]), latest=latest)
         vehicles = set(Vehicle(str(idx), origin, capacity=capacity) for idx in range(n))
         fleet = Fleet(vehicles)
         logger.info(f"Created {fleet}!")
@@ -50,7 +49,7 @@ class HashCodeLoaderFormatter(LoaderFormatter):
         """
         bonus = self.data[0][4]
         rows = self.data[1:]
-        trips = set(self._build_trip(surface, str(i), bonus, *row) for i, row in enumerate(rows))
+        trips = set(self._build_trip(surface, i, bonus, *row) for i, row in enumerate(rows))
 
         kwargs["objective_cls"] = HashCodeObjective
         job = Job(trips, *args, **kwargs)
@@ -58,10 +57,10 @@ class HashCodeLoaderFormatter(LoaderFormatter):
         logger.info(f'Created "{job}"!')
         return job
 
-    @staticmethod
     def _build_trip(
+        self,
         surface: Surface,
-        identifier: str,
+        idx: int,
         bonus: float,
         x1: float,
         y1: float,
@@ -70,9 +69,10 @@ class HashCodeLoaderFormatter(LoaderFormatter):
         earliest: float,
         latest: float,
     ) -> Trip:
-        origin = Service(position=surface.get_or_create_position([x1, y1]), earliest=earliest, latest=latest,)
-        destination = Service(position=surface.get_or_create_position([x2, y2]),)
-        trip = Trip(identifier, on_time_bonus=bonus, origin=origin, destination=destination)
+        origin_position = self._get_or_create_position(surface, 2 * idx + 1, [x1, y1])
+        origin = surface.get_or_create_service(origin_position, earliest=earliest, latest=latest)
+        destination = surface.get_or_create_service(self._get_or_create_position(surface, 2 * idx + 2, [x2, y2]))
+        trip = Trip(str(idx), on_time_bonus=bonus, origin=origin, destination=destination, index=idx)
         logger.debug("Created trip!")
         return trip
 
@@ -83,6 +83,6 @@ class HashCodeLoaderFormatter(LoaderFormatter):
         :param kwargs: Additional named arguments.
         :return: A surface instance from the loaded instance.
         """
-        surface = GeometricSurface(DistanceMetric.MANHATTAN)
+        surface = GeometricSurface(DistanceMetric.MANHATTAN, *args, **kwargs)
         logger.info("Created surface!")
         return surface
@@ -5,7 +5,18 @@ The set of classes which models problem instances, solutions, etc.
 from .abc import (
     Model,
 )
+from .candidates import (
+    InsertionCandidate,
+)
+from .compatibilities import (
+    CompatibilityGraph,
+)
+from .conjectures import (
+    ConjecturedPlannedTrip,
+    ConjecturedRoute,
+)
 from .constants import (
+    ERROR_BOUND,
     MAX_FLOAT,
     MAX_INT,
     MIN_FLOAT,
@@ -22,6 +33,12 @@ from .criterions import (
     ShortestAveragePlannerTripDurationCriterion,
     ShortestTimeRouteCriterion,
 )
+from .hierarchies import (
+    ContractionHierarchy,
+)
+from .indices import (
+    TripIndex,
+)
 from .jobs import (
     Job,
 )
@@ -39,8 +56,16 @@ from .plannings import (
 )
 from .positions import (
     GeometricPosition,
+    GraphPosition,
+    MatrixPosition,
     Position,
 )
+from .preprocessors import (
+    JobPreprocessor,
+)
+from .profiles import (
+    SpeedProfile,
+)
 from .results import (
     Result,
 )
@@ -48,6 +73,9 @@ from .routes import (
     Route,
     RouteCloner,
 )
+from .schedules import (
+    Schedule,
+)
 from .services import (
     Service,
 )
@@ -55,8 +83,12 @@ from .stops import (
     Stop,
 )
 from .surfaces import (
+    ContractionHierarchySurface,
     GeometricSurface,
+    GraphSurface,
+    MatrixSurface,
     Surface,
+    TimeDependentSurface,
 )
 from .trips import (
     Trip,
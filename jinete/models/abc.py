@@ -43,6 +43,8 @@ class Model(ABC):
         :py:class:`~jinete.models.vehicles.Vehicle`,
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """
         The constructor of the class.
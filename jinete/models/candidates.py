@@ -0,0 +1,141 @@
+"""
+Contains the lightweight representation of a trip insertion that has been evaluated but not materialized.
+"""
+
+from __future__ import (
+    annotations,
+)
+
+import logging
+from typing import (
+    TYPE_CHECKING,
+)
+
+if TYPE_CHECKING:
+    from typing import (
+        Any,
+        Generator,
+        Tuple,
+    )
+    from ..algorithms import InsertionStrategy
+    from .routes import Route
+    from .trips import Trip
+    from .vehicles import Vehicle
+
+logger = logging.getLogger(__name__)
+
+
+class InsertionCandidate(object):
+    """
+    Represents the insertion of a trip into a route, placing the pickup just after the ``previous_idx``-th stop and
+    the delivery just before the ``following_idx``-th stop.
+
+    Only the values needed to rank the insertion are stored. They are evaluated over the arrays of the route's schedule
+    (see ``ConjecturedRoute``), so the conjectured route is only built by the insertion strategy once the candidate
+    is accepted.
+    """
+
+    __slots__ = (
+        "route",
+        "trip",
+        "previous_idx",
+        "following_idx",
+        "scoring",
+        "feasible",
+        "strategy",
+    )
+
+    route: Route
+    """
+    The route in which the trip is inserted.
+    """
+
+    trip: Trip
+    """
+    The trip to be inserted.
+    """
+
+    previous_idx: int
+    """
+    The index of the stop after which the pickup is placed.
+    """
+
+    following_idx: int
+    """
+    The index of the stop before which the delivery is placed.
+    """
+
+    scoring: float
+    """
+    The value obtained by the criterion over the conjectured route.
+    """
+
+    feasible: bool
+    """
+    Indicates if the conjectured route is feasible.
+    """
+
+    strategy: InsertionStrategy
+    """
+    The strategy used to build the conjectured route.
+    """
+
+    def __init__(
+        self,
+        route: Route,
+        trip: Trip,
+        previous_idx: int,
+        following_idx: int,
+        scoring: float,
+        feasible: bool,
+        strategy: InsertionStrategy,
+    ):
+        """
+        Constructor of the class.
+
+        :param route: The route in which the trip is inserted.
+        :param trip: The trip to be inserted.
+        :param previous_idx: The index of the stop after which the pickup is placed.
+        :param following_idx: The index of the stop before which the delivery is placed.
+        :param scoring: The value obtained by the criterion over the conjectured route.
+        :param feasible: Indicates if the conjectured route is feasible.
+        :param strategy: The strategy used to build the conjectured route.
+        """
+        self.route = route
+        self.trip = trip
+        self.previous_idx = previous_idx
+        self.following_idx = following_idx
+        self.scoring = scoring
+        self.feasible = feasible
+        self.strategy = strategy
+
+    @property
+    def vehicle(self) -> Vehicle:
+        """
+        The vehicle which performs the route.
+
+        :return: A vehicle instance.
+        """
+        return self.route.vehicle
+
+    def materialize(self) -> Route:
+        """
+        Builds the conjectured route, which is a clone of the original one containing the inserted trip.
+
+        :return: A route instance.
+        """
+        return self.strategy.materialize(self)
+
+    def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
+        yield from (
+            ("vehicle_identifier", self.route.vehicle_identifier),
+            ("trip_identifier", self.trip.identifier),
+            ("previous_idx", self.previous_idx),
+            ("following_idx", self.following_idx),
+            ("scoring", self.scoring),
+            ("feasible", self.feasible),
+        )
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{key}={value}" for key, value in self)
+        return f"{self.__class__.__name__}({values})"
@@ -0,0 +1,210 @@
+"""
+Contains the compatibility graph between trips, used to discard the insertions which can never be feasible.
+"""
+
+from __future__ import (
+    annotations,
+)
+
+import logging
+from typing import (
+    TYPE_CHECKING,
+)
+
+import numpy as np
+
+from .constants import (
+    ERROR_BOUND,
+)
+
+if TYPE_CHECKING:
+    from typing import (
+        Any,
+        Dict,
+        Generator,
+        Iterable,
+        List,
+        Sequence,
+        Set,
+        Tuple,
+        Union,
+    )
+    from .positions import Position
+    from .routes import Route
+    from .surfaces import Surface
+    from .trips import Trip
+
+logger = logging.getLogger(__name__)
+
+
+def feasible_sequence(sequence: Sequence[Tuple[Trip, bool]]) -> bool:
+    """
+    Checks if a sequence of pickups and deliveries could be served by a single vehicle, as a relaxation which ignores
+    the capacities and bounds the ride times without the waiting times.
+
+    :param sequence: The services to be performed, as pairs of trip and a flag which indicates if it is the pickup.
+    :return: ``False`` if the sequence can never be feasible, ``True`` otherwise.
+    """
+    previous_position, previous_departure_time = None, None
+    ride_times = dict()
+    for trip, pickup in sequence:
+        if pickup:
+            position, duration = trip.origin_position, trip.origin_duration
+            earliest, latest = trip.origin_earliest, trip.origin_latest
+        else:
+            position, duration = trip.destination_position, trip.destination_duration
+            earliest, latest = trip.destination_earliest, trip.destination_latest
+
+        starting_time = earliest
+        if previous_position is not None:
+            travel_time = previous_position.time_to(position, previous_departure_time)
+            starting_time = max(starting_time, previous_departure_time + travel_time)
+            for other in ride_times:
+                ride_times[other] += travel_time
+        if not starting_time <= latest + ERROR_BOUND:
+            return False
+
+        if pickup:
+            ride_times[trip] = 0.0
+        else:
+            if not ride_times.pop(trip) <= trip.timeout + ERROR_BOUND:
+                return False
+        for other in ride_times:
+            if other is not trip:
+                ride_times[other] += duration
+
+        previous_position, previous_departure_time = position, starting_time + duration
+    return True
+
+
+class CompatibilityGraph(object):
+    """
+    Represents which pairs of trips can never be served by the same vehicle, as there is no sequence of their pickups
+    and deliveries which satisfies their time windows and ride times.
+
+    For each pair, the sequences which serve one trip entirely before the other are checked in a vectorised way
+    (through the surface's ``time_many``). The pairs which cannot be served one after the other in any order are
+    filtered by the reachability between their pickups (also vectorised), and only the remaining ones are checked
+    against the interleaved sequences (see ``feasible_sequence``). As the checks are relaxations, the recorded
+    conflicts are always true ones as long as the surface satisfies the triangle inequality. As the conflicts are
+    usually a small fraction of the pairs, the graph is stored as a sparse adjacency of them.
+    """
+
+    __slots__ = ("conflicts",)
+
+    conflicts: Dict[Trip, Set[Trip]]
+    """
+    The trips which cannot share a vehicle with each trip (only the ones with any conflict are present).
+    """
+
+    def __init__(self, trips: Iterable[Trip], block_size: int = 256):
+        """
+        Constructor of the class.
+
+        :param trips: The trips to be analysed.
+        :param block_size: The number of trips whose pairs are checked on each vectorised step.
+        """
+        self.conflicts = dict()
+
+        trips = list(trips)
+        if len(trips) < 2:
+            return
+        surface = trips[0].origin_position.surface
+
+        origins = self._identifiers(surface, [trip.origin_position for trip in trips])
+        destinations = self._identifiers(surface, [trip.destination_position for trip in trips])
+        pickup_departures = np.array([trip.origin_earliest + trip.origin_duration for trip in trips])
+        delivery_departures = np.array([trip.destination_earliest + trip.destination_duration for trip in trips])
+        latest = np.array([trip.origin_latest for trip in trips]) + ERROR_BOUND
+
+        n = len(trips)
+        for start in range(0, n - 1, block_size):
+            rows = np.arange(start, min(start + block_size, n - 1))
+            sources, targets = np.repeat(rows, n), np.tile(np.arange(n), len(rows))
+            pending = sources < targets
+            sources, targets = sources[pending], targets[pending]
+
+            pending = self._unreachable(surface, destinations, origins, delivery_departures, latest, sources, targets)
+            pending &= self._unreachable(surface, destinations, origins, delivery_departures, latest, targets, sources)
+            sources, targets = sources[pending], targets[pending]
+
+            forward = ~self._unreachable(surface, origins, origins, pickup_departures, latest, sources, targets)
+            backward = ~self._unreachable(surface, origins, origins, pickup_departures, latest, targets, sources)
+
+            for i, j, ij, ji in zip(sources.tolist(), targets.tolist(), forward.tolist(), backward.tolist()):
+                if ij and self._interleavable(trips[i], trips[j]):
+                    continue
+                if ji and self._interleavable(trips[j], trips[i]):
+                    continue
+                self.conflicts.setdefault(trips[i], set()).add(trips[j])
+                self.conflicts.setdefault(trips[j], set()).add(trips[i])
+
+    @classmethod
+    def _unreachable(
+        cls,
+        surface: Surface,
+        sources: Union[np.ndarray, List[Position]],
+        targets: Union[np.ndarray, List[Position]],
+        departures: np.ndarray,
+        latest: np.ndarray,
+        i: np.ndarray,
+        j: np.ndarray,
+    ) -> np.ndarray:
+        times = surface.time_many(cls._take(sources, i), cls._take(targets, j), now=departures[i])
+        return latest[j] < departures[i] + times
+
+    @staticmethod
+    def _identifiers(surface: Surface, positions: List[Position]) -> Union[np.ndarray, List[Position]]:
+        if all(position.surface is surface and position.index is not None for position in positions):
+            return np.array([position.index for position in positions], dtype=np.intp)
+        return positions
+
+    @staticmethod
+    def _take(values: Union[np.ndarray, List[Position]], indices: np.ndarray) -> Union[np.ndarray, List[Position]]:
+        if isinstance(values, np.ndarray):
+            return values[indices]
+        return [values[idx] for idx in indices.tolist()]
+
+    @staticmethod
+    def _interleavable(first: Trip, second: Trip) -> bool:
+        pickups = ((first, True), (second, True))
+        for deliveries in (((first, False), (second, False)), ((second, False), (first, False))):
+            if feasible_sequence(pickups + deliveries):
+                return True
+        return False
+
+    def compatible(self, trip_a: Trip, trip_b: Trip) -> bool:
+        """
+        Checks if two trips could be served by the same vehicle.
+
+        :param trip_a: The first trip.
+        :param trip_b: The second trip.
+        :return: ``False`` if the trips can never be served together, ``True`` otherwise.
+        """
+        return trip_b not in self.conflicts.get(trip_a, ())
+
+    def compatible_with(self, trip: Trip, route: Route) -> bool:
+        """
+        Checks if a trip could be inserted into a route, this is, if it has no conflict with any of its trips.
+
+        :param trip: The trip to be inserted.
+        :param route: The route which would contain the trip.
+        :return: ``False`` if the insertion can never be feasible, ``True`` otherwise.
+        """
+        conflicts = self.conflicts.get(trip)
+        if conflicts is None:
+            return True
+        return not any(route.contains_trip(other) for other in conflicts)
+
+    def __len__(self) -> int:
+        return sum(len(conflicts) for conflicts in self.conflicts.values()) // 2
+
+    def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
+        yield from (
+            ("conflicting_trips_count", len(self.conflicts)),
+            ("conflicts_count", len(self)),
+        )
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{key}={value}" for key, value in self)
+        return f"{self.__class__.__name__}({values})"
@@ -0,0 +1,461 @@
+"""
+Contains the evaluation of a trip insertion over the arrays of a route's schedule, without building the route.
+"""
+
+from __future__ import (
+    annotations,
+)
+
+import logging
+from typing import (
+    TYPE_CHECKING,
+)
+
+from .constants import (
+    ERROR_BOUND,
+)
+from .routes import (
+    RouteCloner,
+)
+from .schedules import (
+    propagate_stop,
+)
+
+if TYPE_CHECKING:
+    from typing import (
+        Any,
+        Dict,
+        Iterator,
+        List,
+        Optional,
+        Tuple,
+    )
+    from ..algorithms import InsertionStrategy
+    from .positions import Position
+    from .routes import Route
+    from .trips import Trip
+    from .vehicles import Vehicle
+
+logger = logging.getLogger(__name__)
+
+
+class ConjecturedPlannedTrip(object):
+    """
+    Represents the times of a planned trip over a conjectured route.
+    """
+
+    __slots__ = (
+        "trip",
+        "pickup_time",
+        "delivery_time",
+    )
+
+    trip: Trip
+    """
+    The planned trip.
+    """
+
+    pickup_time: float
+    """
+    The departure time from the pickup stop.
+    """
+
+    delivery_time: float
+    """
+    The starting time of the services of the delivery stop.
+    """
+
+    def __init__(self, trip: Trip, pickup_time: float, delivery_time: float):
+        """
+        Constructor of the class.
+
+        :param trip: The planned trip.
+        :param pickup_time: The departure time from the pickup stop.
+        :param delivery_time: The starting time of the services of the delivery stop.
+        """
+        self.trip = trip
+        self.pickup_time = pickup_time
+        self.delivery_time = delivery_time
+
+    @property
+    def trip_identifier(self) -> str:
+        return self.trip.identifier
+
+    @property
+    def distance(self) -> float:
+        return self.trip.distance
+
+    @property
+    def duration(self) -> float:
+        return self.delivery_time - self.pickup_time
+
+    @property
+    def timeout(self) -> float:
+        return self.trip.timeout
+
+    @property
+    def capacity(self) -> float:
+        return self.trip.capacity
+
+
+class ConjecturedRoute(object):
+    """
+    Represents the route which would be obtained by inserting a trip into another one, placing the pickup just after
+    the ``previous_idx``-th stop and the delivery just before the ``following_idx``-th one.
+
+    The route is not built. Its times are propagated over the arrays of the original route's schedule, starting from
+    the first stop which would be cloned (see ``RouteCloner``), and the ride time improvements of the
+    ``InsertionStrategy`` are replayed over them. So, the attributes used by the route criteria (the feasibility, the
+    departure times, the duration, the trips and the planned trips' times) are obtained without creating any stop.
+    The structural attributes listed on ``BUILT_ATTRIBUTES`` (like the stops or the schedule) are obtained from the
+    built route, which is only built on the first access to any of them. Any other attribute raises an
+    ``AttributeError``.
+    """
+
+    BUILT_ATTRIBUTES = frozenset(
+        {
+            "stops",
+            "schedule",
+            "positions",
+            "pickups",
+            "deliveries",
+            "first_stop",
+            "last_stop",
+            "last_position",
+            "current_stop",
+            "current_arrival_time",
+            "current_departure_time",
+            "current_position",
+            "feasible_stops",
+            "feasible_planned_trips",
+            "loaded_planned_trips",
+            "loaded_trips",
+            "loaded_trips_count",
+            "transit_time",
+            "waiting_time",
+            "distance",
+            "segment_distance",
+            "segment_transit_time",
+            "segment_waiting_time",
+            "get_planned_trip",
+            "contains_trip",
+            "get_stop_index",
+            "get_trip_indices",
+        }
+    )
+    """
+    The attributes which are obtained from the built route.
+    """
+
+    __slots__ = (
+        "route",
+        "trip",
+        "previous_idx",
+        "following_idx",
+        "strategy",
+        "start",
+        "positions",
+        "earliest",
+        "latest",
+        "load_times",
+        "fixed_times",
+        "loads",
+        "pickups",
+        "deliveries",
+        "arrival_times",
+        "starting_times",
+        "departure_times",
+        "capacities",
+        "_feasibles",
+        "_built",
+    )
+
+    route: Route
+    """
+    The route in which the trip is inserted.
+    """
+
+    trip: Trip
+    """
+    The trip to be inserted.
+    """
+
+    previous_idx: int
+    """
+    The index of the stop after which the pickup is placed.
+    """
+
+    following_idx: int
+    """
+    The index of the stop before which the delivery is placed.
+    """
+
+    start: int
+    """
+    The index of the first stop whose values are propagated (the previous ones are shared with the original route).
+    """
+
+    def __init__(self, route: Route, trip: Trip, previous_idx: int, following_idx: int, strategy: InsertionStrategy):
+        """
+        Constructor of the class.
+
+        :param route: The route in which the trip is inserted.
+        :param trip: The trip to be inserted.
+        :param previous_idx: The index of the stop after which the pickup is placed.
+        :param following_idx: The index of the stop before which the delivery is placed.
+        :param strategy: The strategy which builds the route when it is needed.
+        """
+        self.route = route
+        self.trip = trip
+        self.previous_idx = previous_idx
+        self.following_idx = following_idx
+        self.strategy = strategy
+        self._built = None
+
+        self._initialize()
+        self._propagate(0)
+        self._improve_ride_times()
+
+    @property
+    def vehicle(self) -> Vehicle:
+        return self.route.vehicle
+
+    def _initialize(self) -> None:
+        route, trip = self.route, self.trip
+        stops, schedule = route.stops, route.schedule
+        previous_idx, following_idx = self.previous_idx, self.following_idx
+
+        start = RouteCloner.threshold(stops, previous_idx + 1)
+        self.start = start
+
+        positions, earliest, latest, load_times = list(), list(), list(), list()
+        fixed_times, loads = list(), list()
+        pickups: List[List[Tuple[Trip, int]]] = list()
+        deliveries: List[List[Tuple[Trip, int]]] = list()
+        indices: Dict[int, int] = dict()
+
+        def append_stop(idx: int) -> None:
+            stop = stops[idx]
+            local_idx = len(positions)
+            positions.append(schedule.positions[idx])
+            earliest.append(schedule.earliest[idx])
+            latest.append(schedule.latest[idx])
+            load_times.append(schedule.load_times[idx])
+            fixed_times.append(stop._starting_time)
+            loads.append(schedule.capacities[idx] - (schedule.capacities[idx - 1] if idx > 0 else 0.0))
+            indices[id(stop)] = local_idx
+            pickups.append(list())
+            deliveries.append(list())
+            for planned_trip in stop.delivery_planned_trips:
+                pickup_idx = indices[id(planned_trip.pickup)]
+                deliveries[local_idx].append((planned_trip.trip, pickup_idx))
+                pickups[pickup_idx].append((planned_trip.trip, local_idx))
+
+        def append_service(position: Position, service_earliest: float, service_latest: float, load_time: float):
+            positions.append(position)
+            earliest.append(service_earliest)
+            latest.append(service_latest)
+            load_times.append(load_time)
+            fixed_times.append(None)
+            pickups.append(list())
+            deliveries.append(list())
+
+        for idx in range(start, previous_idx + 1):
+            append_stop(idx)
+        pickup_idx = len(positions)
+        append_service(trip.origin_position, trip.origin_earliest, trip.origin_latest, trip.origin_duration)
+        loads.append(trip.capacity)
+        for idx in range(previous_idx + 1, following_idx):
+            append_stop(idx)
+        delivery_idx = len(positions)
+        append_service(
+            trip.destination_position, trip.destination_earliest, trip.destination_latest, trip.destination_duration,
+        )
+        loads.append(-trip.capacity)
+        deliveries[delivery_idx].append((trip, pickup_idx))
+        pickups[pickup_idx].append((trip, delivery_idx))
+        for idx in range(following_idx, len(stops)):
+            append_stop(idx)
+
+        self.positions, self.earliest, self.latest, self.load_times = positions, earliest, latest, load_times
+        self.fixed_times, self.loads, self.pickups, self.deliveries = fixed_times, loads, pickups, deliveries
+
+        n = len(positions)
+        self.arrival_times, self.starting_times, self.departure_times = [0.0] * n, [0.0] * n, [0.0] * n
+        self.capacities, self._feasibles = [0.0] * n, [True] * n
+
+    def _propagate(self, local_idx: int) -> None:
+        route, schedule = self.route, self.route.schedule
+        vehicle = route.vehicle
+        vehicle_capacity = vehicle.capacity
+
+        positions, earliest, latest, load_times = self.positions, self.earliest, self.latest, self.load_times
+        fixed_times, loads, deliveries = self.fixed_times, self.loads, self.deliveries
+        arrival_times, starting_times, departure_times = self.arrival_times, self.starting_times, self.departure_times
+        capacities, feasibles = self.capacities, self._feasibles
+
+        if local_idx > 0:
+            previous_position = positions[local_idx - 1]
+            previous_departure_time = departure_times[local_idx - 1]
+            previous_capacity = capacities[local_idx - 1]
+            feasible = feasibles[local_idx - 1]
+        elif self.start > 0:
+            previous_position = schedule.positions[self.start - 1]
+            previous_departure_time = schedule.departure_times[self.start - 1]
+            previous_capacity = schedule.capacities[self.start - 1]
+            feasible = bool(schedule._feasibles[self.start - 1])
+        else:
+            previous_position = vehicle.origin_position
+            previous_departure_time = vehicle.origin_earliest
+            previous_capacity = 0.0
+            feasible = True
+
+        for idx in range(local_idx, len(positions)):
+            position = positions[idx]
+            arrival_time, starting_time, departure_time, capacity = propagate_stop(
+                previous_position,
+                previous_departure_time,
+                previous_capacity,
+                position,
+                fixed_times[idx],
+                earliest[idx],
+                load_times[idx],
+                loads[idx],
+            )
+
+            if feasible:
+                feasible = (
+                    earliest[idx] <= starting_time + ERROR_BOUND
+                    and starting_time <= latest[idx] + ERROR_BOUND
+                    and capacity <= vehicle_capacity + ERROR_BOUND
+                )
+            if feasible:
+                for trip, pickup_idx in deliveries[idx]:
+                    if not starting_time - departure_times[pickup_idx] <= trip.timeout + ERROR_BOUND:
+                        feasible = False
+                        break
+
+            arrival_times[idx], starting_times[idx], departure_times[idx] = arrival_time, starting_time, departure_time
+            capacities[idx], feasibles[idx] = capacity, feasible
+
+            previous_position, previous_departure_time, previous_capacity = position, departure_time, capacity
+
+    def _improve_ride_times(self) -> None:
+        if self.start == 0 and self.starting_times[1] != self.arrival_times[1]:
+            self.fixed_times[0] = self.starting_times[0] + (self.starting_times[1] - self.arrival_times[1])
+            self._propagate(0)
+
+        if self.feasible:
+            return
+
+        starting_times, departure_times = self.starting_times, self.departure_times
+        for idx in reversed(range(max(1 - self.start, 0), len(self.positions))):
+            if not self.pickups[idx]:
+                continue
+            trip, delivery_idx = max(
+                self.pickups[idx], key=lambda pair: starting_times[pair[1]] - departure_times[idx],
+            )
+            delay = max(starting_times[delivery_idx] - departure_times[idx] - trip.timeout, 0)
+            self.fixed_times[idx] = starting_times[idx] + delay
+            if delay > 0:
+                self._propagate(idx)
+
+    @property
+    def feasible(self) -> bool:
+        """
+        Indicates if the conjectured route is feasible, with the same checks as the ``Route.feasible`` property.
+
+        :return: ``True`` if the route is feasible or ``False`` otherwise.
+        """
+        route, vehicle = self.route, self.route.vehicle
+        if not route.first_stop.position == vehicle.origin_position:
+            return False
+        if not vehicle.origin_earliest - ERROR_BOUND <= self.first_arrival_time:
+            return False
+        if not route.last_position == vehicle.destination_position:
+            return False
+        if not self.last_departure_time <= vehicle.destination_latest + ERROR_BOUND:
+            return False
+        if not self.duration <= vehicle.timeout + ERROR_BOUND:
+            return False
+        if not self._feasibles[-1]:
+            return False
+        return route.schedule._pending_pickups[-1] == 0
+
+    def _value(self, values: List[float], original: Any, idx: int) -> float:
+        if idx < 0:
+            idx += len(self.positions) + self.start
+        if idx < self.start:
+            return original[idx]
+        return values[idx - self.start]
+
+    @property
+    def first_arrival_time(self) -> float:
+        return self._value(self.arrival_times, self.route.schedule.arrival_times, 0)
+
+    @property
+    def first_departure_time(self) -> float:
+        return self._value(self.departure_times, self.route.schedule.departure_times, 0)
+
+    @property
+    def last_departure_time(self) -> float:
+        return self.departure_times[-1]
+
+    @property
+    def duration(self) -> float:
+        return self.last_departure_time - self.first_departure_time
+
+    @property
+    def trips(self) -> Iterator[Trip]:
+        yield from self.route.trips
+        yield self.trip
+
+    @property
+    def loaded(self) -> bool:
+        return True
+
+    @property
+    def planned_trips(self) -> Iterator[ConjecturedPlannedTrip]:
+        schedule = self.route.schedule
+        stops = self.route.stops
+        for idx in range(self.start):
+            for planned_trip in stops[idx].delivery_planned_trips:
+                pickup_idx = self.route.get_stop_index(planned_trip.pickup)
+                yield ConjecturedPlannedTrip(
+                    planned_trip.trip, schedule.departure_times[pickup_idx], schedule.starting_times[idx],
+                )
+        for idx, deliveries in enumerate(self.deliveries):
+            for trip, pickup_idx in deliveries:
+                yield ConjecturedPlannedTrip(trip, self.departure_times[pickup_idx], self.starting_times[idx])
+
+    @property
+    def built(self) -> Route:
+        """
+        Retrieves the conjectured route, which is built on the first access.
+
+        :return: A route instance.
+        """
+        if self._built is None:
+            self._built = self.strategy._compute_one(self.route, self.trip, self.previous_idx, self.following_idx)
+        return self._built
+
+    @property
+    def vehicle_identifier(self) -> Optional[str]:
+        return self.route.vehicle_identifier
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in self.BUILT_ATTRIBUTES:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        return getattr(self.built, name)
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        yield from (
+            ("vehicle_identifier", self.vehicle_identifier),
+            ("trip_identifier", self.trip.identifier),
+            ("previous_idx", self.previous_idx),
+            ("following_idx", self.following_idx),
+        )
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{key}={value}" for key, value in self)
+        return f"{self.__class__.__name__}({values})"
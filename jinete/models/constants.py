@@ -43,6 +43,8 @@ MIN_FLOAT = float("-inf")
 
 ERROR_BOUND = 10e-4
 
+UNSET = object()
+
 
 @unique
 class OptimizationDirection(Enum):
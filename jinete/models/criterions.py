@@ -14,6 +14,9 @@ from typing import (
     TYPE_CHECKING,
 )
 
+from .candidates import (
+    InsertionCandidate,
+)
 from .constants import (
     MAX_FLOAT,
     MIN_FLOAT,
@@ -25,9 +28,13 @@ if TYPE_CHECKING:
         Optional,
         List,
         Iterable,
+        TypeVar,
+        Union,
     )
     from .routes import Route
 
+    Rankable = TypeVar("Rankable", Route, InsertionCandidate)
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,14 +47,19 @@ class RouteCriterion(ABC):
     def scoring(self, route: Route) -> float:
         pass
 
-    def best(self, *args: Optional[Route]) -> Route:
-        return self.direction((arg for arg in args if arg is not None), key=self.scoring, default=None,)
+    def _scoring(self, value: Union[Route, InsertionCandidate]) -> float:
+        if isinstance(value, InsertionCandidate):
+            return value.scoring
+        return self.scoring(value)
+
+    def best(self, *args: Optional[Rankable]) -> Rankable:
+        return self.direction((arg for arg in args if arg is not None), key=self._scoring, default=None,)
 
-    def sorted(self, routes: Iterable[Route], inplace: bool = False) -> List[Route]:
-        return self.direction.sorted(routes, key=self.scoring, inplace=inplace)
+    def sorted(self, routes: Iterable[Rankable], inplace: bool = False) -> List[Rankable]:
+        return self.direction.sorted(routes, key=self._scoring, inplace=inplace)
 
-    def nbest(self, n: int, routes: Iterable[Route], inplace: bool = False) -> List[Route]:
-        return self.direction.nbest(n, routes, key=self.scoring, inplace=inplace)
+    def nbest(self, n: int, routes: Iterable[Rankable], inplace: bool = False) -> List[Rankable]:
+        return self.direction.nbest(n, routes, key=self._scoring, inplace=inplace)
 
 
 class EarliestLastDepartureTimeRouteCriterion(RouteCriterion):
@@ -0,0 +1,324 @@
+"""
+Contains the contraction hierarchy preprocessing used to answer shortest path queries over large graphs.
+"""
+
+from __future__ import (
+    annotations,
+)
+
+import json
+import logging
+from heapq import (
+    heappop,
+    heappush,
+)
+from pathlib import (
+    Path,
+)
+from typing import (
+    TYPE_CHECKING,
+)
+
+import numpy as np
+
+from .constants import (
+    MAX_FLOAT,
+)
+
+if TYPE_CHECKING:
+    from typing import (
+        Any,
+        Dict,
+        Generator,
+        Hashable,
+        List,
+        Tuple,
+    )
+    import networkx as nx
+
+logger = logging.getLogger(__name__)
+
+
+def _as_node(value: Any) -> Hashable:
+    if isinstance(value, list):
+        return tuple(_as_node(item) for item in value)
+    return value
+
+
+class ContractionHierarchy(object):
+    """
+    Represents a contraction hierarchy over a weighted graph, which answers point to point shortest path queries with
+    a bidirectional search restricted to the edges that go upward on the nodes' ranking.
+
+    The hierarchy is built by contracting the nodes one by one (in increasing order of importance), adding shortcut
+    edges between their neighbors whenever the shortest path between them goes through the contracted node. It only
+    depends on the graph and the weight, so it can be stored on disk (see ``save`` and ``load``) and reused across
+    several solves with different trips.
+
+    The upward and downward edges are stored in compressed sparse row format (indexed by the rank of the nodes), and
+    each direction of the search relaxes all the edges of its frontier at once with ``numpy``. It is a vectorised
+    kernel, not a compiled one, so a query takes about two milliseconds over a grid of ten thousand nodes (instead of
+    the microseconds of compiled implementations). The surfaces which use the hierarchy cache their results by pair of
+    positions.
+    """
+
+    __slots__ = (
+        "nodes",
+        "ranks",
+        "upward",
+        "downward",
+    )
+
+    nodes: List[Hashable]
+    """
+    The nodes sorted by their contraction order.
+    """
+
+    ranks: Dict[Hashable, int]
+    """
+    The contraction order of each node.
+    """
+
+    upward: Tuple[np.ndarray, np.ndarray, np.ndarray]
+    """
+    The outgoing edges of each node towards higher ranked nodes, as the index pointers, neighbor ranks and weights
+    arrays of the compressed sparse row format.
+    """
+
+    downward: Tuple[np.ndarray, np.ndarray, np.ndarray]
+    """
+    The incoming edges of each node from higher ranked nodes, reversed to be used by the backward search (in the same
+    format as the upward ones).
+    """
+
+    def __init__(
+        self,
+        nodes: List[Hashable],
+        upward: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        downward: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    ):
+        """
+        Constructor of the class.
+
+        :param nodes: The nodes sorted by their contraction order.
+        :param upward: The outgoing edges of each node towards higher ranked nodes.
+        :param downward: The incoming edges of each node from higher ranked nodes.
+        """
+        self.nodes = nodes
+        self.ranks = {node: rank for rank, node in enumerate(nodes)}
+        self.upward = upward
+        self.downward = downward
+
+    @classmethod
+    def build(cls, graph: nx.Graph, weight: str = "distance", witness_limit: int = 64) -> ContractionHierarchy:
+        """
+        Builds the hierarchy of a graph (undirected graphs are considered as having both edge directions).
+
+        :param graph: The graph to be preprocessed.
+        :param weight: The edge attribute which contains the weight.
+        :param witness_limit: The maximum number of nodes settled by each witness search. Lower values speed up the
+            preprocessing at the cost of adding unnecessary shortcuts (which never affect the correctness).
+        :return: A contraction hierarchy instance.
+        """
+        successors = {node: dict() for node in graph.nodes}
+        predecessors = {node: dict() for node in graph.nodes}
+        edges = graph.edges(data=weight, default=1.0)
+        if not graph.is_directed():
+            edges = list(edges) + [(v, u, w) for u, v, w in edges]
+        for u, v, w in edges:
+            if u == v or w >= successors[u].get(v, MAX_FLOAT):
+                continue
+            successors[u][v] = w
+            predecessors[v][u] = w
+
+        contracted_neighbors = dict.fromkeys(graph.nodes, 0)
+        queue = list()
+        for idx, node in enumerate(graph.nodes):
+            shortcuts = cls._shortcuts(node, successors, predecessors, witness_limit)
+            priority = cls._priority(node, shortcuts, successors, predecessors, contracted_neighbors)
+            queue.append((priority, idx, node))
+        queue.sort()
+
+        nodes, upward, downward = list(), dict(), dict()
+        counter = len(queue)
+        while queue:
+            _, _, node = heappop(queue)
+            shortcuts = cls._shortcuts(node, successors, predecessors, witness_limit)
+            priority = cls._priority(node, shortcuts, successors, predecessors, contracted_neighbors)
+            if queue and priority > queue[0][0]:
+                heappush(queue, (priority, counter, node))
+                counter += 1
+                continue
+
+            nodes.append(node)
+            upward[node] = list(successors.pop(node).items())
+            downward[node] = list(predecessors.pop(node).items())
+            for neighbor, _ in upward[node]:
+                del predecessors[neighbor][node]
+                contracted_neighbors[neighbor] += 1
+            for neighbor, _ in downward[node]:
+                del successors[neighbor][node]
+                contracted_neighbors[neighbor] += 1
+
+            for u, v, w in shortcuts:
+                if w < successors[u].get(v, MAX_FLOAT):
+                    successors[u][v] = w
+                    predecessors[v][u] = w
+
+        ranks = {node: rank for rank, node in enumerate(nodes)}
+        return cls(nodes, cls._compress(nodes, ranks, upward), cls._compress(nodes, ranks, downward))
+
+    @staticmethod
+    def _compress(
+        nodes: List[Hashable], ranks: Dict[Hashable, int], edges: Dict[Hashable, List[Tuple[Hashable, float]]],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        indptr = np.cumsum([0] + [len(edges[node]) for node in nodes], dtype=np.int64)
+        indices = np.array([ranks[neighbor] for node in nodes for neighbor, _ in edges[node]], dtype=np.int64)
+        weights = np.array([weight for node in nodes for _, weight in edges[node]], dtype=np.float64)
+        return indptr, indices, weights
+
+    @staticmethod
+    def _priority(
+        node: Hashable,
+        shortcuts: List[Tuple[Hashable, Hashable, float]],
+        successors: Dict[Hashable, Dict[Hashable, float]],
+        predecessors: Dict[Hashable, Dict[Hashable, float]],
+        contracted_neighbors: Dict[Hashable, int],
+    ) -> int:
+        edge_difference = len(shortcuts) - len(successors[node]) - len(predecessors[node])
+        return edge_difference + contracted_neighbors[node]
+
+    @staticmethod
+    def _shortcuts(
+        node: Hashable,
+        successors: Dict[Hashable, Dict[Hashable, float]],
+        predecessors: Dict[Hashable, Dict[Hashable, float]],
+        witness_limit: int,
+    ) -> List[Tuple[Hashable, Hashable, float]]:
+        shortcuts = list()
+        outgoing = successors[node]
+        if not outgoing:
+            return shortcuts
+        max_outgoing = max(outgoing.values())
+        for source, incoming_weight in predecessors[node].items():
+            limit = incoming_weight + max_outgoing
+
+            distances = {source: 0.0}
+            queue = [(0.0, 0, source)]
+            settled, counter = 0, 1
+            while queue and settled < witness_limit:
+                distance, _, current = heappop(queue)
+                if distance > limit:
+                    break
+                if distance > distances[current]:
+                    continue
+                settled += 1
+                for neighbor, weight in successors[current].items():
+                    if neighbor == node:
+                        continue
+                    candidate = distance + weight
+                    if candidate < distances.get(neighbor, MAX_FLOAT):
+                        distances[neighbor] = candidate
+                        heappush(queue, (candidate, counter, neighbor))
+                        counter += 1
+
+            for target, outgoing_weight in outgoing.items():
+                if target == source:
+                    continue
+                weight = incoming_weight + outgoing_weight
+                if distances.get(target, MAX_FLOAT) <= weight:
+                    continue
+                shortcuts.append((source, target, weight))
+        return shortcuts
+
+    def query(self, source: Hashable, target: Hashable) -> float:
+        """
+        Computes the shortest path length between two nodes.
+
+        :param source: The origin node.
+        :param target: The destination node.
+        :return: The shortest path length, or ``MAX_FLOAT`` if the target is not reachable.
+        """
+        if source == target:
+            return 0.0
+
+        forward = self._search(self.upward, self.ranks[source])
+        backward = self._search(self.downward, self.ranks[target])
+        best = float(np.min(forward + backward))
+        if not best < MAX_FLOAT:
+            return MAX_FLOAT
+        return best
+
+    @staticmethod
+    def _search(edges: Tuple[np.ndarray, np.ndarray, np.ndarray], rank: int) -> np.ndarray:
+        indptr, indices, weights = edges
+        distances = np.full(len(indptr) - 1, np.inf)
+        distances[rank] = 0.0
+
+        frontier = np.array([rank], dtype=np.int64)
+        while len(frontier):
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            total = counts.sum()
+            if not total:
+                break
+            positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+            neighbors = indices[positions]
+            candidates = np.repeat(distances[frontier], counts) + weights[positions]
+
+            improved = candidates < distances[neighbors]
+            neighbors, candidates = neighbors[improved], candidates[improved]
+            order = np.argsort(candidates, kind="stable")
+            frontier, first = np.unique(neighbors[order], return_index=True)
+            distances[frontier] = candidates[order][first]
+        return distances
+
+    def save(self, path: Path) -> None:
+        """
+        Stores the hierarchy on disk as a ``numpy`` archive, with the edges in compressed sparse row format.
+
+        The nodes are encoded as JSON, so they must be numbers, strings or (nested) tuples of them.
+
+        :param path: The path of the file.
+        """
+        arrays = {"nodes": np.array(json.dumps(self.nodes))}
+        for name, edges in (("upward", self.upward), ("downward", self.downward)):
+            for suffix, array in zip(("indptr", "indices", "weights"), edges):
+                arrays[f"{name}_{suffix}"] = array
+
+        with Path(path).open("wb") as file:
+            np.savez(file, **arrays)
+
+    @classmethod
+    def load(cls, path: Path) -> ContractionHierarchy:
+        """
+        Loads a hierarchy previously stored on disk.
+
+        The file is read without unpickling any object, so it cannot run arbitrary code.
+
+        :param path: The path of the file.
+        :return: A contraction hierarchy instance.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            nodes = [_as_node(node) for node in json.loads(str(data["nodes"]))]
+            edges = [
+                tuple(data[f"{name}_{suffix}"] for suffix in ("indptr", "indices", "weights"))
+                for name in ("upward", "downward")
+            ]
+        return cls(nodes, *edges)
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self.ranks
+
+    def __len__(self) -> int:
+        return len(self.ranks)
+
+    def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
+        yield from (
+            ("nodes_count", len(self.ranks)),
+            ("edges_count", len(self.upward[1])),
+        )
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{key}={value}" for key, value in self)
+        return f"{self.__class__.__name__}({values})"
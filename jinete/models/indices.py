@@ -0,0 +1,276 @@
+"""
+Contains the spatio-temporal index over trips, used to select the neighborhood of trips that are worth evaluating.
+"""
+
+from __future__ import (
+    annotations,
+)
+
+import logging
+from heapq import (
+    heapify,
+    heappop,
+    heappush,
+    heapreplace,
+    nsmallest,
+)
+from math import (
+    floor,
+)
+from typing import (
+    TYPE_CHECKING,
+)
+
+from .constants import (
+    DistanceMetric,
+)
+from .surfaces import (
+    GeometricSurface,
+    TimeDependentSurface,
+)
+
+if TYPE_CHECKING:
+    from typing import (
+        Any,
+        Dict,
+        Generator,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Set,
+        Tuple,
+    )
+    from .positions import Position
+    from .trips import Trip
+
+logger = logging.getLogger(__name__)
+
+GRID_METRICS = (DistanceMetric.EUCLIDEAN, DistanceMetric.MANHATTAN)
+
+
+class TripIndex(object):
+    """
+    Indexes a set of trips by the position of their pickup (over a uniform grid) and their earliest pickup time (over
+    fixed size buckets), to retrieve the trips which can be picked up sooner from a given position and time.
+
+    The score of each trip is the time until its pickup service can start, this is, the maximum between the travel
+    time to its origin and the time until its ``origin_earliest``. The trips which cannot be reached before their
+    ``origin_latest`` are ranked after all the reachable ones. Each grid cell and bucket pair gives a lower bound of
+    the score of its trips, so they are visited in increasing bound order and the search stops as soon as the bound
+    exceeds the ``k``-th best score found.
+
+    The grid is only used on geometric surfaces with the Euclidean or Manhattan metrics, as the bounds rely on them.
+    Its distance bounds are converted into time bounds through the maximum ``speed`` of the surface. Otherwise, all
+    the trips are stored on a single cell and only the time buckets are considered.
+    """
+
+    __slots__ = (
+        "cell_size",
+        "speed",
+        "time_bucket_size",
+        "_cells",
+        "_keys",
+    )
+
+    cell_size: Optional[float]
+    """
+    The side length of the grid cells, or ``None`` if the grid is not used.
+    """
+
+    speed: float
+    """
+    The maximum distance travelled per time unit, so the grid distance bounds divided by it are time bounds.
+    """
+
+    time_bucket_size: float
+    """
+    The length of the earliest pickup time buckets.
+    """
+
+    _cells: Dict[Tuple[Tuple[int, ...], int], Set[Trip]]
+    _keys: Dict[Trip, Tuple[Tuple[int, ...], int]]
+
+    def __init__(
+        self,
+        trips: Iterable[Trip],
+        cell_size: float = None,
+        time_bucket_size: float = None,
+        occupancy: int = 8,
+        speed: float = None,
+    ):
+        """
+        Constructor of the class.
+
+        :param trips: The trips to be indexed.
+        :param cell_size: The side length of the grid cells. If ``None``, it is chosen to store about ``occupancy``
+            trips on each cell.
+        :param time_bucket_size: The length of the earliest pickup time buckets. If ``None``, it is equal to the time
+            needed to cross a cell or, if the grid is not used, it is chosen to store about ``occupancy`` trips on
+            each bucket.
+        :param occupancy: The expected number of trips per cell, used to choose the default sizes.
+        :param speed: The maximum distance travelled per time unit. If ``None``, it is the maximum speed of the
+            surface profiles on time dependent surfaces, or one otherwise (as the geometric surfaces measure times
+            and distances on the same units).
+        """
+        trips = list(trips)
+        if speed is None:
+            speed = self._default_speed(trips)
+
+        if self._use_grid(trips):
+            if cell_size is None:
+                cell_size = self._default_cell_size(trips, occupancy)
+        else:
+            cell_size = None
+
+        if time_bucket_size is None:
+            time_bucket_size = self._default_time_bucket_size(trips, cell_size, speed, occupancy)
+
+        self.cell_size = cell_size
+        self.speed = speed
+        self.time_bucket_size = time_bucket_size
+        self._cells = dict()
+        self._keys = dict()
+
+        for trip in trips:
+            self.add(trip)
+
+    @staticmethod
+    def _use_grid(trips: List[Trip]) -> bool:
+        if not trips:
+            return False
+        surface = trips[0].origin_position.surface
+        return isinstance(surface, GeometricSurface) and surface.metric in GRID_METRICS
+
+    @staticmethod
+    def _default_speed(trips: List[Trip]) -> float:
+        if not trips:
+            return 1.0
+        surface = trips[0].origin_position.surface
+        if not isinstance(surface, TimeDependentSurface):
+            return 1.0
+        profiles = [surface.default_profile, *surface.profiles.values()]
+        return max(profile.max_speed for profile in profiles)
+
+    @staticmethod
+    def _default_cell_size(trips: List[Trip], occupancy: int) -> float:
+        coordinates = [trip.origin_position.coordinates for trip in trips]
+        dimensions = len(coordinates[0])
+        extent = max(max(values) - min(values) for values in zip(*coordinates))
+        if extent <= 0:
+            return 1.0
+        cells_per_dimension = max(round((len(trips) / occupancy) ** (1 / dimensions)), 1)
+        return extent / cells_per_dimension
+
+    @staticmethod
+    def _default_time_bucket_size(trips: List[Trip], cell_size: Optional[float], speed: float, occupancy: int) -> float:
+        if cell_size is not None:
+            return cell_size / speed
+        earliest = [trip.origin_earliest for trip in trips]
+        if not earliest or max(earliest) <= min(earliest):
+            return 1.0
+        return (max(earliest) - min(earliest)) / max(round(len(trips) / occupancy), 1)
+
+    @staticmethod
+    def _cell(position: Position, cell_size: Optional[float]) -> Tuple[int, ...]:
+        if cell_size is None:
+            return ()
+        return tuple(floor(value / cell_size) for value in position.coordinates)
+
+    def add(self, trip: Trip) -> None:
+        """
+        Adds a trip to the index.
+
+        :param trip: The trip to be added.
+        """
+        key = (self._cell(trip.origin_position, self.cell_size), floor(trip.origin_earliest / self.time_bucket_size))
+        self._cells.setdefault(key, set()).add(trip)
+        self._keys[trip] = key
+
+    def remove(self, trip: Trip) -> None:
+        """
+        Removes a trip from the index.
+
+        :param trip: The trip to be removed.
+        """
+        key = self._keys.pop(trip)
+        cell = self._cells[key]
+        cell.remove(trip)
+        if not cell:
+            del self._cells[key]
+
+    def discard(self, trip: Trip) -> None:
+        """
+        Removes a trip from the index if it is present.
+
+        :param trip: The trip to be removed.
+        """
+        if trip in self._keys:
+            self.remove(trip)
+
+    def nearest(self, position: Position, now: float, k: int) -> List[Trip]:
+        """
+        Retrieves the ``k`` trips which can be picked up sooner departing from the given position and time.
+
+        :param position: The departure position.
+        :param now: The departure time.
+        :param k: The number of trips to be retrieved.
+        :return: A list of trips sorted by their score.
+        """
+        if not k > 0:
+            return list()
+
+        origin_cell = self._cell(position, self.cell_size)
+        queue = [(self._bound(origin_cell, cell, bucket, now), cell, bucket) for cell, bucket in self._cells]
+        heapify(queue)
+
+        scores = list()
+        best = list()
+        while queue:
+            bound, cell, bucket = heappop(queue)
+            if len(best) == k and -best[0] <= bound:
+                break
+            for trip in self._cells[cell, bucket]:
+                late, score = self._score(trip, position, now)
+                scores.append((late, score, len(scores), trip))
+                if late:
+                    continue
+                if len(best) < k:
+                    heappush(best, -score)
+                elif score < -best[0]:
+                    heapreplace(best, -score)
+
+        return [trip for *_, trip in nsmallest(k, scores)]
+
+    def _bound(self, origin_cell: Tuple[int, ...], cell: Tuple[int, ...], bucket: int, now: float) -> float:
+        gap = max((abs(a - b) - 1 for a, b in zip(origin_cell, cell)), default=0)
+        time_bound = gap * self.cell_size / self.speed if gap > 0 else 0.0
+        return max(time_bound, bucket * self.time_bucket_size - now)
+
+    @staticmethod
+    def _score(trip: Trip, position: Position, now: float) -> Tuple[bool, float]:
+        travel_time = position.time_to(trip.origin_position, now)
+        late = trip.origin_latest < now + travel_time
+        return late, max(travel_time, trip.origin_earliest - now)
+
+    def __contains__(self, trip: Trip) -> bool:
+        return trip in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[Trip]:
+        return iter(self._keys)
+
+    def _statistics(self) -> Generator[Tuple[str, Any], None, None]:
+        yield from (
+            ("trips_count", len(self._keys)),
+            ("cells_count", len(self._cells)),
+            ("cell_size", self.cell_size),
+            ("speed", self.speed),
+            ("time_bucket_size", self.time_bucket_size),
+        )
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{key}={value}" for key, value in self._statistics())
+        return f"{self.__class__.__name__}({values})"
@@ -9,6 +9,9 @@ from typing import (
 from .abc import (
     Model,
 )
+from .compatibilities import (
+    CompatibilityGraph,
+)
 from .objectives import (
     DialARideObjective,
     Objective,
@@ -27,9 +30,19 @@ if TYPE_CHECKING:
 
 
 class Job(Model):
+    __slots__ = (
+        "trips",
+        "objective_cls",
+        "_objective",
+        "_compatibility_graph",
+        "args",
+        "kwargs",
+    )
+
     trips: Set[Trip]
     objective_cls: Type[Objective]
     _objective: Optional[Objective]
+    _compatibility_graph: Optional[CompatibilityGraph]
 
     def __init__(self, trips: Set[Trip], objective_cls: Type[Objective], *args, **kwargs):
         """
@@ -45,6 +58,7 @@ class Job(Model):
         self.trips = trips
         self.objective_cls = objective_cls
         self._objective = None
+        self._compatibility_graph = None
 
         self.args = args
         self.kwargs = kwargs
@@ -55,6 +69,17 @@ class Job(Model):
             self._objective = self.objective_cls(*self.args, **self.kwargs)
         return self._objective
 
+    @property
+    def compatibility_graph(self) -> CompatibilityGraph:
+        """
+        Retrieves the graph of trip pairs which can never be served by the same vehicle, built on the first access.
+
+        :return: A compatibility graph instance.
+        """
+        if self._compatibility_graph is None:
+            self._compatibility_graph = CompatibilityGraph(self.trips)
+        return self._compatibility_graph
+
     def __deepcopy__(self, memo) -> Job:
         return self
 
@@ -112,6 +112,11 @@ class DialARideObjective(Objective):
         return len(tuple(route.trips)), -route.distance
 
     def _planned_trip_optimization_function(self, planned_trip: PlannedTrip) -> Tuple[float, ...]:
+        segment = planned_trip.segment
+        if segment is not None:
+            route, pickup_idx, delivery_idx = segment
+            return 1, -route.segment_distance(pickup_idx, delivery_idx)
+
         scoring = 0.0
         current = planned_trip.delivery
         while current != planned_trip.pickup and current.previous is not None:
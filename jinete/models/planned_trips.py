@@ -7,10 +7,6 @@ from typing import (
     TYPE_CHECKING,
 )
 
-from cached_property import (
-    cached_property,
-)
-
 from .abc import (
     Model,
 )
@@ -28,9 +24,11 @@ if TYPE_CHECKING:
     from typing import (
         Any,
         Generator,
+        Optional,
         Tuple,
     )
     from .positions import Position
+    from .routes import Route
     from .vehicles import Vehicle
 
 logger = logging.getLogger(__name__)
@@ -89,8 +87,26 @@ class PlannedTrip(Model):
     def distance(self) -> float:
         return self.trip.distance
 
+    @property
+    def segment(self) -> Optional[Tuple[Route, int, int]]:
+        route = self.delivery.route
+        if route is None:
+            return None
+        route.schedule.update()
+        if not self.delivery.bound:
+            return None
+        pickup_idx, delivery_idx = self.pickup.index, self.delivery.index
+        if pickup_idx is None or not pickup_idx < delivery_idx or route.stops[pickup_idx] is not self.pickup:
+            return None
+        return route, pickup_idx, delivery_idx
+
     @property
     def waiting_time(self) -> float:
+        segment = self.segment
+        if segment is not None:
+            route, pickup_idx, delivery_idx = segment
+            return route.segment_waiting_time(pickup_idx, delivery_idx)
+
         result = 0
         current = self.delivery
         while current != self.pickup:
@@ -100,6 +116,11 @@ class PlannedTrip(Model):
 
     @property
     def transit_time(self) -> float:
+        segment = self.segment
+        if segment is not None:
+            route, pickup_idx, delivery_idx = segment
+            return route.segment_transit_time(pickup_idx, delivery_idx)
+
         result = 0
         current = self.delivery
         while current != self.pickup:
@@ -119,9 +140,9 @@ class PlannedTrip(Model):
     def capacity(self):
         return self.trip.capacity
 
-    @cached_property
+    @property
     def feasible(self) -> bool:
-        assert self.pickup in self.delivery.all_previous
+        assert self.segment is not None or self.pickup in self.delivery.all_previous
         assert self.pickup_time <= self.delivery_time
 
         if not self.pickup.feasible:
@@ -150,7 +171,3 @@ class PlannedTrip(Model):
             ("delivery", self.delivery),
             ("feasible", self.feasible),
         )
-
-    def flush(self) -> None:
-        for key in ("feasible",):
-            self.__dict__.pop(key, None)
@@ -30,6 +30,8 @@ if TYPE_CHECKING:
         Any,
         Iterator,
         Generator,
+        Iterable,
+        Optional,
         Tuple,
     )
     from .routes import Route
@@ -42,10 +44,19 @@ logger = logging.getLogger(__name__)
 
 
 class Planning(Model):
-    routes: Set[Route]
+    __slots__ = (
+        "uuid",
+        "_routes",
+        "_routes_by_vehicle",
+        "_routes_by_trip",
+    )
+
     uuid: UUID
+    _routes: Set[Route]
+    _routes_by_vehicle: Dict[Vehicle, Route]
+    _routes_by_trip: Dict[Trip, Route]
 
-    def __init__(self, routes: Set[Route] = None, uuid: UUID = None):
+    def __init__(self, routes: Iterable[Route] = None, uuid: UUID = None):
         if uuid is None:
             uuid = uuid4()
         if routes is None:
@@ -54,6 +65,70 @@ class Planning(Model):
         self.routes = routes
         self.uuid = uuid
 
+    @property
+    def routes(self) -> Set[Route]:
+        return self._routes
+
+    @routes.setter
+    def routes(self, routes: Iterable[Route]) -> None:
+        self._routes = set(routes)
+        self._routes_by_vehicle = dict()
+        self._routes_by_trip = dict()
+        for route in self._routes:
+            self._index_route(route)
+
+    @property
+    def vehicle_routes(self) -> Dict[Vehicle, Route]:
+        """
+        The route performed by each vehicle. It must not be modified directly, but through ``set_route``.
+
+        :return: A dictionary of routes by vehicle.
+        """
+        return self._routes_by_vehicle
+
+    def set_route(self, route: Route) -> Optional[Route]:
+        """
+        Replaces the route performed by the vehicle of the given one (or adds it if there is none), updating the
+        indices with the trips of both routes.
+
+        The indices are only maintained by this method and the ``routes`` setter, so the routes of the planning must
+        be replaced instead of being modified in place.
+
+        :param route: The new route.
+        :return: The replaced route, if any.
+        """
+        old_route = self._routes_by_vehicle.get(route.vehicle)
+        if old_route is not None:
+            self._routes.discard(old_route)
+            self._unindex_route(old_route)
+        self._routes.add(route)
+        self._index_route(route)
+        return old_route
+
+    def get_route(self, trip: Trip) -> Optional[Route]:
+        return self._routes_by_trip.get(trip)
+
+    def get_vehicle(self, trip: Trip) -> Optional[Vehicle]:
+        route = self.get_route(trip)
+        if route is None:
+            return None
+        return route.vehicle
+
+    def contains_trip(self, trip: Trip) -> bool:
+        return trip in self._routes_by_trip
+
+    def _index_route(self, route: Route) -> None:
+        self._routes_by_vehicle[route.vehicle] = route
+        for trip in route.trips:
+            self._routes_by_trip[trip] = route
+
+    def _unindex_route(self, route: Route) -> None:
+        if self._routes_by_vehicle.get(route.vehicle) is route:
+            del self._routes_by_vehicle[route.vehicle]
+        for trip in route.trips:
+            if self._routes_by_trip.get(trip) is route:
+                del self._routes_by_trip[trip]
+
     @property
     def loaded_routes(self):
         return set(route for route in self.routes if route.loaded)
@@ -21,6 +21,8 @@ from .abc import (
 
 if TYPE_CHECKING:
     from typing import (
+        Hashable,
+        Optional,
         Tuple,
         Sequence,
         Generator,
@@ -37,13 +39,33 @@ class Position(Model, ABC):
     Represents a point on the ``Surface`` to which belongs.
     """
 
-    def __init__(self, surface: Surface):
+    __slots__ = (
+        "surface",
+        "index",
+    )
+
+    surface: Surface
+    """
+    The surface to which the position belongs.
+    """
+
+    index: Optional[int]
+    """
+    The dense integer identifier of the position on its surface, or ``None`` if it has not been interned.
+    """
+
+    def __init__(self, surface: Surface, index: int = None):
         """
         Constructor of the class.
 
         :param surface: The surface to which the position belongs.
+        :param index: The dense integer identifier of the position on its surface.
         """
         self.surface = surface
+        self.index = index
+
+    def _interned_with(self, other: Position) -> bool:
+        return self.index is not None and other.index is not None and self.surface is other.surface
 
     def distance_to(self, other: Position) -> float:
         """
@@ -84,7 +106,10 @@ class GeometricPosition(Position):
     Represents a geometric point on the ``Surface`` to which belongs.
     """
 
-    __slots__ = ("coordinates",)
+    __slots__ = (
+        "coordinates",
+        "_hash",
+    )
 
     coordinates: Tuple[float, ...]
     """
@@ -99,15 +124,23 @@ class GeometricPosition(Position):
         """
         super().__init__(*args, **kwargs)
         self.coordinates = tuple(coordinates)
+        self._hash = hash(self.coordinates)
+
+    def __reduce__(self):
+        return self.__class__, (self.coordinates, self.surface, self.index)
 
     def __hash__(self):
-        return hash(self.coordinates)
+        return self._hash
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if self._interned_with(other):
+            return False
         return self.coordinates == other.coordinates
 
     def __ne__(self, other) -> bool:
-        return self.coordinates != other.coordinates
+        return not self == other
 
     def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
         yield from (("coordinates", self.coordinates),)
@@ -118,3 +151,91 @@ class GeometricPosition(Position):
 
     def __getitem__(self, item):
         return self.coordinates[item]
+
+
+class MatrixPosition(Position):
+    """
+    Represents a node of a ``MatrixSurface``, whose distances and times are given by precomputed matrices.
+    """
+
+    __slots__ = ("node",)
+
+    node: int
+    """
+    The row (and column) of the position on the surface's matrices.
+    """
+
+    def __init__(self, node: int, *args, **kwargs):
+        """
+        :param node: The row (and column) of the position on the surface's matrices.
+        :param args: Additional positional parameters.
+        :param kwargs: Additional named parameters.
+        """
+        super().__init__(*args, **kwargs)
+        self.node = node
+
+    @property
+    def coordinates(self) -> Tuple[int]:
+        return (self.node,)
+
+    def __reduce__(self):
+        return self.__class__, (self.node, self.surface, self.index)
+
+    def __hash__(self):
+        return self.node
+
+    def __eq__(self, other) -> bool:
+        return self is other or (self.surface is other.surface and self.node == other.node)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
+        yield from (("node", self.node),)
+
+    def __str__(self):
+        return f"({self.node})"
+
+
+class GraphPosition(Position):
+    """
+    Represents a node of a ``GraphSurface``, whose distances and times are given by shortest paths over a graph.
+    """
+
+    __slots__ = ("node",)
+
+    node: Hashable
+    """
+    The identifier of the position on the surface's graph.
+    """
+
+    def __init__(self, node: Hashable, *args, **kwargs):
+        """
+        :param node: The identifier of the position on the surface's graph.
+        :param args: Additional positional parameters.
+        :param kwargs: Additional named parameters.
+        """
+        super().__init__(*args, **kwargs)
+        self.node = node
+
+    @property
+    def coordinates(self) -> Tuple[Hashable]:
+        return (self.node,)
+
+    def __reduce__(self):
+        return self.__class__, (self.node, self.surface, self.index)
+
+    def __hash__(self):
+        return hash(self.node)
+
+    def __eq__(self, other) -> bool:
+        return self is other or (self.surface is other.surface and self.node == other.node)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
+        yield from (("node", self.node),)
+
+    def __str__(self):
+        return f"({self.node})"
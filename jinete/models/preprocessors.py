@@ -0,0 +1,182 @@
+"""
+Contains the preprocessing of problem instances, which tightens their time windows and finds their infeasible arcs.
+"""
+
+from __future__ import (
+    annotations,
+)
+
+import logging
+from itertools import (
+    permutations,
+)
+from typing import (
+    TYPE_CHECKING,
+)
+
+import numpy as np
+
+from .compatibilities import (
+    feasible_sequence,
+)
+from .constants import (
+    ERROR_BOUND,
+    MAX_FLOAT,
+    MIN_FLOAT,
+)
+
+if TYPE_CHECKING:
+    from typing import (
+        Any,
+        Generator,
+        Optional,
+        Set,
+        Tuple,
+    )
+    from .jobs import Job
+    from .trips import Trip
+    from .vehicles import Fleet
+
+    Node = Tuple[Trip, bool]
+
+logger = logging.getLogger(__name__)
+
+
+class JobPreprocessor(object):
+    """
+    Applies the preprocessing proposed by Cordeau (2006) for the dial-a-ride problem to a job and the fleet which
+    serves it.
+
+    The time windows of each trip are tightened with the travel times from the nearest depot, towards the farthest
+    depot and between its own pickup and delivery (departing from the depots at their earliest time, as the
+    schedules do), and then frozen on the trip (see ``Trip.tighten``), so they are
+    no longer recomputed on each access.
+
+    The infeasible arcs are the pairs of nodes (a pickup or a delivery, represented as a trip and a flag which
+    indicates if it is the pickup) which can never be visited consecutively by a vehicle, either because of the time
+    windows or because of the pairing and ride time constraints of their trips. As they are quadratic on the number
+    of trips, they are only computed on their first access (commonly by the exact models).
+    """
+
+    __slots__ = (
+        "job",
+        "fleet",
+        "_infeasible_arcs",
+    )
+
+    job: Job
+    fleet: Fleet
+    _infeasible_arcs: Optional[Set[Tuple[Node, Node]]]
+
+    def __init__(self, job: Job, fleet: Fleet):
+        """
+        Constructor of the class.
+
+        :param job: The job to be preprocessed.
+        :param fleet: The fleet which serves the job.
+        """
+        self.job = job
+        self.fleet = fleet
+        self._infeasible_arcs = None
+
+    def tighten(self) -> None:
+        """
+        Tightens the time windows of the job's trips.
+        """
+        trips = list(self.job.trips)
+        if not trips or not self.fleet.vehicles:
+            return
+        surface = trips[0].origin_position.surface
+        n = len(trips)
+
+        origins = [trip.origin_position for trip in trips]
+        earliest_arrivals = np.full(n, MAX_FLOAT)
+        for position, departure_time in {
+            (vehicle.origin_position, vehicle.origin_earliest) for vehicle in self.fleet.vehicles
+        }:
+            arrival_times = departure_time + surface.time_many([position] * n, origins, now=departure_time)
+            np.minimum(earliest_arrivals, arrival_times, out=earliest_arrivals)
+
+        destinations = [trip.destination_position for trip in trips]
+        latest_departures = np.full(n, MIN_FLOAT)
+        for position, latest in {
+            (vehicle.destination_position, vehicle.destination_latest) for vehicle in self.fleet.vehicles
+        }:
+            departure_times = latest - surface.time_many(destinations, [position] * n)
+            np.maximum(latest_departures, departure_times, out=latest_departures)
+
+        unserviceable = 0
+        for trip, arrival_time, departure_time in zip(trips, earliest_arrivals.tolist(), latest_departures.tolist()):
+            origin_earliest = max(trip.origin_earliest, arrival_time)
+            destination_latest = min(trip.destination_latest, departure_time - trip.destination_duration)
+            origin_latest = min(trip.origin_latest, destination_latest - trip.origin_duration - trip.direct_time)
+            destination_earliest = max(
+                trip.destination_earliest, origin_earliest + trip.origin_duration + trip.direct_time,
+            )
+            origin_earliest = max(origin_earliest, destination_earliest - trip.origin_duration - trip.timeout)
+            destination_latest = min(destination_latest, origin_latest + trip.origin_duration + trip.timeout)
+            trip.tighten(origin_earliest, origin_latest, destination_earliest, destination_latest)
+
+            if not trip.origin_earliest <= trip.origin_latest + ERROR_BOUND:
+                unserviceable += 1
+
+        if unserviceable > 0:
+            logger.warning(f"Found {unserviceable} trips which cannot be served by any vehicle.")
+
+    @property
+    def infeasible_arcs(self) -> Set[Tuple[Node, Node]]:
+        """
+        Retrieves the pairs of nodes which can never be visited consecutively, computed on the first access.
+
+        :return: A set of ``(source, target)`` node pairs.
+        """
+        if self._infeasible_arcs is None:
+            self._infeasible_arcs = self._find_infeasible_arcs()
+        return self._infeasible_arcs
+
+    def _find_infeasible_arcs(self) -> Set[Tuple[Node, Node]]:
+        trips = list(self.job.trips)
+        arcs = set()
+        if not trips:
+            return arcs
+        surface = trips[0].origin_position.surface
+
+        nodes = [(trip, True) for trip in trips] + [(trip, False) for trip in trips]
+        positions = [trip.origin_position for trip in trips] + [trip.destination_position for trip in trips]
+        latest = [trip.origin_latest for trip in trips] + [trip.destination_latest for trip in trips]
+        latest = np.array(latest) + ERROR_BOUND
+        departure_times = [trip.origin_earliest + trip.origin_duration for trip in trips]
+        departure_times += [trip.destination_earliest + trip.destination_duration for trip in trips]
+
+        for source, position, departure_time in zip(nodes, positions, departure_times):
+            arrival_times = departure_time + surface.time_many([position] * len(nodes), positions, now=departure_time)
+            for idx in np.flatnonzero(latest < arrival_times).tolist():
+                if nodes[idx] is not source:
+                    arcs.add((source, nodes[idx]))
+
+        for trip in trips:
+            arcs.add(((trip, False), (trip, True)))
+
+        for a, b in permutations(trips, 2):
+            pickup_a, delivery_a, pickup_b, delivery_b = (a, True), (a, False), (b, True), (b, False)
+            crossed = feasible_sequence((pickup_a, pickup_b, delivery_a, delivery_b))
+            if not feasible_sequence((pickup_b, pickup_a, delivery_b, delivery_a)):
+                arcs.add((pickup_a, delivery_b))
+            if not feasible_sequence((pickup_a, delivery_a, pickup_b, delivery_b)):
+                arcs.add((delivery_a, pickup_b))
+            if not (crossed or feasible_sequence((pickup_a, pickup_b, delivery_b, delivery_a))):
+                arcs.add((pickup_a, pickup_b))
+            if not (crossed or feasible_sequence((pickup_b, pickup_a, delivery_a, delivery_b))):
+                arcs.add((delivery_a, delivery_b))
+
+        return arcs
+
+    def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
+        yield from (
+            ("trips_count", len(self.job.trips)),
+            ("vehicles_count", len(self.fleet.vehicles)),
+        )
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{key}={value}" for key, value in self)
+        return f"{self.__class__.__name__}({values})"
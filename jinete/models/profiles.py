@@ -0,0 +1,138 @@
+"""
+Contains the representation of time dependent travel speeds, used to model congestion effects like rush hours.
+"""
+
+from __future__ import (
+    annotations,
+)
+
+import logging
+from bisect import (
+    bisect_right,
+)
+from typing import (
+    TYPE_CHECKING,
+)
+
+from .constants import (
+    MAX_FLOAT,
+)
+
+if TYPE_CHECKING:
+    from typing import (
+        Any,
+        Generator,
+        Optional,
+        Sequence,
+        Tuple,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+class SpeedProfile(object):
+    """
+    Represents a piecewise constant travel speed over time, in which the ``k``-th speed applies from the ``k``-th
+    breakpoint until the next one (or forever if it is the last one and there is no ``period``).
+
+    The travel time is obtained by moving across the time intervals at their own speed, so the resulting travel time
+    function is piecewise linear over the departure time and respects the FIFO property (departing later never
+    implies arriving earlier).
+    """
+
+    __slots__ = (
+        "breakpoints",
+        "speeds",
+        "period",
+    )
+
+    breakpoints: Tuple[float, ...]
+    """
+    The starting times of each interval, beginning on zero.
+    """
+
+    speeds: Tuple[float, ...]
+    """
+    The speed factors of each interval, relative to the surface's distance per time unit.
+    """
+
+    period: Optional[float]
+    """
+    The length of the period after which the profile is repeated (like a day), or ``None`` if it is not periodic.
+    """
+
+    def __init__(self, breakpoints: Sequence[float], speeds: Sequence[float], period: float = None):
+        """
+        Constructor of the class.
+
+        :param breakpoints: The starting times of each interval, beginning on zero.
+        :param speeds: The speed factors of each interval.
+        :param period: The length of the period after which the profile is repeated.
+        """
+        breakpoints, speeds = tuple(breakpoints), tuple(speeds)
+        if not len(breakpoints) == len(speeds) or not len(breakpoints) > 0:
+            raise ValueError("The breakpoints and the speeds must be non-empty and have the same length.")
+        if not breakpoints[0] == 0 or any(a >= b for a, b in zip(breakpoints, breakpoints[1:])):
+            raise ValueError("The breakpoints must begin on zero and be strictly increasing.")
+        if not all(speed > 0 for speed in speeds):
+            raise ValueError("The speeds must be strictly positive.")
+        if period is not None and not breakpoints[-1] < period:
+            raise ValueError("The breakpoints must be contained on the period.")
+
+        self.breakpoints = breakpoints
+        self.speeds = speeds
+        self.period = period
+
+    @property
+    def max_speed(self) -> float:
+        """
+        The maximum speed of the profile, used to obtain a lower bound of the travel times.
+
+        :return: A speed factor.
+        """
+        return max(self.speeds)
+
+    def travel_time(self, distance: float, departure_time: float) -> float:
+        """
+        Computes the time needed to travel the given distance departing at the given time.
+
+        :param distance: The distance to be travelled.
+        :param departure_time: The departure time.
+        :return: The travel time.
+        """
+        offset = 0.0
+        if self.period is not None:
+            offset = (departure_time // self.period) * self.period
+        idx = max(bisect_right(self.breakpoints, departure_time - offset) - 1, 0)
+
+        current_time = departure_time
+        while True:
+            speed = self.speeds[idx]
+            if idx + 1 < len(self.breakpoints):
+                end = offset + self.breakpoints[idx + 1]
+            elif self.period is not None:
+                end = offset + self.period
+            else:
+                end = MAX_FLOAT
+
+            arrival_time = current_time + distance / speed
+            if arrival_time <= end:
+                return arrival_time - departure_time
+
+            distance -= speed * (end - current_time)
+            current_time = end
+            idx += 1
+            if idx == len(self.breakpoints):
+                idx = 0
+                offset += self.period
+
+    def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
+        yield from (
+            ("breakpoints", self.breakpoints),
+            ("speeds", self.speeds),
+            ("period", self.period),
+        )
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{key}={value}" for key, value in self)
+        return f"{self.__class__.__name__}({values})"
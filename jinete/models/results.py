@@ -36,6 +36,12 @@ if TYPE_CHECKING:
 
 
 class Result(Model):
+    __slots__ = (
+        "algorithm",
+        "planning",
+        "computation_time",
+    )
+
     def __init__(self, algorithm: Algorithm, planning: Planning, computation_time: float):
         self.algorithm = algorithm
         self.planning = planning
@@ -4,9 +4,6 @@ from __future__ import (
 
 import itertools as it
 import logging
-from copy import (
-    deepcopy,
-)
 from functools import (
     reduce,
 )
@@ -17,10 +14,6 @@ from typing import (
     TYPE_CHECKING,
 )
 
-from cached_property import (
-    cached_property,
-)
-
 from ..exceptions import (
     PreviousStopNotInRouteException,
 )
@@ -33,6 +26,9 @@ from .constants import (
 from .planned_trips import (
     PlannedTrip,
 )
+from .schedules import (
+    Schedule,
+)
 from .stops import (
     Stop,
 )
@@ -58,14 +54,20 @@ class Route(Model):
     __slots__ = (
         "vehicle",
         "stops",
+        "_schedule",
+        "_planned_trips",
     )
 
     vehicle: Vehicle
     stops: List[Stop]
+    _schedule: Schedule
+    _planned_trips: Dict[Trip, PlannedTrip]
 
     def __init__(self, vehicle: Vehicle, stops: List[Stop] = None):
 
         self.vehicle = vehicle
+        self._schedule = Schedule(self)
+        self._planned_trips = dict()
 
         if stops is None:
             first = Stop(self.vehicle, self.vehicle.origin_position, None)
@@ -77,14 +79,12 @@ class Route(Model):
         else:
             self.stops = list(stops)
 
-    def __deepcopy__(self, memo: Dict[int, Any]) -> Route:
-        vehicle = deepcopy(self.vehicle, memo)
+        for stop in self.stops:
+            self._index_stop(stop)
 
-        route = Route(vehicle)
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Route:
+        route = self.clone()
         memo[id(self)] = route
-
-        route.stops = deepcopy(self.stops, memo)
-
         return route
 
     def clone(self, idx: int = 0) -> Route:
@@ -119,11 +119,16 @@ class Route(Model):
     def feasible_planned_trips(self) -> bool:
         return reduce(and_, (planned_trip.feasible for planned_trip in self.planned_trips), True)
 
-    @cached_property
+    @property
+    def schedule(self) -> Schedule:
+        self._schedule.update()
+        return self._schedule
+
+    @property
     def feasible(self) -> bool:
         if not self.first_stop.position == self.vehicle.origin_position:
             return False
-        if not self.vehicle.origin_earliest - ERROR_BOUND <= self.first_stop.arrival_time:
+        if not self.vehicle.origin_earliest - ERROR_BOUND <= self.first_arrival_time:
             return False
         if not self.last_position == self.vehicle.destination_position:
             return False
@@ -131,17 +136,44 @@ class Route(Model):
             return False
         if not self.duration <= self.vehicle.timeout + ERROR_BOUND:
             return False
-        if not self.feasible_planned_trips:
+        if not self.schedule.feasible:
             return False
         return True
 
-    def flush(self):
-        self.__dict__.pop("feasible", None)
+    def feasible_insertion(self, trip: Trip, previous_idx: int, following_idx: int) -> bool:
+        return self.schedule.feasible_insertion(trip, previous_idx, following_idx)
 
-        for stop in self.stops:
-            stop.flush()
-        for planned_trip in self.planned_trips:
-            planned_trip.flush()
+    def flush(self, idx: int = 0) -> None:
+        self._schedule.flush(idx)
+
+    def get_planned_trip(self, trip: Trip) -> Optional[PlannedTrip]:
+        return self._planned_trips.get(trip)
+
+    def contains_trip(self, trip: Trip) -> bool:
+        return trip in self._planned_trips
+
+    def get_stop_index(self, stop: Stop) -> int:
+        self._schedule.update()
+        idx = stop.index
+        if idx is None or not idx < len(self.stops) or self.stops[idx] is not stop:
+            idx = self.stops.index(stop)
+        return idx
+
+    def get_trip_indices(self, trip: Trip) -> Optional[Tuple[int, int]]:
+        planned_trip = self._planned_trips.get(trip)
+        if planned_trip is None:
+            return None
+        return self.get_stop_index(planned_trip.pickup), self.get_stop_index(planned_trip.delivery)
+
+    def _index_stop(self, stop: Stop) -> None:
+        for planned_trip in stop.planned_trips:
+            self._planned_trips[planned_trip.trip] = planned_trip
+
+    def _unindex_stop(self, stop: Stop) -> None:
+        for planned_trip in stop.planned_trips:
+            if self._planned_trips.get(planned_trip.trip) is not planned_trip:
+                continue
+            del self._planned_trips[planned_trip.trip]
 
     @property
     def loaded(self):
@@ -169,9 +201,13 @@ class Route(Model):
         assert stop.previous is None
         return stop
 
+    @property
+    def first_arrival_time(self) -> float:
+        return self.schedule.arrival_times[0]
+
     @property
     def first_departure_time(self) -> float:
-        return self.first_stop.departure_time
+        return self.schedule.departure_times[0]
 
     @property
     def last_stop(self) -> Stop:
@@ -180,7 +216,7 @@ class Route(Model):
 
     @property
     def last_departure_time(self) -> float:
-        return self.last_stop.departure_time
+        return self.schedule.departure_times[-1]
 
     @property
     def last_position(self) -> Position:
@@ -193,11 +229,11 @@ class Route(Model):
 
     @property
     def current_arrival_time(self) -> float:
-        return self.current_stop.arrival_time
+        return self.schedule.arrival_times[-2]
 
     @property
     def current_departure_time(self) -> float:
-        return self.current_stop.departure_time
+        return self.schedule.departure_times[-2]
 
     @property
     def current_position(self) -> Position:
@@ -213,11 +249,24 @@ class Route(Model):
 
     @property
     def waiting_time(self) -> float:
-        return sum((stop.waiting_time for stop in self.stops), 0.0)
+        if not self.stops:
+            return 0.0
+        return self.schedule.cumulative_waiting_times[-1]
 
     @property
     def distance(self) -> float:
-        return sum(stop.distance for stop in self.stops)
+        if not self.stops:
+            return 0.0
+        return self.schedule.cumulative_distances[-1]
+
+    def segment_distance(self, start: int, end: int) -> float:
+        return self.schedule.distance(start, end)
+
+    def segment_transit_time(self, start: int, end: int) -> float:
+        return self.schedule.transit_time(start, end)
+
+    def segment_waiting_time(self, start: int, end: int) -> float:
+        return self.schedule.waiting_time(start, end)
 
     @property
     def vehicle_identifier(self) -> Optional[str]:
@@ -250,9 +299,8 @@ class Route(Model):
             following_stop.previous = stop
 
         self.stops.insert(idx, stop)
-
-        for stop in self.stops[idx:]:
-            stop.flush()
+        self._schedule.shift(idx, 1)
+        self._index_stop(stop)
 
         return stop
 
@@ -264,9 +312,11 @@ class Route(Model):
             following_stop.previous = previous_stop
 
         removed_stop = self.stops.pop(idx)
+        self._schedule.shift(idx, -1)
+        self._unindex_stop(removed_stop)
 
-        for stop in self.stops[idx:]:
-            stop.flush()
+        if removed_stop.route is self:
+            removed_stop.route, removed_stop.index = None, None
         return removed_stop
 
     def append_planned_trip(self, planned_trip: PlannedTrip):
@@ -283,16 +333,13 @@ class Route(Model):
         logger.debug(f'Append trip with "{planned_trip.trip_identifier}" identifier to route.')
 
     def remove_trip(self, trip: Trip) -> None:
+        indices = self.get_trip_indices(trip)
+        assert indices is not None
 
-        old_len = len(self.stops)
-
-        for i in reversed(range(len(self.stops))):
-            stop = self.stops[i]
-            if trip not in stop.trips:
-                continue
-            self.remove_stop_at(i)
+        pickup_idx, delivery_idx = indices
+        self.remove_stop_at(delivery_idx)
+        self.remove_stop_at(pickup_idx)
 
-        assert old_len - 2 == len(self.stops)
         assert all(s1 == s2.previous for s1, s2 in zip(self.stops[:-1], self.stops[1:]))
         assert all(s1.departure_time <= s2.arrival_time for s1, s2 in zip(self.stops[:-1], self.stops[1:]))
 
@@ -325,20 +372,32 @@ class RouteCloner(object):
             self._initialize()
         return self._mapper
 
-    def _initialize(self) -> None:
-        idx = len(self.stops)
-        mapper = dict()
+    @staticmethod
+    def threshold(stops: List[Stop], desired_idx: int) -> int:
+        """
+        Finds the number of leading stops which can be shared by a clone whose stops are modified from the
+        ``desired_idx``-th one, this is, the largest prefix before it which contains both stops of all its trips.
+
+        :param stops: The stops of the route to be cloned.
+        :param desired_idx: The index of the first stop to be modified.
+        :return: The number of shared stops.
+        """
+        idx = len(stops)
         mismatches = set()
-        while (idx > 0) and (any(mismatches) or not idx < self.desired_idx):
+        while (idx > 0) and (any(mismatches) or not idx < desired_idx):
             idx -= 1
-
-            for planned_trip in self.stops[idx].delivery_planned_trips:
-                mapper[planned_trip] = PlannedTrip(planned_trip.vehicle, planned_trip.trip)
-
-            mismatches = (mismatches | self.stops[idx].delivery_planned_trips) - self.stops[idx].pickup_planned_trips
+            mismatches = (mismatches | stops[idx].delivery_planned_trips) - stops[idx].pickup_planned_trips
         if idx == 1:
             idx -= 1
         assert not any(mismatches)
+        return idx
+
+    def _initialize(self) -> None:
+        idx = self.threshold(self.stops, self.desired_idx)
+        mapper = dict()
+        for stop in self.stops[idx:]:
+            for planned_trip in stop.delivery_planned_trips:
+                mapper[planned_trip] = PlannedTrip(planned_trip.vehicle, planned_trip.trip)
         self._mapper = mapper
         self._idx = idx
 
@@ -363,14 +422,13 @@ class RouteCloner(object):
                 starting_time=stop._starting_time,
             )
 
-            new_stop.pickup_planned_trips = set(
-                self.map_pickup(new_stop, pickup) for pickup in stop.pickup_planned_trips
-            )
-            new_stop.delivery_planned_trips = set(
-                self.map_delivery(new_stop, delivery) for delivery in stop.delivery_planned_trips
-            )
+            for pickup in stop.pickup_planned_trips:
+                new_stop.append_pickup(self.map_pickup(new_stop, pickup))
+            for delivery in stop.delivery_planned_trips:
+                new_stop.append_delivery(self.map_delivery(new_stop, delivery))
 
             cloned_stops.append(new_stop)
 
         cloned_route = Route(self.vehicle, cloned_stops)
+        cloned_route._schedule = self.route.schedule.clone(cloned_route, threshold)
         return cloned_route
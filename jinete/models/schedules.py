@@ -0,0 +1,606 @@
+"""
+Contains the array-backed representation of the stops of a route.
+"""
+
+from __future__ import (
+    annotations,
+)
+
+import logging
+from array import (
+    array,
+)
+from weakref import (
+    WeakKeyDictionary,
+)
+from typing import (
+    TYPE_CHECKING,
+)
+
+from .constants import (
+    ERROR_BOUND,
+)
+
+if TYPE_CHECKING:
+    from typing import (
+        List,
+        Optional,
+        Set,
+        Tuple,
+    )
+    from .positions import Position
+    from .routes import Route
+    from .stops import Stop
+    from .trips import Trip
+
+logger = logging.getLogger(__name__)
+
+
+def propagate_stop(
+    previous_position: Position,
+    previous_departure_time: float,
+    previous_capacity: float,
+    position: Position,
+    starting_time: Optional[float],
+    earliest: float,
+    load_time: float,
+    load: float,
+) -> Tuple[float, float, float, float]:
+    """
+    Computes the times and the vehicle's load of a stop from the values of the previous one.
+
+    It is the step of every forward pass over the stops (the ones of the schedules, of the stops which are not bound
+    to any route and of the conjectured routes), so all of them obtain the same values.
+
+    :param previous_position: The position of the previous stop (or the vehicle's origin).
+    :param previous_departure_time: The departure time from the previous stop.
+    :param previous_capacity: The load of the vehicle after the previous stop.
+    :param position: The position of the stop.
+    :param starting_time: The fixed starting time of the stop, or ``None`` if it is not fixed.
+    :param earliest: The earliest time to start the services of the stop.
+    :param load_time: The time needed to perform the services of the stop.
+    :param load: The load variation due to the services of the stop.
+    :return: The arrival, starting and departure times of the stop, and the load of the vehicle after it.
+    """
+    arrival_time = previous_departure_time + previous_position.time_to(position, previous_departure_time)
+    if starting_time is None or starting_time < arrival_time:
+        starting_time = arrival_time
+    if starting_time < earliest:
+        starting_time = earliest
+    return arrival_time, starting_time, starting_time + load_time, previous_capacity + load
+
+
+class Schedule(object):
+    """
+    Represents the stops of a ``Route`` as a set of parallel arrays indexed by the position of each stop.
+
+    All the values are computed with a single iterative forward pass over the stops of the route, so the evaluations
+    performed over it are index lookups instead of recursive walks over the ``Stop.previous`` chain. Modifications
+    over the route only need to move back the dirty-from watermark, so the next forward pass starts from the first
+    modified stop instead of from the beginning.
+
+    The stops of a route are shared with its clones, so the schedules of both routes keep track of each other
+    (together with the shared prefix) and the flushes produced by the shared stops are forwarded to all of them.
+    """
+
+    __slots__ = (
+        "route",
+        "positions",
+        "earliest",
+        "latest",
+        "load_times",
+        "arrival_times",
+        "starting_times",
+        "departure_times",
+        "capacities",
+        "cumulative_distances",
+        "cumulative_transit_times",
+        "cumulative_waiting_times",
+        "_feasibles",
+        "_pending_pickups",
+        "_dirty_from",
+        "_forward_slacks",
+        "_downstream_capacities",
+        "_slacks_computed",
+        "_sharers",
+        "__weakref__",
+    )
+
+    route: Route
+    """
+    The route represented by the schedule.
+    """
+
+    positions: List[Position]
+    """
+    The position of each stop.
+    """
+
+    earliest: array
+    """
+    The earliest time to start the services of each stop.
+    """
+
+    latest: array
+    """
+    The latest time to start the services of each stop.
+    """
+
+    load_times: array
+    """
+    The time needed to perform the services of each stop.
+    """
+
+    arrival_times: array
+    """
+    The arrival time to each stop.
+    """
+
+    starting_times: array
+    """
+    The starting time of the services of each stop.
+    """
+
+    departure_times: array
+    """
+    The departure time from each stop.
+    """
+
+    capacities: array
+    """
+    The load of the vehicle after performing the services of each stop.
+    """
+
+    cumulative_distances: array
+    """
+    The distance travelled from the origin of the vehicle up to each stop.
+    """
+
+    cumulative_transit_times: array
+    """
+    The time spent travelling from the origin of the vehicle up to each stop.
+    """
+
+    cumulative_waiting_times: array
+    """
+    The sum of the waiting times from the first stop up to each stop (both included).
+    """
+
+    def __init__(self, route: Route):
+        """
+        Constructor of the class.
+
+        :param route: The route to be represented by the schedule.
+        """
+        self.route = route
+
+        self.positions = list()
+        self.earliest, self.latest, self.load_times = array("d"), array("d"), array("d")
+        self.arrival_times, self.starting_times, self.departure_times = array("d"), array("d"), array("d")
+        self.capacities = array("d")
+        self.cumulative_distances, self.cumulative_transit_times = array("d"), array("d")
+        self.cumulative_waiting_times = array("d")
+        self._feasibles = array("b")
+        self._pending_pickups = array("l")
+
+        self._dirty_from = 0
+        self._slacks_computed = False
+        self._sharers = None
+
+    def __len__(self) -> int:
+        self.update()
+        return len(self.positions)
+
+    def clone(self, route: Route, idx: int) -> Schedule:
+        """
+        Builds the schedule of a route which shares the first ``idx`` stops with the represented one.
+
+        :param route: The route to be represented by the new schedule.
+        :param idx: The number of shared stops.
+        :return: A schedule whose values are already computed up to the ``idx``-th stop.
+        """
+        self.update()
+
+        schedule = Schedule(route)
+        schedule.positions = self.positions[:idx]
+        schedule.earliest = self.earliest[:idx]
+        schedule.latest = self.latest[:idx]
+        schedule.load_times = self.load_times[:idx]
+        schedule.arrival_times = self.arrival_times[:idx]
+        schedule.starting_times = self.starting_times[:idx]
+        schedule.departure_times = self.departure_times[:idx]
+        schedule.capacities = self.capacities[:idx]
+        schedule.cumulative_distances = self.cumulative_distances[:idx]
+        schedule.cumulative_transit_times = self.cumulative_transit_times[:idx]
+        schedule.cumulative_waiting_times = self.cumulative_waiting_times[:idx]
+        schedule._feasibles = self._feasibles[:idx]
+        schedule._pending_pickups = self._pending_pickups[:idx]
+        schedule._dirty_from = idx
+
+        if idx > 0:
+            self._share(schedule, idx, idx)
+            schedule._share(self, idx, idx)
+        return schedule
+
+    def _share(self, schedule: Schedule, prefix: int, extent: int) -> None:
+        if self._sharers is None:
+            self._sharers = WeakKeyDictionary()
+        self._sharers[schedule] = [prefix, extent]
+
+    @property
+    def computed(self) -> bool:
+        """
+        Indicates if the arrays are up to date with the stops of the route.
+
+        :return: ``True`` if the arrays are up to date or ``False`` otherwise.
+        """
+        return self._dirty_from >= len(self.route.stops)
+
+    @property
+    def dirty_from(self) -> int:
+        """
+        The index of the first stop whose values are outdated.
+
+        :return: An index value.
+        """
+        return self._dirty_from
+
+    @property
+    def feasible(self) -> bool:
+        """
+        Indicates if all the stops and planned trips of the route satisfy their time window and capacity constraints.
+
+        :return: ``True`` if the route is feasible or ``False`` otherwise.
+        """
+        self.update()
+        if not self._feasibles:
+            return True
+        return bool(self._feasibles[-1]) and self._pending_pickups[-1] == 0
+
+    @property
+    def forward_slacks(self) -> array:
+        """
+        The maximum delay that the starting time of each stop can suffer without violating any time constraint of
+        the following stops (including the own stop and the vehicle's ones), following the Savelsbergh's definition.
+
+        :return: An array containing the forward time slack of each stop.
+        """
+        self._update_slacks()
+        return self._forward_slacks
+
+    @property
+    def downstream_capacities(self) -> array:
+        """
+        The maximum load of the vehicle from each stop to the end of the route.
+
+        :return: An array containing the maximum downstream load of each stop.
+        """
+        self._update_slacks()
+        return self._downstream_capacities
+
+    def flush(self, idx: int = 0, visited: Optional[Set[int]] = None) -> None:
+        """
+        Marks the values as outdated from the ``idx``-th stop, so they will be computed again on the next access.
+
+        The flush is also forwarded to the schedules which share the stop, starting from the same index if it is in
+        the shared prefix, or from the end of the prefix otherwise (as the stop may be placed in a different index).
+
+        :param idx: The index of the first outdated stop.
+        :param visited: The identifiers of the already flushed schedules.
+        """
+        if idx < self._dirty_from:
+            self._dirty_from = idx
+        self._slacks_computed = False
+
+        if not self._sharers:
+            return
+        if visited is None:
+            visited = set()
+        visited.add(id(self))
+        for schedule, (prefix, extent) in list(self._sharers.items()):
+            if idx >= extent or id(schedule) in visited:
+                continue
+            schedule.flush(min(idx, prefix), visited)
+
+    def shift(self, idx: int, offset: int) -> None:
+        """
+        Marks the values as outdated from the ``idx``-th stop after inserting or removing a stop in that index.
+
+        The change is not forwarded to the schedules which share the stops, as their stops are not modified, but the
+        shared prefix is shortened up to ``idx`` (and the shared region is moved by ``offset``).
+
+        :param idx: The index of the inserted or removed stop.
+        :param offset: ``1`` if the stop has been inserted or ``-1`` if it has been removed.
+        """
+        if idx < self._dirty_from:
+            self._dirty_from = idx
+        self._slacks_computed = False
+
+        if not self._sharers:
+            return
+        for schedule, bounds in list(self._sharers.items()):
+            prefix, extent = bounds
+            if idx > extent or (idx == extent and offset > 0):
+                continue
+            bounds[1] = extent + offset
+            if bounds[1] <= 0:
+                del self._sharers[schedule]
+                schedule._sharers.pop(self, None)
+                continue
+            if idx < prefix:
+                bounds[0] = idx
+                schedule._sharers[self][0] = idx
+
+    def bind(self) -> None:
+        """
+        Binds all the stops to the represented route, taking over the ones which are bound to any other route.
+
+        The stops are shared between a route and its clones, so each one is only bound by the first route which
+        computes it. When a clone replaces the original route (as when an insertion is accepted), it has to take over
+        the shared stops, so their flushes are forwarded to it and the replaced route is not kept alive by them.
+        """
+        self.update()
+        route = self.route
+        for idx, stop in enumerate(route.stops):
+            stop.route, stop.index = route, idx
+
+    def update(self) -> None:
+        """
+        Computes the outdated values, starting from the dirty-from watermark.
+        """
+        if self._dirty_from >= len(self.route.stops):
+            return
+        self._compute()
+
+    def _compute(self) -> None:
+        route = self.route
+        vehicle = route.vehicle
+        stops = route.stops
+        vehicle_capacity = vehicle.capacity
+
+        start = self._dirty_from
+
+        positions = self.positions
+        earliest, latest, load_times = self.earliest, self.latest, self.load_times
+        arrival_times, starting_times, departure_times = self.arrival_times, self.starting_times, self.departure_times
+        capacities, feasibles, pending_pickups = self.capacities, self._feasibles, self._pending_pickups
+        distances, transit_times = self.cumulative_distances, self.cumulative_transit_times
+        waiting_times = self.cumulative_waiting_times
+        for values in (
+            positions,
+            earliest,
+            latest,
+            load_times,
+            arrival_times,
+            starting_times,
+            departure_times,
+            capacities,
+            distances,
+            transit_times,
+            waiting_times,
+            feasibles,
+            pending_pickups,
+        ):
+            del values[start:]
+
+        if start == 0:
+            previous_position = vehicle.origin_position
+            previous_departure_time = vehicle.origin_earliest
+            previous_capacity = 0.0
+            distance, transit_time, waiting_time = 0.0, 0.0, 0.0
+            feasible, pending = True, 0
+        else:
+            previous_position = positions[-1]
+            previous_departure_time = departure_times[-1]
+            previous_capacity = capacities[-1]
+            distance, transit_time, waiting_time = distances[-1], transit_times[-1], waiting_times[-1]
+            feasible, pending = bool(feasibles[-1]), pending_pickups[-1]
+
+        for idx in range(start, len(stops)):
+            stop = stops[idx]
+            if stop.route is route or not stop.bound:
+                stop.route, stop.index = route, idx
+
+            position = stop.position
+            stop_earliest, stop_latest, load_time = stop.earliest, stop.latest, stop.load_time
+
+            arrival_time, starting_time, departure_time, capacity = propagate_stop(
+                previous_position,
+                previous_departure_time,
+                previous_capacity,
+                position,
+                stop._starting_time,
+                stop_earliest,
+                load_time,
+                stop.load,
+            )
+
+            if feasible:
+                feasible = (
+                    stop_earliest <= starting_time + ERROR_BOUND
+                    and starting_time <= stop_latest + ERROR_BOUND
+                    and capacity <= vehicle_capacity + ERROR_BOUND
+                )
+
+            for planned_trip in stop.delivery_planned_trips:
+                pickup_idx = self._find(planned_trip.pickup, idx)
+                if pickup_idx is None:
+                    feasible = False
+                    continue
+                pending -= 1
+                if feasible:
+                    duration = starting_time - departure_times[pickup_idx]
+                    feasible = duration <= planned_trip.timeout + ERROR_BOUND
+            pending += len(stop.pickup_planned_trips)
+
+            positions.append(position)
+            earliest.append(stop_earliest)
+            latest.append(stop_latest)
+            load_times.append(load_time)
+            arrival_times.append(arrival_time)
+            starting_times.append(starting_time)
+            departure_times.append(departure_time)
+            capacities.append(capacity)
+
+            distance += previous_position.distance_to(position)
+            transit_time += arrival_time - previous_departure_time
+            waiting_time += starting_time - arrival_time
+            distances.append(distance)
+            transit_times.append(transit_time)
+            waiting_times.append(waiting_time)
+
+            feasibles.append(feasible)
+            pending_pickups.append(pending)
+
+            previous_position = position
+            previous_departure_time = departure_time
+            previous_capacity = capacity
+
+        self._dirty_from = len(stops)
+        self._slacks_computed = False
+
+    def distance(self, start: int, end: int) -> float:
+        """
+        The distance travelled from the ``start``-th stop to the ``end``-th stop.
+
+        :param start: The index of the first stop of the segment.
+        :param end: The index of the last stop of the segment.
+        :return: A distance value.
+        """
+        self.update()
+        return self.cumulative_distances[end] - self.cumulative_distances[start]
+
+    def transit_time(self, start: int, end: int) -> float:
+        """
+        The time spent travelling from the ``start``-th stop to the ``end``-th stop.
+
+        :param start: The index of the first stop of the segment.
+        :param end: The index of the last stop of the segment.
+        :return: A time value.
+        """
+        self.update()
+        return self.cumulative_transit_times[end] - self.cumulative_transit_times[start]
+
+    def waiting_time(self, start: int, end: int) -> float:
+        """
+        The time spent waiting on the stops placed after the ``start``-th stop up to the ``end``-th stop (included).
+
+        :param start: The index of the first stop of the segment.
+        :param end: The index of the last stop of the segment.
+        :return: A time value.
+        """
+        self.update()
+        return self.cumulative_waiting_times[end] - self.cumulative_waiting_times[start]
+
+    def _find(self, stop: Stop, idx: int) -> Optional[int]:
+        stops = self.route.stops
+        if stop is None:
+            return None
+        candidate = stop.index
+        if candidate is not None and candidate < idx and stops[candidate] is stop:
+            return candidate
+        for candidate in range(idx):
+            if stops[candidate] is stop:
+                return candidate
+        return None
+
+    def _update_slacks(self) -> None:
+        self.update()
+        if self._slacks_computed:
+            return
+        self._compute_slacks()
+
+    def _compute_slacks(self) -> None:
+        vehicle = self.route.vehicle
+        n = len(self.positions)
+        latest, starting_times = self.latest, self.starting_times
+        arrival_times, departure_times = self.arrival_times, self.departure_times
+
+        forward_slacks = array("d", (0.0,)) * n
+        downstream_capacities = array("d", self.capacities)
+        if n > 0:
+            last_departure_time = departure_times[-1]
+            forward_slack = min(latest[-1] - starting_times[-1], vehicle.destination_latest - last_departure_time)
+            forward_slacks[-1] = forward_slack
+            for idx in reversed(range(n - 1)):
+                forward_slack = min(
+                    latest[idx] - starting_times[idx],
+                    starting_times[idx + 1] - arrival_times[idx + 1] + forward_slack,
+                )
+                forward_slacks[idx] = forward_slack
+                if downstream_capacities[idx] < downstream_capacities[idx + 1]:
+                    downstream_capacities[idx] = downstream_capacities[idx + 1]
+
+        self._forward_slacks = forward_slacks
+        self._downstream_capacities = downstream_capacities
+        self._slacks_computed = True
+
+    def feasible_insertion(self, trip: Trip, previous_idx: int, following_idx: int) -> bool:
+        """
+        Checks if inserting the trip into the route could be feasible, without building any new object.
+
+        The pickup is placed just after the ``previous_idx``-th stop and the delivery just before the
+        ``following_idx``-th stop. The check is performed in constant time (excluding some capacity checks) using the
+        forward time slacks, the cumulative waiting times and the maximum downstream loads. The ride time and the route
+        duration constraints are not considered (as the ride time improvements can delay the first stop, shortening
+        the route), so a ``True`` value is a necessary but not sufficient condition of feasibility.
+
+        The slacks assume that a delay on a stop delays the following ones by the same amount, which does not hold if
+        the travel times depend on the departure time, so in that case only the capacity and the pickup time window
+        are checked.
+
+        :param trip: The trip to be inserted.
+        :param previous_idx: The index of the stop after which the pickup is placed.
+        :param following_idx: The index of the stop before which the delivery is placed.
+        :return: ``False`` if the insertion is infeasible for sure or ``True`` otherwise.
+        """
+        assert previous_idx < following_idx
+        self._update_slacks()
+
+        if not self._feasible_insertion_capacity(trip.capacity, previous_idx, following_idx):
+            return False
+
+        positions, starting_times = self.positions, self.starting_times
+        forward_slacks = self._forward_slacks
+
+        origin, destination = trip.origin_position, trip.destination_position
+
+        departure_time = self.departure_times[previous_idx]
+        arrival_time = departure_time + positions[previous_idx].time_to(origin, departure_time)
+        starting_time = max(arrival_time, trip.origin_earliest)
+        if not starting_time <= trip.origin_latest + ERROR_BOUND:
+            return False
+        departure_time = starting_time + trip.origin_duration
+
+        if origin.surface.time_dependent:
+            return True
+
+        if previous_idx + 1 < following_idx:
+            following_position = positions[previous_idx + 1]
+            arrival_time = departure_time + origin.time_to(following_position, departure_time)
+            push = arrival_time - starting_times[previous_idx + 1]
+            if not push <= forward_slacks[previous_idx + 1] + ERROR_BOUND:
+                return False
+
+            waiting_time = self.waiting_time(previous_idx + 1, following_idx - 1)
+            push = max(push - waiting_time, 0.0)
+            departure_time = self.departure_times[following_idx - 1] + push
+            previous_position = positions[following_idx - 1]
+        else:
+            previous_position = origin
+
+        arrival_time = departure_time + previous_position.time_to(destination, departure_time)
+        starting_time = max(arrival_time, trip.destination_earliest)
+        if not starting_time <= trip.destination_latest + ERROR_BOUND:
+            return False
+        departure_time = starting_time + trip.destination_duration
+
+        arrival_time = departure_time + destination.time_to(positions[following_idx], departure_time)
+        push = arrival_time - starting_times[following_idx]
+        return push <= forward_slacks[following_idx] + ERROR_BOUND
+
+    def _feasible_insertion_capacity(self, capacity: float, previous_idx: int, following_idx: int) -> bool:
+        limit = self.route.vehicle.capacity - capacity + ERROR_BOUND
+        if self._downstream_capacities[previous_idx] <= limit:
+            return True
+        return max(self.capacities[previous_idx:following_idx]) <= limit
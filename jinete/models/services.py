@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from typing import (
         Dict,
         Any,
+        Optional,
         Generator,
         Tuple,
     )
@@ -40,6 +41,8 @@ class Service(Model):
         "earliest",
         "latest",
         "duration",
+        "index",
+        "_hash",
     )
     position: Position
     """
@@ -63,7 +66,20 @@ class Service(Model):
 
     """
 
-    def __init__(self, position: Position, earliest: float = 0.0, latest: float = MAX_FLOAT, duration: float = 0.0):
+    index: Optional[int]
+    """
+    The dense integer identifier of the service on its position's surface, or ``None`` if it has not been interned.
+
+    """
+
+    def __init__(
+        self,
+        position: Position,
+        earliest: float = 0.0,
+        latest: float = MAX_FLOAT,
+        duration: float = 0.0,
+        index: int = None,
+    ):
         """
         The constructor of the class.
 
@@ -71,20 +87,30 @@ class Service(Model):
         :param earliest: The earliest time to be able to perform the service.
         :param latest: The latest time to be able to perform the service.
         :param duration: The requested time to perform the service.
+        :param index: The dense integer identifier of the service on its position's surface.
         """
         self.position = position
         self.earliest = earliest
         self.latest = latest
         self.duration = duration
+        self.index = index
+        self._hash = hash((position, earliest, latest, duration))
 
     def __deepcopy__(self, memo: Dict[int, Any]) -> Service:
         return self
 
     def __eq__(self, other: Service) -> bool:
-        return hash(self) == hash(other)
+        if self is other:
+            return True
+        if self.index is not None and other.index is not None and self.position.surface is other.position.surface:
+            return False
+        return tuple(self) == tuple(other)
+
+    def __reduce__(self):
+        return self.__class__, (self.position, self.earliest, self.latest, self.duration, self.index)
 
     def __hash__(self):
-        return hash(tuple(self))
+        return self._hash
 
     def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
         yield from (
@@ -8,10 +8,6 @@ from typing import (
     TYPE_CHECKING,
 )
 
-from cached_property import (
-    cached_property,
-)
-
 from .abc import (
     Model,
 )
@@ -19,6 +15,9 @@ from .constants import (
     ERROR_BOUND,
     MAX_FLOAT,
 )
+from .schedules import (
+    propagate_stop,
+)
 
 if TYPE_CHECKING:
     from typing import (
@@ -32,6 +31,7 @@ if TYPE_CHECKING:
     )
     from .positions import Position
     from .planned_trips import PlannedTrip
+    from .routes import Route
     from .vehicles import Vehicle
 
 logger = logging.getLogger(__name__)
@@ -44,13 +44,20 @@ class Stop(Model):
         "pickup_planned_trips",
         "delivery_planned_trips",
         "previous",
+        "route",
+        "index",
         "_starting_time",
+        "_earliest",
+        "_latest",
+        "_load_time",
     ]
     vehicle: Vehicle
     position: Position
     previous: Optional[Stop]
     pickup_planned_trips: Set[PlannedTrip, ...]
     delivery_planned_trips: Set[PlannedTrip, ...]
+    route: Optional[Route]
+    index: Optional[int]
 
     def __init__(
         self,
@@ -70,12 +77,19 @@ class Stop(Model):
         self.vehicle = vehicle
         self.position = position
 
-        self.pickup_planned_trips = pickups
-        self.delivery_planned_trips = deliveries
+        self.pickup_planned_trips = set()
+        self.delivery_planned_trips = set()
+        self._earliest, self._latest, self._load_time = None, None, None
 
         self.previous = previous
+        self.route, self.index = None, None
         self._starting_time = starting_time
 
+        for planned_trip in pickups:
+            self.append_pickup(planned_trip)
+        for planned_trip in deliveries:
+            self.append_delivery(planned_trip)
+
     @property
     def identifier(self) -> str:
         iterable = it.chain(
@@ -95,14 +109,18 @@ class Stop(Model):
     def trips(self):
         yield from (planned_trip.trip for planned_trip in self.planned_trips)
 
-    @cached_property
+    @property
     def capacity(self) -> float:
-        result = self.previous_capacity
-        result += sum(trip.capacity for trip in self.pickup_planned_trips)
-        result -= sum(trip.capacity for trip in self.delivery_planned_trips)
+        result = self._values()[3]
         assert 0 <= result
         return result
 
+    @property
+    def load(self) -> float:
+        load = sum(planned_trip.capacity for planned_trip in self.pickup_planned_trips)
+        load -= sum(planned_trip.capacity for planned_trip in self.delivery_planned_trips)
+        return load
+
     @property
     def previous_capacity(self) -> float:
         if self.previous is None:
@@ -111,9 +129,12 @@ class Stop(Model):
 
     @property
     def all_previous(self) -> List[Stop]:
-        if self.previous is None:
-            return []
-        return [self.previous] + self.previous.all_previous
+        result = list()
+        current = self.previous
+        while current is not None:
+            result.append(current)
+            current = current.previous
+        return result
 
     @property
     def all_previous_pickups(self) -> Iterator[PlannedTrip]:
@@ -122,12 +143,28 @@ class Stop(Model):
     def append_pickup(self, planned_trip: PlannedTrip) -> None:
         assert planned_trip.origin == self.position
         self.pickup_planned_trips.add(planned_trip)
+        self.flush()
 
     def append_delivery(self, planned_trip: PlannedTrip) -> None:
         assert planned_trip.destination == self.position
         self.delivery_planned_trips.add(planned_trip)
+        self.flush()
 
-    @cached_property
+    def _compute_bounds(self) -> None:
+        earliest, latest, load_time = 0.0, MAX_FLOAT, 0.0
+        for planned_trip in self.pickup_planned_trips:
+            trip = planned_trip.trip
+            earliest = max(earliest, trip.origin_earliest)
+            latest = min(latest, trip.origin_latest)
+            load_time = max(load_time, trip.origin_duration)
+        for planned_trip in self.delivery_planned_trips:
+            trip = planned_trip.trip
+            earliest = max(earliest, trip.destination_earliest)
+            latest = min(latest, trip.destination_latest)
+            load_time = max(load_time, trip.destination_duration)
+        self._earliest, self._latest, self._load_time = earliest, latest, load_time
+
+    @property
     def feasible(self) -> bool:
         if not self.earliest <= self.starting_time + ERROR_BOUND:
             return False
@@ -150,9 +187,9 @@ class Stop(Model):
     def distance(self) -> float:
         return self.position.distance_to(self.previous_position)
 
-    @cached_property
-    def arrival_time(self):
-        return self.previous_departure_time + self.transit_time
+    @property
+    def arrival_time(self) -> float:
+        return self._values()[0]
 
     @property
     def previous_departure_time(self) -> float:
@@ -170,16 +207,13 @@ class Stop(Model):
         assert waiting_time >= 0 - ERROR_BOUND
         return waiting_time
 
-    @cached_property
+    @property
     def departure_time(self) -> float:
-        return self.starting_time + self.load_time
+        return self._values()[2]
 
     @property
     def starting_time(self) -> float:
-        value = self._starting_time
-        if value is None:
-            value = self.arrival_time
-        return max((value, self.earliest, self.arrival_time))
+        return self._values()[1]
 
     @starting_time.setter
     def starting_time(self, value: float) -> None:
@@ -188,33 +222,64 @@ class Stop(Model):
 
     @property
     def earliest(self) -> float:
-        return max(
-            it.chain(
-                (pt.trip.origin_earliest for pt in self.pickup_planned_trips),
-                (pt.trip.destination_earliest for pt in self.delivery_planned_trips),
-            ),
-            default=0.0,
-        )
+        if self._earliest is None:
+            self._compute_bounds()
+        return self._earliest
 
     @property
     def latest(self) -> float:
-        return min(
-            it.chain(
-                (pt.trip.origin_latest for pt in self.pickup_planned_trips),
-                (pt.trip.destination_latest for pt in self.delivery_planned_trips),
-            ),
-            default=MAX_FLOAT,
-        )
+        if self._latest is None:
+            self._compute_bounds()
+        return self._latest
 
     @property
     def load_time(self) -> float:
-        return max(
-            it.chain(
-                (pt.trip.origin_duration for pt in self.pickup_planned_trips),
-                (pt.trip.destination_duration for pt in self.delivery_planned_trips),
-            ),
-            default=0.0,
-        )
+        if self._load_time is None:
+            self._compute_bounds()
+        return self._load_time
+
+    @property
+    def bound(self) -> bool:
+        route, idx = self.route, self.index
+        return route is not None and idx < len(route.stops) and route.stops[idx] is self
+
+    def _values(self) -> Tuple[float, float, float, float]:
+        if self.route is not None:
+            schedule = self.route.schedule
+            if self.bound:
+                idx = self.index
+                return (
+                    schedule.arrival_times[idx],
+                    schedule.starting_times[idx],
+                    schedule.departure_times[idx],
+                    schedule.capacities[idx],
+                )
+
+        chain = [self]
+        while chain[-1].previous is not None and not chain[-1].previous.bound:
+            chain.append(chain[-1].previous)
+
+        first = chain[-1].previous
+        if first is None:
+            position, departure_time, capacity = self.vehicle.origin_position, self.vehicle.origin_earliest, 0.0
+        else:
+            _, _, departure_time, capacity = first._values()
+            position = first.position
+
+        for stop in reversed(chain):
+            arrival_time, starting_time, departure_time, capacity = propagate_stop(
+                position,
+                departure_time,
+                capacity,
+                stop.position,
+                stop._starting_time,
+                stop.earliest,
+                stop.load_time,
+                stop.load,
+            )
+            position = stop.position
+
+        return arrival_time, starting_time, departure_time, capacity
 
     def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
         yield from (
@@ -223,16 +288,7 @@ class Stop(Model):
         )
 
     def flush(self) -> None:
-        for key in (
-            "arrival_time",
-            "departure_time",
-            "capacity",
-        ):
-            self.__dict__.pop(key, None)
-        for planned_trip in self.planned_trips:
-            planned_trip.flush()
-
-    def flush_all_previous(self):
-        self.flush()
-        if self.previous is not None:
-            self.previous.flush_all_previous()
+        self._earliest, self._latest, self._load_time = None, None, None
+        if self.route is None:
+            return
+        self.route.flush(self.index)
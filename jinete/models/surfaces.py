@@ -3,12 +3,22 @@ from __future__ import (
 )
 
 import logging
+import mmap
 from abc import (
     ABC,
     abstractmethod,
 )
-from collections import (
-    defaultdict,
+from concurrent.futures import (
+    ProcessPoolExecutor,
+)
+from itertools import (
+    repeat,
+)
+from math import (
+    sqrt,
+)
+from pathlib import (
+    Path,
 )
 from typing import (
     TYPE_CHECKING,
@@ -17,47 +27,175 @@ from uuid import (
     uuid4,
 )
 
+import networkx as nx
+import numpy as np
+
 from .abc import (
     Model,
 )
 from .constants import (
+    MAX_FLOAT,
     DistanceMetric,
 )
+from .hierarchies import (
+    ContractionHierarchy,
+)
 from .positions import (
     GeometricPosition,
+    GraphPosition,
+    MatrixPosition,
+)
+from .profiles import (
+    SpeedProfile,
+)
+from .services import (
+    Service,
+)
+from ..utils import (
+    LRUCache,
 )
 
 if TYPE_CHECKING:
     from typing import (
-        Set,
         Any,
+        Callable,
         Dict,
+        Hashable,
+        Iterable,
+        List,
         Generator,
+        MutableMapping,
+        Optional,
+        Sequence,
         Tuple,
+        Union,
     )
     from uuid import UUID
     from .positions import Position
 
 logger = logging.getLogger(__name__)
 
+_WORKER_GRAPH = None
+
+
+def _initialize_worker(graph: nx.Graph) -> None:
+    global _WORKER_GRAPH
+    _WORKER_GRAPH = graph
+
+
+def _dump_matrix(matrix: np.ndarray) -> Union[np.ndarray, Tuple[str, str, Tuple[int, ...], int, str]]:
+    if not isinstance(matrix, np.memmap) or not isinstance(matrix.base, mmap.mmap) or matrix.filename is None:
+        return matrix
+    order = "F" if matrix.flags.f_contiguous and not matrix.flags.c_contiguous else "C"
+    return matrix.filename, matrix.dtype.str, matrix.shape, matrix.offset, order
+
+
+def _open_matrix(reference: Union[np.ndarray, Tuple[str, str, Tuple[int, ...], int, str]]) -> np.ndarray:
+    if not isinstance(reference, tuple):
+        return reference
+    filename, dtype, shape, offset, order = reference
+    return np.memmap(filename, dtype=dtype, mode="r", shape=shape, offset=offset, order=order)
+
+
+def _load_matrix_surface(
+    cls: type,
+    distance_reference: Union[np.ndarray, Tuple[str, str, Tuple[int, ...], int, str]],
+    time_reference: Optional[Union[np.ndarray, Tuple[str, str, Tuple[int, ...], int, str]]],
+) -> MatrixSurface:
+    surface = cls.__new__(cls)
+    surface.distance_matrix = _open_matrix(distance_reference)
+    if time_reference is None:
+        surface.time_matrix = surface.distance_matrix
+    else:
+        surface.time_matrix = _open_matrix(time_reference)
+    return surface
+
+
+def _compute_rows(
+    source: Hashable, distance_weight: str, time_weight: Optional[str], graph: nx.Graph = None
+) -> Tuple[Hashable, Dict[Hashable, float], Optional[Dict[Hashable, float]]]:
+    if graph is None:
+        graph = _WORKER_GRAPH
+    distance_row = nx.single_source_dijkstra_path_length(graph, source, weight=distance_weight)
+    time_row = None
+    if time_weight is not None:
+        time_row = nx.single_source_dijkstra_path_length(graph, source, weight=time_weight)
+    return source, distance_row, time_row
+
+
+def _is_index_array(positions: Sequence[Union[Position, int]]) -> bool:
+    return isinstance(positions, np.ndarray) and np.issubdtype(positions.dtype, np.integer)
+
 
 class Surface(Model, ABC):
+    __slots__ = (
+        "uuid",
+        "positions",
+        "services",
+        "_interned_positions",
+        "_interned_services",
+    )
+
+    time_dependent: bool = False
+
     uuid: UUID
-    positions: Set[Position]
+    positions: List[Position]
+    services: List[Service]
+    _interned_positions: Dict[Position, Position]
+    _interned_services: Dict[Service, Service]
 
-    def __init__(self, positions: Set[Position] = None, uuid: UUID = None, *args, **kwargs):
+    def __init__(self, positions: Iterable[Position] = None, uuid: UUID = None, *args, **kwargs):
         if uuid is None:
             uuid = uuid4()
         if positions is None:
             positions = set()
         self.uuid = uuid
-        self.positions = positions
+        self.positions = list()
+        self.services = list()
+        self._interned_positions = dict()
+        self._interned_services = dict()
+
+        for position in positions:
+            self._intern_position(position)
 
     def get_or_create_position(self, *args, **kwargs) -> Position:
-        position = self._build_position(*args, **kwargs)
-        if position not in self.positions:
-            self.positions.add(position)
-        return position
+        """
+        Retrieves the interned position described by the given arguments, creating it if it does not exist yet.
+
+        :param args: Positional parameters to build the position.
+        :param kwargs: Named parameters to build the position.
+        :return: The interned position, whose ``index`` is its dense identifier on the surface.
+        """
+        return self._intern_position(self._build_position(*args, **kwargs))
+
+    def get_or_create_service(self, position: Position, *args, **kwargs) -> Service:
+        """
+        Retrieves the interned service described by the given arguments, creating it if it does not exist yet.
+
+        :param position: The position in which the service should be performed.
+        :param args: Additional positional parameters to build the service.
+        :param kwargs: Additional named parameters to build the service.
+        :return: The interned service, whose ``index`` is its dense identifier on the surface.
+        """
+        if position.index is None:
+            position = self._intern_position(position)
+        service = Service(position, *args, **kwargs)
+        try:
+            return self._interned_services[service]
+        except KeyError:
+            service.index = len(self.services)
+            self.services.append(service)
+            self._interned_services[service] = service
+            return service
+
+    def _intern_position(self, position: Position) -> Position:
+        try:
+            return self._interned_positions[position]
+        except KeyError:
+            position.index = len(self.positions)
+            self.positions.append(position)
+            self._interned_positions[position] = position
+            return position
 
     @abstractmethod
     def _build_position(self, *args, **kwargs):
@@ -71,30 +209,620 @@ class Surface(Model, ABC):
     def time(self, position_a: Position, position_b: Position, **kwargs) -> float:
         pass
 
+    def distance_many(
+        self, positions_a: Sequence[Union[Position, int]], positions_b: Sequence[Union[Position, int]]
+    ) -> np.ndarray:
+        """
+        Computes the distances between each pair of positions, in an element-wise way.
+
+        :param positions_a: The origin positions (or their ``index`` on the surface). Integer ``numpy`` arrays of
+            indices are supported without building the position objects on some surfaces (like the geometric ones).
+        :param positions_b: The destination positions (or their ``index`` on the surface).
+        :return: An array containing the distance of each pair.
+        """
+        positions_a, positions_b = self._as_positions(positions_a, positions_b)
+        distances = (self.distance(position_a, position_b) for position_a, position_b in zip(positions_a, positions_b))
+        return np.fromiter(distances, dtype=np.float64, count=len(positions_a))
+
+    def time_many(
+        self,
+        positions_a: Sequence[Union[Position, int]],
+        positions_b: Sequence[Union[Position, int]],
+        now: Union[float, Sequence[float]] = None,
+    ) -> np.ndarray:
+        """
+        Computes the times between each pair of positions, in an element-wise way.
+
+        :param positions_a: The origin positions (or their ``index`` on the surface).
+        :param positions_b: The destination positions (or their ``index`` on the surface).
+        :param now: The departure time of each pair, or a single one shared by all of them.
+        :return: An array containing the time of each pair.
+        """
+        positions_a, positions_b = self._as_positions(positions_a, positions_b)
+        if now is None or np.isscalar(now):
+            now = repeat(now)
+        times = (self.time(a, b, now=t) for a, b, t in zip(positions_a, positions_b, now))
+        return np.fromiter(times, dtype=np.float64, count=len(positions_a))
+
+    def _as_positions(
+        self, positions_a: Sequence[Union[Position, int]], positions_b: Sequence[Union[Position, int]]
+    ) -> Tuple[List[Position], List[Position]]:
+        if not len(positions_a) == len(positions_b):
+            raise ValueError(f"The number of origins {len(positions_a)} and destinations {len(positions_b)} differ.")
+        positions_a = [self.positions[p] if isinstance(p, (int, np.integer)) else p for p in positions_a]
+        positions_b = [self.positions[p] if isinstance(p, (int, np.integer)) else p for p in positions_b]
+        return positions_a, positions_b
+
     def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
         yield from (("position_coordinates", tuple(position.coordinates for position in self.positions)),)
 
 
 class GeometricSurface(Surface):
-    cached_distance: Dict[Position, Dict[Position, float]]
+    """
+    Represents a surface in which the distance between positions is given by a metric over their coordinates.
 
-    def __init__(self, metric: DistanceMetric, *args, **kwargs):
+    By default the distances are computed on demand and cached by position pairs. In the ``dense`` mode, the whole
+    matrix is computed with ``numpy`` once the surface is finalised, storing only its upper triangle (as the metrics
+    are symmetric) and indexing it by the positions' ``index``. Positions created after that are still supported
+    through the on demand cache.
+    """
+
+    __slots__ = (
+        "metric",
+        "cached_distance",
+        "dense",
+        "dtype",
+        "_matrix",
+        "_matrix_size",
+        "_coordinates",
+    )
+
+    metric: DistanceMetric
+    cached_distance: MutableMapping[Tuple[Position, Position], float]
+    dense: bool
+    dtype: str
+    _matrix: Optional[np.ndarray]
+    _matrix_size: int
+    _coordinates: Optional[np.ndarray]
+
+    def __init__(
+        self,
+        metric: DistanceMetric,
+        *args,
+        dense: bool = False,
+        dtype: str = "float64",
+        cached_distance: MutableMapping[Tuple[Position, Position], float] = None,
+        **kwargs,
+    ):
+        """
+        :param metric: The metric used to compute the distance between positions.
+        :param args: Additional positional parameters.
+        :param dense: Indicates if the full distance matrix must be precomputed.
+        :param dtype: The ``numpy`` data type of the precomputed distance matrix (like ``float32``).
+        :param cached_distance: The cache of the distances by position pairs (like a bounded ``LRUCache``). If it is
+            not given, an unbounded ``dict`` is used.
+        :param kwargs: Additional named parameters.
+        """
         super().__init__(*args, **kwargs)
+        if cached_distance is None:
+            cached_distance = dict()
         self.metric = metric
+        self.dense = dense
+        self.dtype = dtype
 
-        self.cached_distance = defaultdict(dict)
+        self.cached_distance = cached_distance
+        self._matrix = None
+        self._matrix_size = 0
+        self._coordinates = None
 
     def _build_position(self, *args, **kwargs):
         return GeometricPosition(surface=self, *args, **kwargs)
 
+    def finalize(self) -> None:
+        """
+        Computes the distance matrix between all the positions of the surface (only in the ``dense`` mode).
+        """
+        if not self.dense:
+            return
+
+        coordinates = np.array([position.coordinates for position in self.positions], dtype=np.float64)
+        n = len(coordinates)
+
+        matrix = np.empty(n * (n - 1) // 2, dtype=self.dtype)
+        start = 0
+        for i in range(n - 1):
+            end = start + n - i - 1
+            matrix[start:end] = self._compute_distances(coordinates[i], coordinates[i + 1 :])
+            start = end
+
+        self._matrix = matrix
+        self._matrix_size = n
+
+    def _compute_distances(self, origins: np.ndarray, destinations: np.ndarray) -> np.ndarray:
+        if self.metric is DistanceMetric.EUCLIDEAN:
+            return np.sqrt(np.square(destinations - origins).sum(axis=1))
+        if self.metric is DistanceMetric.MANHATTAN:
+            return np.abs(destinations - origins).sum(axis=1)
+        origins = np.broadcast_to(origins, destinations.shape)
+        return np.array([self.metric(origin, destination) for origin, destination in zip(origins, destinations)])
+
+    def distance_many(
+        self, positions_a: Sequence[Union[Position, int]], positions_b: Sequence[Union[Position, int]]
+    ) -> np.ndarray:
+        if _is_index_array(positions_a) and _is_index_array(positions_b):
+            if not len(positions_a) == len(positions_b):
+                raise ValueError(
+                    f"The number of origins {len(positions_a)} and destinations {len(positions_b)} differ."
+                )
+            coordinates = self._coordinate_matrix()
+            return self._compute_distances(coordinates[positions_a], coordinates[positions_b])
+
+        positions_a, positions_b = self._as_positions(positions_a, positions_b)
+        if not positions_a:
+            return np.empty(0, dtype=np.float64)
+        origins = np.array([position.coordinates for position in positions_a], dtype=np.float64)
+        destinations = np.array([position.coordinates for position in positions_b], dtype=np.float64)
+        return self._compute_distances(origins, destinations)
+
+    def _coordinate_matrix(self) -> np.ndarray:
+        if self._coordinates is None or not len(self._coordinates) == len(self.positions):
+            self._coordinates = np.array([position.coordinates for position in self.positions], dtype=np.float64)
+        return self._coordinates
+
+    def time_many(
+        self,
+        positions_a: Sequence[Union[Position, int]],
+        positions_b: Sequence[Union[Position, int]],
+        now: Union[float, Sequence[float]] = None,
+    ) -> np.ndarray:
+        return self.distance_many(positions_a, positions_b)
+
     def distance(self, position_a: Position, position_b: Position) -> float:
+        if self.dense:
+            if self._matrix is None:
+                self.finalize()
+            i, j, n = position_a.index, position_b.index, self._matrix_size
+            if position_a.surface is self and position_b.surface is self and i is not None and j is not None:
+                if i < n and j < n:
+                    if i == j:
+                        return 0.0
+                    if j < i:
+                        i, j = j, i
+                    return self._matrix.item(n * i - i * (i + 1) // 2 + j - i - 1)
+
+        key = (position_a, position_b)
         try:
-            distance = self.cached_distance[position_a][position_b]
+            distance = self.cached_distance[key]
         except KeyError:
             distance = self.metric(position_a.coordinates, position_b.coordinates)
-            self.cached_distance[position_a][position_b] = distance
+            self.cached_distance[key] = distance
 
         return distance
 
     def time(self, position_a: Position, position_b: Position, **kwargs) -> float:
         return self.distance(position_a, position_b)
+
+
+class TimeDependentSurface(GeometricSurface):
+    """
+    Represents a geometric surface in which the travel time depends on the departure time, following the speed
+    profile of each arc or of each pair of zones.
+
+    The profiles are evaluated only at the boundaries of fixed-size time buckets, and cached by arc and bucket, so
+    the travel time of each lookup is obtained by the linear interpolation of those two cached values. The result
+    is exact at the buckets' boundaries and also respects the FIFO property, so its accuracy only depends on the
+    ``bucket_size``.
+
+    As a delay on the departure from a stop does not delay the following ones by the same amount, the constant time
+    checks of ``Schedule.feasible_insertion`` are only partially performed over this surface.
+    """
+
+    __slots__ = (
+        "default_profile",
+        "profiles",
+        "zone",
+        "bucket_size",
+        "cached_time",
+    )
+
+    default_profile: SpeedProfile
+    profiles: Dict[Tuple[Hashable, Hashable], SpeedProfile]
+    zone: Optional[Callable[[Position], Hashable]]
+    bucket_size: float
+    cached_time: MutableMapping[Tuple[Position, Position, int], Tuple[float, float]]
+
+    time_dependent = True
+
+    def __init__(
+        self,
+        metric: DistanceMetric,
+        default_profile: SpeedProfile,
+        *args,
+        profiles: Dict[Tuple[Hashable, Hashable], SpeedProfile] = None,
+        zone: Callable[[Position], Hashable] = None,
+        bucket_size: float = 900.0,
+        cached_time: MutableMapping[Tuple[Position, Position, int], Tuple[float, float]] = None,
+        **kwargs,
+    ):
+        """
+        :param metric: The metric used to compute the distance between positions.
+        :param default_profile: The speed profile of the arcs without a specific one.
+        :param args: Additional positional parameters.
+        :param profiles: The speed profiles indexed by pairs of zones (or pairs of positions if no zone is given).
+        :param zone: The function which retrieves the zone of a position.
+        :param bucket_size: The length of the time buckets in which the travel times are cached.
+        :param cached_time: The cache of the travel times by position pairs and buckets. If it is not given, an
+            unbounded ``dict`` is used.
+        :param kwargs: Additional named parameters.
+        """
+        super().__init__(metric, *args, **kwargs)
+        if profiles is None:
+            profiles = dict()
+        if cached_time is None:
+            cached_time = dict()
+
+        self.default_profile = default_profile
+        self.profiles = profiles
+        self.zone = zone
+        self.bucket_size = bucket_size
+        self.cached_time = cached_time
+
+    def profile(self, position_a: Position, position_b: Position) -> SpeedProfile:
+        """
+        Retrieves the speed profile of the arc between two positions.
+
+        :param position_a: The origin position.
+        :param position_b: The destination position.
+        :return: A speed profile instance.
+        """
+        if self.zone is None:
+            key = (position_a, position_b)
+        else:
+            key = (self.zone(position_a), self.zone(position_b))
+        return self.profiles.get(key, self.default_profile)
+
+    def time(self, position_a: Position, position_b: Position, now: float = None, **kwargs) -> float:
+        """
+        Computes the travel time between two positions.
+
+        :param position_a: The origin position.
+        :param position_b: The destination position.
+        :param now: The departure time. If it is not given, a lower bound over all the departure times is returned.
+        :param kwargs: Additional named parameters.
+        :return: The travel time.
+        """
+        if now is None:
+            return self.distance(position_a, position_b) / self.profile(position_a, position_b).max_speed
+
+        bucket = int(now // self.bucket_size)
+        key = (position_a, position_b, bucket)
+        try:
+            start_time, end_time = self.cached_time[key]
+        except KeyError:
+            distance = self.distance(position_a, position_b)
+            profile = self.profile(position_a, position_b)
+            start = bucket * self.bucket_size
+            start_time = profile.travel_time(distance, start)
+            end_time = profile.travel_time(distance, start + self.bucket_size)
+            self.cached_time[key] = start_time, end_time
+
+        ratio = now / self.bucket_size - bucket
+        return start_time + (end_time - start_time) * ratio
+
+    def time_many(
+        self,
+        positions_a: Sequence[Union[Position, int]],
+        positions_b: Sequence[Union[Position, int]],
+        now: Union[float, Sequence[float]] = None,
+    ) -> np.ndarray:
+        return Surface.time_many(self, positions_a, positions_b, now=now)
+
+
+class MatrixSurface(Surface):
+    """
+    Represents a surface in which the distance and time between positions are given by precomputed matrices (like
+    the ones obtained from a road network), whose rows and columns are identified by the positions' ``node``.
+
+    The matrices are accessed through ``numpy`` arrays, so memory-mapped ones (see ``from_files``) are shared between
+    processes instead of being copied into each of them. When the surface is pickled (like when it is sent to the
+    worker processes), the memory-mapped matrices are referenced by their file path and reopened in read-only mode.
+    """
+
+    __slots__ = (
+        "distance_matrix",
+        "time_matrix",
+    )
+
+    distance_matrix: np.ndarray
+    time_matrix: np.ndarray
+
+    def __init__(self, distance_matrix: np.ndarray, time_matrix: np.ndarray = None, *args, **kwargs):
+        """
+        :param distance_matrix: The square matrix of distances between nodes.
+        :param time_matrix: The square matrix of times between nodes. If it is not given, the distances are used.
+        :param args: Additional positional parameters.
+        :param kwargs: Additional named parameters.
+        """
+        if time_matrix is None:
+            time_matrix = distance_matrix
+        if not distance_matrix.ndim == 2 or not distance_matrix.shape[0] == distance_matrix.shape[1]:
+            raise ValueError(f"The distance matrix must be square, but its shape is {distance_matrix.shape}.")
+        if not time_matrix.shape == distance_matrix.shape:
+            raise ValueError(f"The time matrix shape {time_matrix.shape} does not match {distance_matrix.shape}.")
+
+        super().__init__(*args, **kwargs)
+        self.distance_matrix = distance_matrix
+        self.time_matrix = time_matrix
+
+    @classmethod
+    def from_files(
+        cls, distance_path: Path, time_path: Path = None, dtype: str = "float64", *args, **kwargs
+    ) -> MatrixSurface:
+        """
+        Builds a surface from matrices stored on disk, which are memory-mapped in read-only mode.
+
+        The files can be ``.npy`` ones (which contain their own data type and shape) or raw binary ones, containing
+        a square matrix of the given ``dtype`` in row-major order.
+
+        :param distance_path: The path of the distance matrix.
+        :param time_path: The path of the time matrix. If it is not given, the distances are used.
+        :param dtype: The data type of the raw binary files.
+        :param args: Additional positional parameters.
+        :param kwargs: Additional named parameters.
+        :return: A surface instance.
+        """
+        distance_matrix = cls._load_matrix(distance_path, dtype)
+        time_matrix = None if time_path is None else cls._load_matrix(time_path, dtype)
+        return cls(distance_matrix, time_matrix, *args, **kwargs)
+
+    @staticmethod
+    def _load_matrix(path: Path, dtype: str) -> np.ndarray:
+        path = Path(path)
+        if path.suffix == ".npy":
+            return np.load(path, mmap_mode="r")
+
+        dtype = np.dtype(dtype)
+        size = path.stat().st_size // dtype.itemsize
+        n = int(round(sqrt(size)))
+        if not n * n == size:
+            raise ValueError(f"The file {path} does not contain a square matrix of {dtype}.")
+        return np.memmap(path, dtype=dtype, mode="r", shape=(n, n))
+
+    def __reduce__(self):
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if name not in ("distance_matrix", "time_matrix") and hasattr(self, name)
+        }
+        time_reference = None
+        if self.time_matrix is not self.distance_matrix:
+            time_reference = _dump_matrix(self.time_matrix)
+        return _load_matrix_surface, (type(self), _dump_matrix(self.distance_matrix), time_reference), (None, state)
+
+    def _build_position(self, node: int, *args, **kwargs):
+        node = int(node)
+        if not 0 <= node < len(self.distance_matrix):
+            raise ValueError(f"The node {node} is not contained on the surface matrices.")
+        return MatrixPosition(node, surface=self, *args, **kwargs)
+
+    def distance(self, position_a: Position, position_b: Position) -> float:
+        return self.distance_matrix.item(position_a.node, position_b.node)
+
+    def time(self, position_a: Position, position_b: Position, **kwargs) -> float:
+        return self.time_matrix.item(position_a.node, position_b.node)
+
+    def distance_many(
+        self, positions_a: Sequence[Union[Position, int]], positions_b: Sequence[Union[Position, int]]
+    ) -> np.ndarray:
+        return self._take(self.distance_matrix, positions_a, positions_b)
+
+    def time_many(
+        self,
+        positions_a: Sequence[Union[Position, int]],
+        positions_b: Sequence[Union[Position, int]],
+        now: Union[float, Sequence[float]] = None,
+    ) -> np.ndarray:
+        return self._take(self.time_matrix, positions_a, positions_b)
+
+    def _take(
+        self,
+        matrix: np.ndarray,
+        positions_a: Sequence[Union[Position, int]],
+        positions_b: Sequence[Union[Position, int]],
+    ) -> np.ndarray:
+        positions_a, positions_b = self._as_positions(positions_a, positions_b)
+        nodes_a = np.fromiter((position.node for position in positions_a), dtype=np.intp, count=len(positions_a))
+        nodes_b = np.fromiter((position.node for position in positions_b), dtype=np.intp, count=len(positions_b))
+        return np.asarray(matrix[nodes_a, nodes_b], dtype=np.float64)
+
+
+class GraphSurface(Surface):
+    """
+    Represents a surface in which the distance and time between positions are given by the shortest paths over a
+    graph (like a road network), whose nodes are identified by the positions' ``node``.
+
+    The shortest path lengths are computed lazily, with a single source Dijkstra search per origin node on its first
+    lookup. The resulting rows are kept on a cache by origin (which is a ``LRUCache`` bounded to 1024 origins by
+    default, whatever the size of the graph, as each row holds the lengths to all the reachable nodes). The rows of a
+    known set of positions (like the trip endpoints) can also be computed beforehand in parallel through
+    ``precompute``.
+    """
+
+    __slots__ = (
+        "graph",
+        "distance_weight",
+        "time_weight",
+        "cached_rows",
+    )
+
+    graph: nx.Graph
+    distance_weight: str
+    time_weight: Optional[str]
+    cached_rows: MutableMapping[Hashable, Tuple[Dict[Hashable, float], Dict[Hashable, float]]]
+
+    def __init__(
+        self,
+        graph: nx.Graph,
+        *args,
+        distance_weight: str = "distance",
+        time_weight: str = None,
+        cached_rows: MutableMapping[Hashable, Tuple[Dict[Hashable, float], Dict[Hashable, float]]] = None,
+        **kwargs,
+    ):
+        """
+        :param graph: The graph over which the shortest paths are computed.
+        :param args: Additional positional parameters.
+        :param distance_weight: The edge attribute which contains the distance.
+        :param time_weight: The edge attribute which contains the time. If it is not given, the distances are used.
+        :param cached_rows: The cache of the distance and time rows by origin node. To bound it by memory instead
+            of by number of origins, a ``LRUCache`` with ``max_bytes`` can be given.
+        :param kwargs: Additional named parameters.
+        """
+        super().__init__(*args, **kwargs)
+        if cached_rows is None:
+            cached_rows = LRUCache(1024)
+        self.graph = graph
+        self.distance_weight = distance_weight
+        self.time_weight = time_weight
+
+        self.cached_rows = cached_rows
+
+    def _build_position(self, node: Hashable, *args, **kwargs):
+        if node not in self.graph:
+            raise ValueError(f"The node {node} is not contained on the surface graph.")
+        return GraphPosition(node, surface=self, *args, **kwargs)
+
+    def precompute(self, positions: Iterable[Position], processes: int = 1) -> None:
+        """
+        Computes the rows of the given positions which are not cached yet.
+
+        :param positions: The positions whose rows are computed.
+        :param processes: The number of worker processes used to compute the rows.
+        """
+        sources = {position.node for position in positions if position.node not in self.cached_rows}
+        if processes > 1:
+            with ProcessPoolExecutor(processes, initializer=_initialize_worker, initargs=(self.graph,)) as executor:
+                rows = executor.map(
+                    _compute_rows, sources, repeat(self.distance_weight), repeat(self.time_weight), chunksize=16,
+                )
+                for source, distance_row, time_row in rows:
+                    self._store_rows(source, distance_row, time_row)
+        else:
+            for source in sources:
+                self._store_rows(*_compute_rows(source, self.distance_weight, self.time_weight, self.graph))
+
+    def _store_rows(
+        self, source: Hashable, distance_row: Dict[Hashable, float], time_row: Optional[Dict[Hashable, float]]
+    ) -> Tuple[Dict[Hashable, float], Dict[Hashable, float]]:
+        if time_row is None:
+            time_row = distance_row
+        rows = self.cached_rows[source] = distance_row, time_row
+        return rows
+
+    def _rows(self, source: Hashable) -> Tuple[Dict[Hashable, float], Dict[Hashable, float]]:
+        try:
+            return self.cached_rows[source]
+        except KeyError:
+            return self._store_rows(*_compute_rows(source, self.distance_weight, self.time_weight, self.graph))
+
+    def distance(self, position_a: Position, position_b: Position) -> float:
+        return self._rows(position_a.node)[0].get(position_b.node, MAX_FLOAT)
+
+    def time(self, position_a: Position, position_b: Position, **kwargs) -> float:
+        return self._rows(position_a.node)[1].get(position_b.node, MAX_FLOAT)
+
+
+class ContractionHierarchySurface(Surface):
+    """
+    Represents a surface in which the distance and time between positions are given by the shortest paths over a
+    graph, answered through precomputed contraction hierarchies (which is suitable for graphs too large to compute
+    their full matrices or a single source search per position).
+
+    The query results are cached by position pairs.
+    """
+
+    __slots__ = (
+        "distance_hierarchy",
+        "time_hierarchy",
+        "cached_distance",
+        "cached_time",
+    )
+
+    distance_hierarchy: ContractionHierarchy
+    time_hierarchy: ContractionHierarchy
+    cached_distance: MutableMapping[Tuple[Position, Position], float]
+    cached_time: MutableMapping[Tuple[Position, Position], float]
+
+    def __init__(
+        self,
+        distance_hierarchy: ContractionHierarchy,
+        time_hierarchy: ContractionHierarchy = None,
+        *args,
+        cached_distance: MutableMapping[Tuple[Position, Position], float] = None,
+        cached_time: MutableMapping[Tuple[Position, Position], float] = None,
+        **kwargs,
+    ):
+        """
+        :param distance_hierarchy: The hierarchy built over the distance weights.
+        :param time_hierarchy: The hierarchy built over the time weights. If it is not given, the distances are used.
+        :param args: Additional positional parameters.
+        :param cached_distance: The cache of the distances by position pairs. If it is not given, an unbounded
+            ``dict`` is used.
+        :param cached_time: The cache of the times by position pairs. If it is not given, an unbounded ``dict`` is
+            used.
+        :param kwargs: Additional named parameters.
+        """
+        super().__init__(*args, **kwargs)
+        if cached_distance is None:
+            cached_distance = dict()
+        if cached_time is None:
+            cached_time = dict()
+        self.distance_hierarchy = distance_hierarchy
+        self.time_hierarchy = time_hierarchy
+
+        self.cached_distance = cached_distance
+        self.cached_time = cached_time
+
+    @classmethod
+    def from_files(cls, distance_path: Path, time_path: Path = None, *args, **kwargs) -> ContractionHierarchySurface:
+        """
+        Builds a surface from hierarchies stored on disk.
+
+        :param distance_path: The path of the hierarchy built over the distance weights.
+        :param time_path: The path of the hierarchy built over the time weights.
+        :param args: Additional positional parameters.
+        :param kwargs: Additional named parameters.
+        :return: A surface instance.
+        """
+        distance_hierarchy = ContractionHierarchy.load(distance_path)
+        time_hierarchy = None if time_path is None else ContractionHierarchy.load(time_path)
+        return cls(distance_hierarchy, time_hierarchy, *args, **kwargs)
+
+    def _build_position(self, node: Hashable, *args, **kwargs):
+        if node not in self.distance_hierarchy:
+            raise ValueError(f"The node {node} is not contained on the surface hierarchy.")
+        return GraphPosition(node, surface=self, *args, **kwargs)
+
+    def distance(self, position_a: Position, position_b: Position) -> float:
+        key = (position_a, position_b)
+        try:
+            distance = self.cached_distance[key]
+        except KeyError:
+            distance = self.distance_hierarchy.query(position_a.node, position_b.node)
+            self.cached_distance[key] = distance
+
+        return distance
+
+    def time(self, position_a: Position, position_b: Position, **kwargs) -> float:
+        if self.time_hierarchy is None:
+            return self.distance(position_a, position_b)
+
+        key = (position_a, position_b)
+        try:
+            time = self.cached_time[key]
+        except KeyError:
+            time = self.time_hierarchy.query(position_a.node, position_b.node)
+            self.cached_time[key] = time
+
+        return time
@@ -11,15 +11,12 @@ from typing import (
     TYPE_CHECKING,
 )
 
-from cached_property import (
-    cached_property,
-)
-
 from .abc import (
     Model,
 )
 from .constants import (
     MAX_FLOAT,
+    UNSET,
 )
 from .services import (
     Service,
@@ -29,6 +26,7 @@ if TYPE_CHECKING:
     from typing import (
         Dict,
         Any,
+        Optional,
         Generator,
         Tuple,
     )
@@ -45,6 +43,14 @@ class Trip(Model):
         "on_time_bonus",
         "capacity",
         "timeout",
+        "index",
+        "_hash",
+        "_origin_earliest",
+        "_origin_latest",
+        "_destination_earliest",
+        "_destination_latest",
+        "_direct_time",
+        "_distance",
     )
     identifier: str
     """
@@ -86,6 +92,11 @@ class Trip(Model):
     The requested capacity of the trip.
     """
 
+    index: Optional[int]
+    """
+    The dense integer identifier of the trip on its job, or ``None`` if it has not been interned.
+    """
+
     def __init__(
         self,
         identifier: str,
@@ -94,6 +105,7 @@ class Trip(Model):
         capacity: float = 1,
         on_time_bonus: float = 0.0,
         timeout: float = MAX_FLOAT,
+        index: int = None,
     ):
         """
 
@@ -103,6 +115,7 @@ class Trip(Model):
         :param capacity:
         :param on_time_bonus:
         :param timeout:
+        :param index:
         """
         self.identifier = identifier
         self.origin = origin
@@ -110,6 +123,45 @@ class Trip(Model):
         self.on_time_bonus = on_time_bonus
         self.capacity = capacity
         self.timeout = timeout
+        self.index = index
+        self._hash = object.__hash__(self) if index is None else index
+
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Invalidates the cached values, so they are computed again on their next access (discarding any tightening).
+        """
+        self._origin_earliest = UNSET
+        self._origin_latest = UNSET
+        self._destination_earliest = UNSET
+        self._destination_latest = UNSET
+        self._direct_time = UNSET
+        self._distance = UNSET
+
+    def tighten(
+        self,
+        origin_earliest: float = None,
+        origin_latest: float = None,
+        destination_earliest: float = None,
+        destination_latest: float = None,
+    ) -> None:
+        """
+        Narrows the time windows of the trip, keeping the given bounds only if they are tighter than the current ones.
+
+        :param origin_earliest: The earliest time to start the pickup service.
+        :param origin_latest: The latest time to start the pickup service.
+        :param destination_earliest: The earliest time to start the delivery service.
+        :param destination_latest: The latest time to start the delivery service.
+        """
+        if origin_earliest is not None:
+            self._origin_earliest = max(self.origin_earliest, origin_earliest)
+        if origin_latest is not None:
+            self._origin_latest = min(self.origin_latest, origin_latest)
+        if destination_earliest is not None:
+            self._destination_earliest = max(self.destination_earliest, destination_earliest)
+        if destination_latest is not None:
+            self._destination_latest = min(self.destination_latest, destination_latest)
 
     @property
     def origin_position(self) -> Position:
@@ -117,14 +169,19 @@ class Trip(Model):
 
     @property
     def origin_earliest(self) -> float:
-        return max(self.destination.earliest - self.destination.duration - self.timeout, self.origin.earliest,)
+        if self._origin_earliest is UNSET:
+            self._origin_earliest = max(
+                self.destination.earliest - self.destination.duration - self.timeout, self.origin.earliest,
+            )
+        return self._origin_earliest
 
     @property
     def origin_latest(self) -> float:
-        return min(
-            self.destination.latest - self.destination.duration - self.origin.time_to(self.destination),
-            self.origin.latest,
-        )
+        if self._origin_latest is UNSET:
+            self._origin_latest = min(
+                self.destination.latest - self.destination.duration - self.direct_time, self.origin.latest,
+            )
+        return self._origin_latest
 
     @property
     def origin_duration(self) -> float:
@@ -134,16 +191,22 @@ class Trip(Model):
     def destination_position(self) -> Position:
         return self.destination.position
 
-    @cached_property
+    @property
     def destination_earliest(self) -> float:
-        return max(
-            self.origin.earliest + self.origin.duration + self.origin.time_to(self.destination),
-            self.destination.earliest,
-        )
+        if self._destination_earliest is UNSET:
+            self._destination_earliest = max(
+                self.origin.earliest + self.origin.duration + self.direct_time,
+                self.destination.earliest,
+            )
+        return self._destination_earliest
 
-    @cached_property
+    @property
     def destination_latest(self) -> float:
-        return min(self.origin.latest + self.origin.duration + self.timeout, self.destination.latest,)
+        if self._destination_latest is UNSET:
+            self._destination_latest = min(
+                self.origin.latest + self.origin.duration + self.timeout, self.destination.latest,
+            )
+        return self._destination_latest
 
     @property
     def destination_duration(self) -> float:
@@ -153,13 +216,29 @@ class Trip(Model):
     def empty(self) -> bool:
         return self.capacity == 0
 
-    @cached_property
+    @property
+    def direct_time(self) -> float:
+        """
+        The time needed to travel directly from the origin to the destination (regardless of the departure time).
+
+        :return: A travel time.
+        """
+        if self._direct_time is UNSET:
+            self._direct_time = self.origin.time_to(self.destination)
+        return self._direct_time
+
+    @property
     def distance(self) -> float:
-        return self.origin_position.distance_to(self.destination_position)
+        if self._distance is UNSET:
+            self._distance = self.origin_position.distance_to(self.destination_position)
+        return self._distance
 
     def duration(self, now: float):
         return self.origin_position.time_to(self.destination_position, now)
 
+    def __hash__(self):
+        return self._hash
+
     def __deepcopy__(self, memo: Dict[int, Any]) -> Trip:
         return self
 
@@ -31,6 +31,14 @@ logger = logging.getLogger(__name__)
 
 
 class Vehicle(Model):
+    __slots__ = (
+        "identifier",
+        "origin",
+        "_destination",
+        "capacity",
+        "timeout",
+    )
+
     identifier: str
     origin: Service
     destination: Service
@@ -104,6 +112,8 @@ class Vehicle(Model):
 
 
 class Fleet(Model):
+    __slots__ = ("vehicles",)
+
     vehicles: Set[Vehicle]
 
     def __init__(self, vehicles: Set[Vehicle]):
@@ -1,5 +1,11 @@
 """A set of supporting classes, functions, etc. to support the `jinete`'s implementation."""
 
+from .caches import (
+    Cache,
+    ClockCache,
+    LRUCache,
+    estimate_size,
+)
 from .collections import (
     remove_duplicates,
 )
@@ -0,0 +1,330 @@
+"""A set of memory bounded caches, which keep track of their hit, miss and eviction counts."""
+
+from __future__ import (
+    annotations,
+)
+
+import sys
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections import (
+    OrderedDict,
+)
+from typing import (
+    TYPE_CHECKING,
+)
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing import (
+        Any,
+        Callable,
+        Dict,
+        Hashable,
+        List,
+    )
+
+_EMPTY = object()
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the number of bytes used by a cached value.
+
+    The ``numpy`` arrays are measured by the size of their data (so, by their ``dtype`` and length), the tuples and
+    lists by the sum of their items and the dicts by their hash table plus their values (as their keys are usually
+    shared with other objects, like the graph nodes). Any other value is measured with ``sys.getsizeof``.
+
+    :param value: The value to be measured.
+    :return: The estimated size in bytes.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value.values())
+    return sys.getsizeof(value)
+
+
+class Cache(ABC):
+    """Store a bounded number of key-value pairs, evicting some of them when the size limit is exceeded.
+
+    The limit can be given as a number of pairs (``max_size``), as a number of bytes (``max_bytes``, in which the size
+    of each value is estimated by ``sizeof`` when it is stored) or as both of them. A single value larger than
+    ``max_bytes`` is still stored, evicting all the other ones.
+
+    The caches are used through the ``cache[key]`` and ``cache[key] = value`` operations, like a plain ``dict``, so
+    ``KeyError`` is raised (and counted as a miss) when a key is not stored.
+    """
+
+    __slots__ = (
+        "max_size",
+        "max_bytes",
+        "sizeof",
+        "nbytes",
+        "hits",
+        "misses",
+        "evictions",
+    )
+
+    def __init__(self, max_size: int = None, max_bytes: int = None, sizeof: Callable[[Any], int] = None):
+        """Construct a new instance.
+
+        :param max_size: The maximum number of stored pairs.
+        :param max_bytes: The maximum number of bytes used by the stored values.
+        :param sizeof: The function which estimates the bytes used by a value. If it is not given, ``estimate_size``
+            is used.
+        """
+        if max_size is None and max_bytes is None:
+            raise ValueError("Either the max size or the max bytes must be given.")
+        if max_size is not None and not max_size > 0:
+            raise ValueError(f"The max size must be positive, but {max_size} was given.")
+        if max_bytes is not None and not max_bytes > 0:
+            raise ValueError(f"The max bytes must be positive, but {max_bytes} was given.")
+        if sizeof is None:
+            sizeof = estimate_size
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _size(self, value: Any) -> int:
+        if self.max_bytes is None:
+            return 0
+        return self.sizeof(value)
+
+    @property
+    def _exceeded(self) -> bool:
+        if self.max_size is not None and len(self) > self.max_size:
+            return True
+        if self.max_bytes is not None and self.nbytes > self.max_bytes:
+            return True
+        return False
+
+    @abstractmethod
+    def __getitem__(self, key: Hashable) -> Any:
+        pass
+
+    @abstractmethod
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    def __contains__(self, key: Hashable) -> bool:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all the stored pairs (the statistics are kept)."""
+        pass
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Retrieve the value of a key, or the given default if it is not stored.
+
+        :param key: The key to be retrieved.
+        :param default: The value returned if the key is not stored.
+        :return: The stored value or the default one.
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    @property
+    def hit_rate(self) -> float:
+        """Retrieve the ratio of lookups which have been answered by the cache.
+
+        :return: A value between zero and one.
+        """
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        """Retrieve the usage statistics of the cache.
+
+        :return: A dict containing the size, bytes, hits, misses, evictions and hit rate.
+        """
+        return {
+            "size": len(self),
+            "max_size": self.max_size,
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{key}={value}" for key, value in self.statistics.items())
+        return f"{self.__class__.__name__}({values})"
+
+
+class LRUCache(Cache):
+    """Evict the least recently used pair when the size limit is exceeded."""
+
+    __slots__ = ("_data",)
+
+    _data: OrderedDict[Hashable, Any]
+
+    def __init__(self, *args, **kwargs):
+        """Construct a new instance.
+
+        :param args: Additional positional arguments.
+        :param kwargs: Additional named arguments.
+        """
+        super().__init__(*args, **kwargs)
+        self._data = OrderedDict()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        previous = self._data.get(key, _EMPTY)
+        if previous is not _EMPTY:
+            self.nbytes -= self._size(previous)
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self.nbytes += self._size(value)
+
+        while len(self._data) > 1 and self._exceeded:
+            _, evicted = self._data.popitem(last=False)
+            self.nbytes -= self._size(evicted)
+            self.evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.nbytes = 0
+
+
+class ClockCache(Cache):
+    """Evict pairs following the CLOCK policy, an approximation of LRU which avoids reordering on every hit.
+
+    The pairs are stored on a circular buffer with a reference bit each one, set on every hit. On eviction, the clock
+    hand moves forward clearing the bits, until it finds a pair whose bit was not set, which is removed. The slots
+    released by the byte limit are reused by the following insertions.
+    """
+
+    __slots__ = (
+        "_indices",
+        "_keys",
+        "_values",
+        "_referenced",
+        "_released",
+        "_hand",
+    )
+
+    _indices: Dict[Hashable, int]
+    _keys: List[Hashable]
+    _values: List[Any]
+    _referenced: List[bool]
+    _released: List[int]
+    _hand: int
+
+    def __init__(self, *args, **kwargs):
+        """Construct a new instance.
+
+        :param args: Additional positional arguments.
+        :param kwargs: Additional named arguments.
+        """
+        super().__init__(*args, **kwargs)
+        self._indices = dict()
+        self._keys = list()
+        self._values = list()
+        self._referenced = list()
+        self._released = list()
+        self._hand = 0
+
+    def __getitem__(self, key: Hashable) -> Any:
+        try:
+            idx = self._indices[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self._referenced[idx] = True
+        self.hits += 1
+        return self._values[idx]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        idx = self._indices.get(key)
+        if idx is not None:
+            self.nbytes += self._size(value) - self._size(self._values[idx])
+            self._values[idx] = value
+            self._referenced[idx] = True
+        else:
+            idx = self._free_slot()
+            self._indices[key] = idx
+            self._keys[idx] = key
+            self._values[idx] = value
+            self._referenced[idx] = False
+            self.nbytes += self._size(value)
+
+        if self._exceeded:
+            self._referenced[idx] = True
+        while len(self._indices) > 1 and self._exceeded:
+            self._released.append(self._evict())
+
+    def _free_slot(self) -> int:
+        if self._released:
+            return self._released.pop()
+        if self.max_size is None or len(self._keys) < self.max_size:
+            self._keys.append(_EMPTY)
+            self._values.append(None)
+            self._referenced.append(False)
+            return len(self._keys) - 1
+        return self._evict()
+
+    def _evict(self) -> int:
+        keys, referenced = self._keys, self._referenced
+        hand = self._hand
+        while keys[hand] is _EMPTY or referenced[hand]:
+            referenced[hand] = False
+            hand = (hand + 1) % len(keys)
+
+        del self._indices[keys[hand]]
+        self.nbytes -= self._size(self._values[hand])
+        keys[hand], self._values[hand] = _EMPTY, None
+        self._hand = (hand + 1) % len(keys)
+        self.evictions += 1
+        return hand
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def clear(self) -> None:
+        self._indices.clear()
+        self._keys.clear()
+        self._values.clear()
+        self._referenced.clear()
+        self._released.clear()
+        self._hand = 0
+        self.nbytes = 0
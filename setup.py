@@ -26,6 +26,7 @@ description = "High Performance solving suite for the Pickup and Delivery Proble
 dependencies = [
     "cached-property>=1.5.1",
     "networkx>=2.3",
+    "numpy>=1.17",
     "matplotlib>=3.1.1",
     "seaborn>=0.9.0",
     "PuLP>=1.6.10",
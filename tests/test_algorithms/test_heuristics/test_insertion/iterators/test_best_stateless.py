@@ -6,6 +6,7 @@ import jinete as jit
 from tests.utils import (
     generate_vehicles,
     generate_trips,
+    generate_one_surface,
 )
 
 
@@ -36,6 +37,44 @@ class TestStatelessInsertionIterator(unittest.TestCase):
         dispatcher.flush()
         self.assertNotIn("iterator", dispatcher.__dict__)
 
+    def test_next_processes(self):
+        surface = generate_one_surface()
+        trips = generate_trips(
+            20, surface=surface, earliest_max=1000, timeout_min=200, timeout_max=500, load_time_min=0, load_time_max=10,
+        )
+        job = jit.Job(trips=trips, objective_cls=jit.DialARideObjective)
+        fleet = jit.Fleet(generate_vehicles(4, surface=surface, earliest_max=0, capacity_min=2))
+        kwargs = {"randomized_size": 3, "job": job, "fleet": fleet, "strategy_cls": jit.BestInsertionStrategy}
+
+        sequential = jit.BestStatelessInsertionIterator(**kwargs)
+        parallel = jit.BestStatelessInsertionIterator(processes=2, chunk_size=7, **kwargs)
+        self.assertEqual(
+            sorted(candidate.scoring for candidate in sequential._criterion.nbest(3, sequential.iterator)),
+            sorted(candidate.scoring for candidate in parallel._compute_nbest()),
+        )
+
+    def test_processes(self):
+        surface = generate_one_surface()
+        trips = generate_trips(
+            20, surface=surface, earliest_max=1000, timeout_min=200, timeout_max=500, load_time_min=0, load_time_max=10,
+        )
+        job = jit.Job(trips=trips, objective_cls=jit.DialARideObjective)
+        fleet = jit.Fleet(generate_vehicles(4, surface=surface, earliest_max=0, capacity_min=2))
+
+        plannings = list()
+        for processes in (2, 3):
+            algorithm = jit.InsertionAlgorithm(
+                iterator_cls=jit.BestStatelessInsertionIterator,
+                processes=processes,
+                chunk_size=16,
+                job=job,
+                fleet=fleet,
+            )
+            result = algorithm.optimize()
+            self.assertTrue(result.feasible)
+            plannings.append({route.vehicle: tuple(route.trips) for route in result.routes})
+        self.assertEqual(plannings[0], plannings[1])
+
 
 if __name__ == "__main__":
     unittest.main()
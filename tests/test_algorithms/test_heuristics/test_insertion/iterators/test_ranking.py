@@ -1,6 +1,7 @@
 import unittest
 
 import jinete as jit
+from jinete.algorithms.heuristics.insertion.iterators import pools
 
 from tests.utils import (
     generate_vehicles,
@@ -20,6 +21,81 @@ class TestRankingInsertionIterator(unittest.TestCase):
         self.assertEqual(dispatcher.job, job)
         self.assertEqual(dispatcher.fleet, fleet)
 
+    def test_next(self):
+        surface = generate_one_surface()
+        job = jit.Job(trips=generate_trips(20, surface=surface), objective_cls=jit.DialARideObjective,)
+        fleet = jit.Fleet(generate_vehicles(3, surface=surface))
+        dispatcher = jit.RankingInsertionIterator(job=job, fleet=fleet, neighborhood_max_size=5)
+
+        while True:
+            alive = [entry[-1] for entry in dispatcher.ranking if dispatcher._alive(entry)]
+            candidate = next(dispatcher, None)
+            if candidate is None:
+                self.assertEqual(list(), alive)
+                break
+            self.assertIn(candidate.trip, dispatcher.pending_trips)
+            self.assertEqual(min(other.scoring for other in alive), candidate.scoring)
+            if not candidate.feasible:
+                break
+            dispatcher._set_route(candidate.materialize())
+            self.assertNotIn(candidate.trip, dispatcher.pending_trips)
+            self.assertNotIn(candidate.trip, dispatcher.candidates)
+
+            alive = [entry for entry in dispatcher.ranking if dispatcher._alive(entry)]
+            self.assertEqual(len(alive), sum(dispatcher._sizes.values()))
+            self.assertTrue(all(entry[-1].trip in dispatcher.pending_trips for entry in alive))
+            self.assertLessEqual(len(dispatcher.ranking), 2 * len(alive) + 1)
+
+    def test_worker_sub_ranking(self):
+        surface = generate_one_surface()
+        trips = generate_trips(
+            20, surface=surface, earliest_max=1000, timeout_min=200, timeout_max=500, load_time_min=0, load_time_max=10,
+        )
+        job = jit.Job(trips=trips, objective_cls=jit.DialARideObjective)
+        fleet = jit.Fleet(generate_vehicles(3, surface=surface, earliest_max=0, capacity_min=2))
+        dispatcher = jit.RankingInsertionIterator(job=job, fleet=fleet, processes=2)
+        for _ in range(3):
+            candidate = next(dispatcher)
+            dispatcher._set_route(candidate.materialize())
+        route = dispatcher.routes_container[candidate.vehicle]
+        neighborhood = dispatcher._neighborhood(route)
+
+        pool = dispatcher._pool
+        pools._initialize_worker(
+            pool.trips, pool.vehicles, pool.strategy_cls, pool.criterion_cls, pool.args, pool.kwargs,
+        )
+        records = pools._compute_sub_ranking(
+            pool.route_record(route), [pool.trip_indices[trip] for trip in neighborhood], 42,
+        )
+        expected = pools.rank(route, neighborhood, pool.strategy(42), dispatcher._criterion)
+
+        self.assertEqual(
+            [
+                (candidate.trip.identifier, candidate.previous_idx, candidate.following_idx, candidate.scoring)
+                for candidate in expected
+            ],
+            [
+                (pool.trips[trip_idx].identifier, previous_idx, following_idx, scoring)
+                for _, trip_idx, previous_idx, following_idx, scoring, _ in records
+            ],
+        )
+
+    def test_processes(self):
+        surface = generate_one_surface()
+        trips = generate_trips(
+            20, surface=surface, earliest_max=1000, timeout_min=200, timeout_max=500, load_time_min=0, load_time_max=10,
+        )
+        job = jit.Job(trips=trips, objective_cls=jit.DialARideObjective)
+        fleet = jit.Fleet(generate_vehicles(4, surface=surface, earliest_max=0, capacity_min=2))
+
+        plannings = list()
+        for processes in (2, 3):
+            algorithm = jit.InsertionAlgorithm(job=job, fleet=fleet, processes=processes)
+            result = algorithm.optimize()
+            self.assertTrue(result.feasible)
+            plannings.append({route.vehicle: tuple(route.trips) for route in result.routes})
+        self.assertEqual(plannings[0], plannings[1])
+
 
 if __name__ == "__main__":
     unittest.main()
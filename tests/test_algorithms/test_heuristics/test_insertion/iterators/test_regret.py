@@ -0,0 +1,101 @@
+import unittest
+from pathlib import (
+    Path,
+)
+
+import jinete as jit
+
+from tests.utils import (
+    generate_vehicles,
+    generate_trips,
+    generate_one_surface,
+)
+
+
+class TestRegretInsertionIterator(unittest.TestCase):
+    def setUp(self) -> None:
+        surface = generate_one_surface()
+        trips = generate_trips(
+            15, surface=surface, earliest_max=1000, timeout_min=200, timeout_max=500, load_time_min=0, load_time_max=10,
+        )
+        self.job = jit.Job(trips=trips, objective_cls=jit.DialARideObjective)
+        self.fleet = jit.Fleet(generate_vehicles(4, surface=surface, earliest_max=0, capacity_min=2))
+
+    def test_creation(self):
+        dispatcher = jit.RegretInsertionIterator(regret_size=3, randomized_size=2, job=self.job, fleet=self.fleet,)
+        self.assertEqual(3, dispatcher.regret_size)
+        self.assertFalse(dispatcher.absolute)
+        self.assertEqual(2, dispatcher.randomized_size)
+        self.assertEqual(self.job, dispatcher.job)
+        self.assertEqual(self.fleet, dispatcher.fleet)
+        self.assertEqual(set(self.job.trips), set(dispatcher.insertions))
+
+    def test_next(self):
+        dispatcher = jit.RegretInsertionIterator(job=self.job, fleet=self.fleet)
+        self._check_next(dispatcher)
+
+    def test_next_absolute(self):
+        dispatcher = jit.RegretInsertionIterator(absolute=True, job=self.job, fleet=self.fleet)
+        self._check_next(dispatcher)
+
+    def _check_next(self, dispatcher: jit.RegretInsertionIterator):
+        for candidate in dispatcher:
+            costs = dict()
+            for trip, insertions in dispatcher.insertions.items():
+                if not any(insertions):
+                    continue
+                values = list()
+                for vehicle, other in insertions.items():
+                    cost = other.scoring
+                    if not dispatcher.absolute:
+                        cost -= dispatcher._criterion.scoring(dispatcher.routes_container[vehicle])
+                    values.append(cost)
+                costs[trip] = sorted(values)
+            size = dispatcher.regret_size
+            regrets = {
+                trip: sum(value - values[0] for value in values[1:size]) if len(values) >= size else jit.MAX_FLOAT
+                for trip, values in costs.items()
+            }
+            self.assertEqual(max(regrets.values()), regrets[candidate.trip])
+            self.assertIs(candidate, min(dispatcher.insertions[candidate.trip].values(), key=dispatcher._cost))
+
+            previous = {trip: dict(insertions) for trip, insertions in dispatcher.insertions.items()}
+            dispatcher._set_route(candidate.materialize())
+
+            self.assertNotIn(candidate.trip, dispatcher.insertions)
+            for trip, insertions in dispatcher.insertions.items():
+                for vehicle, other in insertions.items():
+                    if vehicle is candidate.vehicle or vehicle not in previous[trip]:
+                        continue
+                    self.assertIs(previous[trip][vehicle], other)
+
+        self.assertTrue(all(not any(insertions) for insertions in dispatcher.insertions.values()))
+
+    def test_optimize(self):
+        algorithm = jit.InsertionAlgorithm(
+            iterator_cls=jit.RegretInsertionIterator, neighborhood_max_size=5, job=self.job, fleet=self.fleet,
+        )
+        result = algorithm.optimize()
+
+        self.assertTrue(result.feasible)
+        self.assertLess(0, len(set(result.planning.trips)))
+
+    def test_optimize_cordeau_laporte(self):
+        file_path = Path(__file__).parents[5] / "res" / "datasets" / "cordeau-laporte" / "a4-40.txt"
+
+        results = list()
+        for absolute in (False, True):
+            loader = jit.FileLoader(file_path=file_path, formatter_cls=jit.CordeauLaporteLoaderFormatter)
+            algorithm = jit.InsertionAlgorithm(
+                iterator_cls=jit.RegretInsertionIterator, absolute=absolute, job=loader.job, fleet=loader.fleet,
+            )
+            results.append(algorithm.optimize())
+        result, absolute_result = results
+
+        self.assertTrue(result.feasible)
+        self.assertEqual(len(result.job.trips), len(set(result.planning.trips)))
+        self.assertGreaterEqual(result.optimization_value, absolute_result.optimization_value)
+
+
+if __name__ == "__main__":
+    unittest.main()
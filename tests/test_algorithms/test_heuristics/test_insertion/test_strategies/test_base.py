@@ -24,6 +24,22 @@ class TestInsertionStrategy(unittest.TestCase):
         )
         # TODO: Improve assertions
 
+    def test_compute_candidates(self):
+        strategy = jit.InsertionStrategy()
+        criterion = jit.ShortestTimeRouteCriterion()
+        route = generate_one_route()
+        trips = generate_trips(5)
+
+        candidates = strategy.compute(route, trips, 0, 1, only_feasible=False, criterion=criterion)
+        conjectured_routes = strategy.compute(route, trips, 0, 1, only_feasible=False)
+        self.assertEqual(len(trips), len(candidates))
+        for candidate, conjectured_route in zip(candidates, conjectured_routes):
+            self.assertIsInstance(candidate, jit.InsertionCandidate)
+            self.assertEqual(route, candidate.route)
+            self.assertEqual((0, 1), (candidate.previous_idx, candidate.following_idx))
+            self.assertEqual(conjectured_route.feasible, candidate.feasible)
+            self.assertEqual(criterion.scoring(conjectured_route), candidate.scoring)
+
 
 if __name__ == "__main__":
     unittest.main()
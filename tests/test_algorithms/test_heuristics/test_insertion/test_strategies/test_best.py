@@ -0,0 +1,80 @@
+import itertools as it
+import unittest
+from pathlib import (
+    Path,
+)
+
+import jinete as jit
+
+from tests.utils import (
+    generate_one_route,
+    generate_trips,
+)
+
+
+class TestBestInsertionStrategy(unittest.TestCase):
+    def test_compute(self):
+        strategy = jit.BestInsertionStrategy()
+        route = generate_one_route(True, planned_trips_count=5)
+        trips = generate_trips(5, earliest=0.0)
+
+        conjectured_routes = strategy.compute(route, trips)
+        self.assertLessEqual(len(conjectured_routes), len(trips))
+        for conjectured_route in conjectured_routes:
+            self.assertTrue(conjectured_route.feasible)
+            self.assertEqual(len(route.stops) + 2, len(conjectured_route.stops))
+
+    def test_compute_is_best(self):
+        strategy = jit.BestInsertionStrategy()
+        route = generate_one_route(True, planned_trips_count=5)
+        trips = generate_trips(5, earliest=0.0)
+
+        for trip in trips:
+            expected = min(
+                (
+                    conjectured_route.distance
+                    for i, j in it.combinations(range(len(route.stops)), 2)
+                    for conjectured_route in jit.InsertionStrategy().compute(route, trip, i, j)
+                ),
+                default=None,
+            )
+            conjectured_routes = strategy.compute(route, trip)
+            if expected is None:
+                self.assertEqual(0, len(conjectured_routes))
+                continue
+            self.assertEqual(1, len(conjectured_routes))
+            self.assertAlmostEqual(expected, conjectured_routes[0].distance)
+
+    def test_compute_is_best_with_ride_times(self):
+        file_path = Path(__file__).parents[5] / "res" / "datasets" / "cordeau-laporte" / "a2-16.txt"
+        loader = jit.FileLoader(file_path=file_path, formatter_cls=jit.CordeauLaporteLoaderFormatter)
+        result = jit.InsertionAlgorithm(job=loader.job, fleet=loader.fleet).optimize()
+        strategy = jit.BestInsertionStrategy()
+
+        for route in result.routes:
+            for trip in loader.job.trips:
+                if route.contains_trip(trip):
+                    continue
+                self.assertLess(trip.timeout, jit.MAX_FLOAT)
+                swept = {(i, j) for _, i, j in strategy._swept_positions(route, trip)}
+                checked = {(i, j) for _, i, j in strategy._checked_positions(route, trip)}
+                self.assertLessEqual(swept, checked)
+
+                expected = min(
+                    (
+                        conjectured_route.distance
+                        for i, j in it.combinations(range(len(route.stops)), 2)
+                        for conjectured_route in jit.InsertionStrategy().compute(route, trip, i, j)
+                    ),
+                    default=None,
+                )
+                conjectured_routes = strategy.compute(route, trip)
+                if expected is None:
+                    self.assertEqual(0, len(conjectured_routes))
+                    continue
+                self.assertEqual(1, len(conjectured_routes))
+                self.assertAlmostEqual(expected, conjectured_routes[0].distance)
+
+
+if __name__ == "__main__":
+    unittest.main()
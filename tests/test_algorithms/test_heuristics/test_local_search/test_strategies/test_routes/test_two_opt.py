@@ -20,18 +20,10 @@ class TestTwoOPTLocalSearchStrategy(unittest.TestCase):
         self.vehicle = generate_one_vehicle()
         self.position = generate_one_position()
         stop0 = jit.Stop(self.vehicle, self.position, None)
-
         stop1 = jit.Stop(self.vehicle, generate_one_position(), stop0)
-        stop0.following = stop1
-
         stop2 = jit.Stop(self.vehicle, generate_one_position(), stop1)
-        stop1.following = stop2
-
         stop3 = jit.Stop(self.vehicle, generate_one_position(), stop2)
-        stop2.following = stop3
-
         stop4 = jit.Stop(self.vehicle, generate_one_position(), stop3)
-        stop3.following = stop4
 
         stops = [stop0, stop1, stop2, stop3, stop4]
         self.stops = stops
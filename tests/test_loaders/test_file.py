@@ -4,6 +4,8 @@ import unittest
 from typing import TYPE_CHECKING
 from pathlib import Path
 
+import numpy as np
+
 import jinete as jit
 
 if TYPE_CHECKING:
@@ -40,6 +42,28 @@ class TestFileLoader(unittest.TestCase):
         self.assertIsInstance(loader.job, jit.Job)
         self.assertIsInstance(loader.surface, jit.GeometricSurface)
 
+    def test_creation_with_surface(self):
+        distance_matrix = np.arange(9, dtype=float).reshape(3, 3)
+        surface = jit.MatrixSurface(distance_matrix)
+        loader = jit.FileLoader(file_path=self.file_path, surface=surface)
+
+        self.assertIs(surface, loader.surface)
+
+        vehicle = next(iter(loader.fleet.vehicles))
+        self.assertIs(surface, vehicle.origin_position.surface)
+        self.assertEqual(0, vehicle.origin_position.node)
+
+    def test_preprocess(self):
+        file_path = Path(__file__).parents[2] / "res" / "datasets" / "cordeau-laporte" / "a2-16.txt"
+        raw = {trip.identifier: trip for trip in jit.FileLoader(file_path=file_path, preprocess=False).job.trips}
+        preprocessed = {trip.identifier: trip for trip in jit.FileLoader(file_path=file_path).job.trips}
+
+        self.assertEqual(raw.keys(), preprocessed.keys())
+        for identifier, trip in preprocessed.items():
+            self.assertLessEqual(raw[identifier].origin_earliest, trip.origin_earliest)
+            self.assertLessEqual(trip.origin_latest, raw[identifier].origin_latest)
+            self.assertLessEqual(trip.destination_latest, raw[identifier].destination_latest)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,9 @@ from __future__ import annotations
 import unittest
 from operator import attrgetter
 from typing import TYPE_CHECKING
+
+import numpy as np
+
 import jinete as jit
 
 if TYPE_CHECKING:
@@ -107,6 +110,19 @@ class TestCordeauLaporteLoaderFormatter(unittest.TestCase):
             self.assertIsInstance(trip.destination_position, jit.GeometricPosition)
             self.assertEqual(destination_position, trip.destination_position)
 
+    def test_format_job_with_matrix_surface(self):
+        n = int(self.data[0][1] // 2)
+        formatter = jit.CordeauLaporteLoaderFormatter(self.data)
+
+        surface = jit.MatrixSurface(np.arange((2 * n + 1) ** 2, dtype=float).reshape(2 * n + 1, 2 * n + 1))
+        job = formatter.job(surface)
+
+        for idx, trip in enumerate(sorted(job.trips, key=attrgetter("identifier"))):
+            self.assertEqual(idx, trip.index)
+            self.assertEqual(idx + 1, trip.origin_position.node)
+            self.assertEqual(idx + 1 + n, trip.destination_position.node)
+            self.assertEqual(surface.distance_matrix[idx + 1, idx + 1 + n], trip.distance)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+import jinete as jit
+
+from tests.utils import (
+    generate_one_route,
+    generate_one_trip,
+)
+
+
+class TestInsertionCandidate(unittest.TestCase):
+    def test_creation(self):
+        route = generate_one_route()
+        trip = generate_one_trip()
+        strategy = jit.InsertionStrategy()
+
+        candidate = jit.InsertionCandidate(route, trip, 0, 1, 10.0, True, strategy)
+
+        self.assertEqual(route, candidate.route)
+        self.assertEqual(route.vehicle, candidate.vehicle)
+        self.assertEqual(trip, candidate.trip)
+        self.assertEqual(0, candidate.previous_idx)
+        self.assertEqual(1, candidate.following_idx)
+        self.assertEqual(10.0, candidate.scoring)
+        self.assertTrue(candidate.feasible)
+        self.assertEqual(strategy, candidate.strategy)
+
+    def test_materialize(self):
+        route = generate_one_route()
+        trip = generate_one_trip()
+        strategy = jit.InsertionStrategy()
+        criterion = jit.ShortestTimeRouteCriterion()
+
+        candidate = strategy.compute(route, trip, 0, 1, only_feasible=False, criterion=criterion)[0]
+        conjectured_route = candidate.materialize()
+
+        self.assertIsInstance(conjectured_route, jit.Route)
+        self.assertIn(trip, set(conjectured_route.trips))
+        self.assertNotIn(trip, set(route.trips))
+        self.assertEqual(candidate.feasible, conjectured_route.feasible)
+        self.assertEqual(candidate.scoring, criterion.scoring(conjectured_route))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import itertools as it
+import unittest
+
+import jinete as jit
+from tests.utils import generate_one_surface, generate_trips
+
+
+class TestCompatibilityGraph(unittest.TestCase):
+    def setUp(self) -> None:
+        self.surface = generate_one_surface()
+        self.a = self.surface.get_or_create_position([0.0, 0.0])
+        self.b = self.surface.get_or_create_position([10.0, 0.0])
+        self.c = self.surface.get_or_create_position([100.0, 0.0])
+
+    def _trip(self, identifier, origin, destination, earliest, latest, timeout=jit.MAX_FLOAT):
+        return jit.Trip(
+            identifier,
+            jit.Service(origin, earliest=earliest, latest=latest),
+            jit.Service(destination, earliest=earliest),
+            timeout=timeout,
+        )
+
+    @staticmethod
+    def _sequential_route(first, second):
+        vehicle = jit.Vehicle("0", jit.Service(first.origin_position), capacity=10)
+        route = jit.Route(vehicle)
+        for trip in (first, second):
+            pickup = jit.Stop(vehicle, trip.origin_position, route.current_stop)
+            delivery = jit.Stop(vehicle, trip.destination_position, pickup)
+            route.append_planned_trip(jit.PlannedTrip(vehicle, trip, pickup, delivery))
+        return route
+
+    def test_sequential(self):
+        first = self._trip("1", self.a, self.b, 0.0, 5.0)
+        second = self._trip("2", self.b, self.a, 0.0, 20.0)
+        graph = jit.CompatibilityGraph([first, second])
+
+        self.assertEqual(0, len(graph))
+        self.assertTrue(graph.compatible(first, second))
+
+    def test_interleaved(self):
+        first = self._trip("1", self.a, self.c, 0.0, 5.0)
+        second = self._trip("2", self.b, self.c, 0.0, 15.0)
+        graph = jit.CompatibilityGraph([first, second])
+
+        self.assertEqual(0, len(graph))
+
+    def test_conflict(self):
+        first = self._trip("1", self.a, self.b, 0.0, 5.0)
+        second = self._trip("2", self.c, self.b, 0.0, 5.0)
+        third = self._trip("3", self.a, self.b, 0.0, 5.0, timeout=10.0)
+        fourth = self._trip("4", self.b, self.c, 0.0, 10.0)
+        graph = jit.CompatibilityGraph([first, second, third, fourth])
+
+        self.assertFalse(graph.compatible(first, second))
+        self.assertFalse(graph.compatible(second, first))
+        self.assertFalse(graph.compatible(third, second))
+        self.assertTrue(graph.compatible(first, third))
+        self.assertTrue(graph.compatible(first, fourth))
+        self.assertFalse(graph.compatible(second, fourth))
+        self.assertEqual(3, len(graph))
+
+        route = self._sequential_route(first, third)
+        self.assertTrue(graph.compatible_with(fourth, route))
+        self.assertFalse(graph.compatible_with(second, route))
+
+    def test_conflicts_are_infeasible(self):
+        trips = list(
+            generate_trips(
+                40,
+                surface=self.surface,
+                earliest_max=400,
+                timeout_min=50,
+                timeout_max=200,
+                load_time_min=0,
+                load_time_max=10,
+            )
+        )
+        graph = jit.CompatibilityGraph(trips, block_size=7)
+        self.assertLess(0, len(graph))
+
+        for first, second in it.permutations(trips, 2):
+            if graph.compatible(first, second):
+                continue
+            self.assertFalse(self._sequential_route(first, second).feasible)
+        self.assertEqual(graph.conflicts, jit.CompatibilityGraph(trips).conflicts)
+
+    def test_job(self):
+        job = jit.Job({self._trip("1", self.a, self.b, 0.0, 5.0)}, jit.DialARideObjective)
+
+        self.assertIsInstance(job.compatibility_graph, jit.CompatibilityGraph)
+        self.assertIs(job.compatibility_graph, job.compatibility_graph)
+
+
+if __name__ == "__main__":
+    unittest.main()
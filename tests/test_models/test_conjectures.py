@@ -0,0 +1,88 @@
+import itertools as it
+import unittest
+
+import jinete as jit
+
+from tests.utils import (
+    generate_one_loader,
+    generate_one_route,
+    generate_trips,
+)
+
+
+class TestConjecturedRoute(unittest.TestCase):
+    def setUp(self) -> None:
+        self.route = generate_one_route(True, planned_trips_count=4)
+        self.trips = list(generate_trips(3, earliest=0.0))
+        self.strategy = jit.InsertionStrategy(only_feasible=False)
+        self.criteria = [
+            jit.EarliestLastDepartureTimeRouteCriterion(),
+            jit.ShortestTimeRouteCriterion(),
+            jit.ShortestAveragePlannerTripDurationCriterion(),
+            jit.LongestUtilTimeRouteCriterion(),
+            jit.HashCodeRouteCriterion(),
+        ]
+
+    def test_creation(self):
+        trip = self.trips[0]
+        conjectured_route = jit.ConjecturedRoute(self.route, trip, 0, 1, self.strategy)
+
+        self.assertEqual(self.route, conjectured_route.route)
+        self.assertEqual(self.route.vehicle, conjectured_route.vehicle)
+        self.assertEqual(trip, conjectured_route.trip)
+        self.assertEqual(0, conjectured_route.previous_idx)
+        self.assertEqual(1, conjectured_route.following_idx)
+        self.assertEqual(set(self.route.trips) | {trip}, set(conjectured_route.trips))
+
+    def test_values(self):
+        for trip, (i, j) in it.product(self.trips, it.combinations(range(len(self.route.stops)), 2)):
+            conjectured_route = jit.ConjecturedRoute(self.route, trip, i, j, self.strategy)
+            route = self.strategy._compute_one(self.route, trip, i, j)
+
+            self.assertEqual(route.feasible, conjectured_route.feasible)
+            self.assertAlmostEqual(route.first_departure_time, conjectured_route.first_departure_time)
+            self.assertAlmostEqual(route.last_departure_time, conjectured_route.last_departure_time)
+            self.assertAlmostEqual(route.duration, conjectured_route.duration)
+            self.assertEqual(
+                sorted((p.trip.identifier, p.duration) for p in route.planned_trips),
+                sorted((p.trip.identifier, p.duration) for p in conjectured_route.planned_trips),
+            )
+            for criterion in self.criteria:
+                self.assertAlmostEqual(criterion.scoring(route), criterion.scoring(conjectured_route))
+            self.assertIsNone(conjectured_route._built)
+
+    def test_values_with_ride_times(self):
+        loader = generate_one_loader()()
+        result = jit.InsertionAlgorithm(job=loader.job, fleet=loader.fleet).optimize()
+        criterion = jit.EarliestLastDepartureTimeRouteCriterion()
+
+        for route in result.routes:
+            trips = [trip for trip in loader.job.trips if not route.contains_trip(trip)][:5]
+            for trip, (i, j) in it.product(trips, it.combinations(range(len(route.stops)), 2)):
+                conjectured_route = jit.ConjecturedRoute(route, trip, i, j, self.strategy)
+                built_route = self.strategy._compute_one(route, trip, i, j)
+
+                self.assertEqual(built_route.feasible, conjectured_route.feasible)
+                self.assertAlmostEqual(criterion.scoring(built_route), criterion.scoring(conjectured_route))
+
+    def test_built(self):
+        trip = self.trips[0]
+        conjectured_route = jit.ConjecturedRoute(self.route, trip, 0, 1, self.strategy)
+        self.assertIsNone(conjectured_route._built)
+
+        self.assertEqual(len(self.route.stops) + 2, len(conjectured_route.stops))
+        self.assertIsInstance(conjectured_route.built, jit.Route)
+        self.assertIn(trip, set(conjectured_route.built.trips))
+        self.assertNotIn(trip, set(self.route.trips))
+
+    def test_unknown_attribute(self):
+        conjectured_route = jit.ConjecturedRoute(self.route, self.trips[0], 0, 1, self.strategy)
+
+        with self.assertRaises(AttributeError):
+            conjectured_route.remove_trip  # noqa
+        self.assertFalse(hasattr(conjectured_route, "unknown"))
+        self.assertIsNone(conjectured_route._built)
+
+
+if __name__ == "__main__":
+    unittest.main()
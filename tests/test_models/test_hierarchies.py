@@ -0,0 +1,67 @@
+import itertools as it
+import unittest
+from pathlib import Path
+from random import (
+    seed,
+    uniform,
+)
+from tempfile import TemporaryDirectory
+
+import networkx as nx
+import numpy as np
+
+import jinete as jit
+
+
+class TestContractionHierarchy(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        seed(56)
+        graph = nx.grid_2d_graph(6, 6).to_directed()
+        for u, v in graph.edges:
+            graph.edges[u, v]["distance"] = uniform(1.0, 10.0)
+        graph.add_node("isolated")
+        cls.graph = graph
+        cls.hierarchy = jit.ContractionHierarchy.build(graph)
+
+    def test_creation(self):
+        self.assertEqual(len(self.graph), len(self.hierarchy))
+        self.assertEqual(set(range(len(self.graph))), set(self.hierarchy.ranks.values()))
+        self.assertEqual(self.hierarchy.nodes, sorted(self.graph.nodes, key=self.hierarchy.ranks.__getitem__))
+        for edges in (self.hierarchy.upward, self.hierarchy.downward):
+            indptr, indices, _ = edges
+            self.assertEqual(len(self.graph) + 1, len(indptr))
+            for rank in range(len(self.graph)):
+                for neighbor in indices[indptr[rank] : indptr[rank + 1]]:
+                    self.assertLess(rank, neighbor)
+
+    def test_query(self):
+        lengths = dict(nx.all_pairs_dijkstra_path_length(self.graph, weight="distance"))
+        for source, target in it.product(self.graph.nodes, repeat=2):
+            expected = lengths[source].get(target, jit.MAX_FLOAT)
+            self.assertAlmostEqual(expected, self.hierarchy.query(source, target))
+
+    def test_query_undirected(self):
+        graph = nx.path_graph(5)
+        hierarchy = jit.ContractionHierarchy.build(graph)
+
+        self.assertEqual(4.0, hierarchy.query(0, 4))
+        self.assertEqual(4.0, hierarchy.query(4, 0))
+
+    def test_save_load(self):
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "hierarchy.npz"
+            self.hierarchy.save(path)
+            hierarchy = jit.ContractionHierarchy.load(path)
+
+        self.assertEqual(self.hierarchy.ranks, hierarchy.ranks)
+        self.assertEqual(self.hierarchy.nodes, hierarchy.nodes)
+        for expected, edges in zip(self.hierarchy.upward, hierarchy.upward):
+            self.assertTrue(np.array_equal(expected, edges))
+        for expected, edges in zip(self.hierarchy.downward, hierarchy.downward):
+            self.assertTrue(np.array_equal(expected, edges))
+        self.assertEqual(self.hierarchy.query((0, 0), (5, 5)), hierarchy.query((0, 0), (5, 5)))
+
+
+if __name__ == "__main__":
+    unittest.main()
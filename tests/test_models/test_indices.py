@@ -0,0 +1,98 @@
+import unittest
+
+import numpy as np
+
+import jinete as jit
+from tests.utils import generate_one_surface, generate_trips
+
+
+class TestTripIndex(unittest.TestCase):
+    @staticmethod
+    def _brute_force(trips, position, now, k):
+        def score(trip):
+            travel_time = position.time_to(trip.origin_position, now)
+            return trip.origin_latest < now + travel_time, max(travel_time, trip.origin_earliest - now)
+
+        return sorted(score(trip) for trip in trips)[:k]
+
+    def test_creation(self):
+        surface = generate_one_surface()
+        trips = generate_trips(50, surface=surface)
+        index = jit.TripIndex(trips)
+
+        self.assertEqual(50, len(index))
+        self.assertEqual(set(trips), set(index))
+        self.assertIsNotNone(index.cell_size)
+        self.assertEqual(index.cell_size, index.time_bucket_size)
+
+    def test_nearest(self):
+        surface = generate_one_surface()
+        trips = generate_trips(200, surface=surface, earliest_max=1000, timeout_min=50, timeout_max=200)
+        index = jit.TripIndex(trips)
+        position = surface.get_or_create_position([0.0, 0.0])
+
+        for now in (0.0, 250.0, 500.0, 2000.0):
+            for k in (1, 10, 24, 300):
+                nearest = index.nearest(position, now, k)
+                self.assertEqual(min(k, len(trips)), len(nearest))
+                self.assertEqual(
+                    self._brute_force(trips, position, now, k), self._brute_force(nearest, position, now, k),
+                )
+
+    def test_nearest_time_dependent(self):
+        profile = jit.SpeedProfile([0.0, 300.0, 600.0], [0.5, 2.0, 0.25], period=900.0)
+        surface = jit.TimeDependentSurface(jit.DistanceMetric.EUCLIDEAN, profile, bucket_size=10.0)
+        trips = generate_trips(200, surface=surface, earliest_max=1000, timeout_min=50, timeout_max=200)
+        index = jit.TripIndex(trips)
+        position = surface.get_or_create_position([0.0, 0.0])
+
+        self.assertEqual(2.0, index.speed)
+        self.assertEqual(index.cell_size / 2.0, index.time_bucket_size)
+        for now in (0.0, 250.0, 500.0, 2000.0):
+            for k in (1, 10, 24):
+                nearest = index.nearest(position, now, k)
+                self.assertEqual(
+                    self._brute_force(trips, position, now, k), self._brute_force(nearest, position, now, k),
+                )
+
+    def test_remove(self):
+        surface = generate_one_surface()
+        trips = list(generate_trips(20, surface=surface))
+        index = jit.TripIndex(trips)
+        position = surface.get_or_create_position([0.0, 0.0])
+
+        nearest = index.nearest(position, 0.0, 1)[0]
+        index.remove(nearest)
+        index.discard(nearest)
+
+        self.assertNotIn(nearest, index)
+        self.assertNotIn(nearest, index.nearest(position, 0.0, 20))
+        with self.assertRaises(KeyError):
+            index.remove(nearest)
+
+    def test_without_grid(self):
+        surface = jit.MatrixSurface(np.array([[0.0, 1.0, 5.0], [1.0, 0.0, 4.0], [5.0, 4.0, 0.0]]))
+        a, b, c = (surface.get_or_create_position(node) for node in range(3))
+        near = jit.Trip("near", jit.Service(b), jit.Service(c))
+        far = jit.Trip("far", jit.Service(c), jit.Service(b))
+        late = jit.Trip("late", jit.Service(b, latest=0.5), jit.Service(c))
+        index = jit.TripIndex([far, late, near])
+
+        self.assertIsNone(index.cell_size)
+        self.assertEqual([near, far, late], index.nearest(a, 0.0, 3))
+        self.assertEqual([near], index.nearest(a, 0.0, 1))
+
+    def test_without_grid_with_times(self):
+        distance_matrix = np.array([[0.0, 1.0, 5.0], [1.0, 0.0, 4.0], [5.0, 4.0, 0.0]])
+        time_matrix = np.array([[0.0, 10.0, 2.0], [10.0, 0.0, 4.0], [2.0, 4.0, 0.0]])
+        surface = jit.MatrixSurface(distance_matrix, time_matrix)
+        a, b, c = (surface.get_or_create_position(node) for node in range(3))
+        close = jit.Trip("close", jit.Service(b), jit.Service(c))
+        quick = jit.Trip("quick", jit.Service(c), jit.Service(b))
+        index = jit.TripIndex([close, quick])
+
+        self.assertEqual([quick, close], index.nearest(a, 0.0, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
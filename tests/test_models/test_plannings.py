@@ -9,7 +9,11 @@ from uuid import UUID
 
 import jinete as jit
 
-from tests.utils import generate_routes
+from tests.utils import (
+    generate_one_planned_trip,
+    generate_one_trip,
+    generate_routes,
+)
 
 if TYPE_CHECKING:
     from typing import Set, List
@@ -52,6 +56,51 @@ class TestPlanning(unittest.TestCase):
         planning = jit.Planning(self.routes)
         self.assertEqual(list(planning.trips), self.trips)
 
+    def test_get_route(self):
+        planning = jit.Planning(self.routes)
+
+        for route in self.routes:
+            for trip in route.trips:
+                self.assertTrue(planning.contains_trip(trip))
+                self.assertEqual(route, planning.get_route(trip))
+                self.assertEqual(route.vehicle, planning.get_vehicle(trip))
+
+        trip = generate_one_trip()
+        self.assertFalse(planning.contains_trip(trip))
+        self.assertIsNone(planning.get_route(trip))
+        self.assertIsNone(planning.get_vehicle(trip))
+
+    def test_get_route_after_update(self):
+        planning = jit.Planning(self.routes)
+        route = next(route for route in self.routes if route.loaded)
+        trip = next(route.trips)
+        self.assertEqual(route, planning.get_route(trip))
+
+        new_route = route.clone()
+        new_route.remove_trip(trip)
+        planning.routes = (self.routes - {route}) | {new_route}
+        self.assertIsNone(planning.get_route(trip))
+
+    def test_set_route(self):
+        planning = jit.Planning(self.routes)
+        route = next(route for route in self.routes if route.loaded)
+        trip = next(route.trips)
+
+        new_route = route.clone()
+        new_route.remove_trip(trip)
+        planned_trip = generate_one_planned_trip(True, vehicle=new_route.vehicle, previous_stop=new_route.current_stop)
+        new_route.append_planned_trip(planned_trip)
+        added_trip = planned_trip.trip
+
+        self.assertEqual(route, planning.set_route(new_route))
+        self.assertEqual((self.routes - {route}) | {new_route}, planning.routes)
+        self.assertEqual(new_route, planning.vehicle_routes[route.vehicle])
+        self.assertIsNone(planning.get_route(trip))
+        self.assertEqual(new_route, planning.get_route(added_trip))
+        for other in new_route.trips:
+            self.assertEqual(new_route, planning.get_route(other))
+        self.assertIn(route, self.routes)
+
     def test_as_tuple(self):
         planning = jit.Planning(self.routes)
         expected = (
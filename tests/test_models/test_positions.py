@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from copy import deepcopy
 
@@ -44,6 +45,16 @@ class TestGeometricPosition(unittest.TestCase):
         copied_position = deepcopy(position)
         self.assertEqual(position, copied_position)
 
+    def test_pickle(self):
+        position = self.surface.get_or_create_position([1.0, 2.0])
+        other = self.surface.get_or_create_position([4.0, 6.0])
+
+        copied_position, copied_other = pickle.loads(pickle.dumps((position, other)))
+        self.assertIs(copied_position.surface, copied_other.surface)
+        self.assertIs(copied_position, copied_position.surface.get_or_create_position([1.0, 2.0]))
+        self.assertEqual(position.index, copied_position.index)
+        self.assertEqual(position.distance_to(other), copied_position.distance_to(copied_other))
+
     def test_as_tuple(self):
         coordinates = (
             3,
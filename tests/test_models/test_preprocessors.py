@@ -0,0 +1,81 @@
+import itertools as it
+import unittest
+
+import jinete as jit
+from jinete.models.compatibilities import feasible_sequence
+from tests.utils import generate_one_surface, generate_trips
+
+
+class TestJobPreprocessor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.surface = generate_one_surface()
+        self.depot = self.surface.get_or_create_position([0.0, 0.0])
+
+    def _vehicle(self, latest: float = jit.MAX_FLOAT) -> jit.Vehicle:
+        return jit.Vehicle("0", jit.Service(self.depot, latest=latest))
+
+    def test_tighten(self):
+        origin = jit.Service(self.surface.get_or_create_position([10.0, 0.0]), latest=100.0, duration=2.0)
+        destination = jit.Service(self.surface.get_or_create_position([30.0, 0.0]), duration=3.0)
+        trip = jit.Trip("0", origin, destination, timeout=25.0)
+        preprocessor = jit.JobPreprocessor(jit.Job({trip}, jit.DialARideObjective), jit.Fleet({self._vehicle(80.0)}))
+
+        preprocessor.tighten()
+
+        self.assertEqual(10.0, trip.origin_earliest)
+        self.assertEqual(32.0, trip.destination_earliest)
+        self.assertEqual(47.0, trip.destination_latest)
+        self.assertEqual(25.0, trip.origin_latest)
+
+    def test_tighten_with_origin_duration(self):
+        origin = jit.Service(self.surface.get_or_create_position([10.0, 0.0]), latest=20.0)
+        destination = jit.Service(self.surface.get_or_create_position([30.0, 0.0]))
+        trip = jit.Trip("0", origin, destination)
+        vehicle = jit.Vehicle("0", jit.Service(self.depot, duration=50.0))
+        preprocessor = jit.JobPreprocessor(jit.Job({trip}, jit.DialARideObjective), jit.Fleet({vehicle}))
+
+        preprocessor.tighten()
+
+        self.assertEqual(10.0, trip.origin_earliest)
+        self.assertEqual(20.0, trip.origin_latest)
+        route = jit.InsertionStrategy().compute(jit.Route(vehicle), trip, 0, 1)[0]
+        self.assertTrue(route.feasible)
+        self.assertEqual(10.0, route.stops[1].starting_time)
+
+    def test_infeasible_arcs(self):
+        trips = list(
+            generate_trips(
+                12,
+                surface=self.surface,
+                earliest_max=400,
+                timeout_min=50,
+                timeout_max=200,
+                load_time_min=0,
+                load_time_max=10,
+            )
+        )
+        preprocessor = jit.JobPreprocessor(jit.Job(set(trips), jit.DialARideObjective), jit.Fleet({self._vehicle()}))
+        preprocessor.tighten()
+        arcs = preprocessor.infeasible_arcs
+
+        self.assertIs(arcs, preprocessor.infeasible_arcs)
+        for trip in trips:
+            self.assertIn(((trip, False), (trip, True)), arcs)
+
+        infeasible_sequences = 0
+        for a, b in it.permutations(trips, 2):
+            pickup_a, delivery_a, pickup_b, delivery_b = (a, True), (a, False), (b, True), (b, False)
+            for sequence in (
+                (pickup_a, delivery_a, pickup_b, delivery_b),
+                (pickup_a, pickup_b, delivery_a, delivery_b),
+                (pickup_a, pickup_b, delivery_b, delivery_a),
+            ):
+                if feasible_sequence(sequence):
+                    self.assertFalse(any(arc in arcs for arc in zip(sequence[:-1], sequence[1:])))
+                else:
+                    infeasible_sequences += 1
+        self.assertLess(0, infeasible_sequences)
+
+
+if __name__ == "__main__":
+    unittest.main()
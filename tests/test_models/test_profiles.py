@@ -0,0 +1,37 @@
+import unittest
+
+import jinete as jit
+
+
+class TestSpeedProfile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.profile = jit.SpeedProfile([0.0, 100.0, 200.0], [1.0, 0.5, 1.0], period=300.0)
+
+    def test_creation(self):
+        self.assertEqual((0.0, 100.0, 200.0), self.profile.breakpoints)
+        self.assertEqual((1.0, 0.5, 1.0), self.profile.speeds)
+        self.assertEqual(300.0, self.profile.period)
+        self.assertEqual(1.0, self.profile.max_speed)
+
+    def test_creation_not_valid(self):
+        with self.assertRaises(ValueError):
+            jit.SpeedProfile([10.0], [1.0])
+        with self.assertRaises(ValueError):
+            jit.SpeedProfile([0.0, 10.0], [1.0, 0.0])
+        with self.assertRaises(ValueError):
+            jit.SpeedProfile([0.0, 10.0], [1.0])
+
+    def test_travel_time(self):
+        self.assertEqual(10.0, self.profile.travel_time(10.0, 0.0))
+        self.assertEqual(20.0, self.profile.travel_time(10.0, 100.0))
+        self.assertEqual(15.0, self.profile.travel_time(10.0, 95.0))
+        self.assertEqual(10.0, self.profile.travel_time(10.0, 600.0))
+        self.assertEqual(20.0, self.profile.travel_time(10.0, 400.0))
+
+    def test_travel_time_fifo(self):
+        arrival_times = [t + self.profile.travel_time(30.0, t) for t in range(0, 600, 5)]
+        self.assertEqual(sorted(arrival_times), arrival_times)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ import jinete as jit
 from tests.utils import (
     generate_one_vehicle,
     generate_one_route,
+    generate_one_trip,
 )
 
 
@@ -29,6 +30,57 @@ class TestRoutes(unittest.TestCase):
         route = generate_one_route(False)
         self.assertFalse(route.feasible)
 
+    def test_segments(self):
+        route = generate_one_route()
+
+        self.assertAlmostEqual(sum(stop.distance for stop in route.stops), route.distance)
+        self.assertAlmostEqual(sum(stop.waiting_time for stop in route.stops), route.waiting_time)
+
+        for planned_trip in route.planned_trips:
+            pickup_idx, delivery_idx = route.stops.index(planned_trip.pickup), route.stops.index(planned_trip.delivery)
+            stops = route.stops[pickup_idx + 1 : delivery_idx + 1]
+
+            self.assertEqual((route, pickup_idx, delivery_idx), planned_trip.segment)
+            self.assertAlmostEqual(sum(stop.waiting_time for stop in stops), planned_trip.waiting_time)
+            self.assertAlmostEqual(sum(stop.transit_time for stop in stops), planned_trip.transit_time)
+            self.assertAlmostEqual(
+                sum(stop.distance for stop in stops), route.segment_distance(pickup_idx, delivery_idx),
+            )
+
+    def test_trip_indices(self):
+        route = generate_one_route()
+
+        for idx, stop in enumerate(route.stops):
+            self.assertEqual(idx, route.get_stop_index(stop))
+
+        for planned_trip in route.planned_trips:
+            self.assertTrue(route.contains_trip(planned_trip.trip))
+            self.assertEqual(planned_trip, route.get_planned_trip(planned_trip.trip))
+            pickup_idx, delivery_idx = route.get_trip_indices(planned_trip.trip)
+            self.assertIs(planned_trip.pickup, route.stops[pickup_idx])
+            self.assertIs(planned_trip.delivery, route.stops[delivery_idx])
+            self.assertLess(pickup_idx, delivery_idx)
+
+        trip = generate_one_trip()
+        self.assertFalse(route.contains_trip(trip))
+        self.assertIsNone(route.get_planned_trip(trip))
+        self.assertIsNone(route.get_trip_indices(trip))
+
+    def test_remove_trip(self):
+        route = generate_one_route(planned_trips_min=2)
+        trip = next(route.trips)
+        stops_count = len(route.stops)
+
+        route.remove_trip(trip)
+
+        self.assertEqual(stops_count - 2, len(route.stops))
+        self.assertFalse(route.contains_trip(trip))
+        self.assertNotIn(trip, set(route.trips))
+        for planned_trip in route.planned_trips:
+            pickup_idx, delivery_idx = route.get_trip_indices(planned_trip.trip)
+            self.assertIs(planned_trip.pickup, route.stops[pickup_idx])
+            self.assertIs(planned_trip.delivery, route.stops[delivery_idx])
+
 
 if __name__ == "__main__":
     unittest.main()
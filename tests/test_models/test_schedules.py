@@ -0,0 +1,216 @@
+import itertools as it
+import unittest
+
+import jinete as jit
+
+from tests.utils import (
+    generate_one_loader,
+    generate_one_route,
+    generate_one_position,
+    generate_trips,
+)
+
+
+class TestSchedule(unittest.TestCase):
+    def test_creation(self):
+        route = generate_one_route()
+        schedule = route.schedule
+
+        self.assertIsInstance(schedule, jit.Schedule)
+        self.assertEqual(route, schedule.route)
+        self.assertTrue(schedule.computed)
+        self.assertEqual(len(route.stops), len(schedule))
+
+    def test_values(self):
+        route = generate_one_route()
+        schedule = route.schedule
+
+        self.assertEqual([stop.position for stop in route.stops], schedule.positions)
+        for idx, stop in enumerate(route.stops):
+            self.assertAlmostEqual(stop.earliest, schedule.earliest[idx])
+            self.assertAlmostEqual(stop.latest, schedule.latest[idx])
+            self.assertAlmostEqual(stop.load_time, schedule.load_times[idx])
+            self.assertAlmostEqual(stop.arrival_time, schedule.arrival_times[idx])
+            self.assertAlmostEqual(stop.starting_time, schedule.starting_times[idx])
+            self.assertAlmostEqual(stop.departure_time, schedule.departure_times[idx])
+            self.assertAlmostEqual(stop.capacity, schedule.capacities[idx])
+
+    def test_feasible(self):
+        route = generate_one_route(True)
+        self.assertTrue(route.schedule.feasible)
+
+    def test_not_feasible(self):
+        route = generate_one_route(False)
+        self.assertFalse(route.schedule.feasible)
+
+    def test_slacks(self):
+        route = generate_one_route()
+        schedule = route.schedule
+
+        self.assertEqual(len(route.stops), len(schedule.forward_slacks))
+        self.assertEqual(len(route.stops), len(schedule.cumulative_waiting_times))
+        self.assertEqual(len(route.stops), len(schedule.downstream_capacities))
+
+        self.assertAlmostEqual(route.waiting_time, schedule.cumulative_waiting_times[-1])
+        for idx in range(len(route.stops) - 1):
+            self.assertGreaterEqual(schedule.downstream_capacities[idx], schedule.downstream_capacities[idx + 1])
+            self.assertGreaterEqual(schedule.downstream_capacities[idx], schedule.capacities[idx])
+            self.assertLessEqual(schedule.forward_slacks[idx], schedule.latest[idx] - schedule.starting_times[idx])
+
+    def test_segments(self):
+        route = generate_one_route()
+        schedule = route.schedule
+
+        for i, j in it.combinations(range(len(route.stops)), 2):
+            stops = route.stops[i + 1 : j + 1]
+            self.assertAlmostEqual(sum(stop.distance for stop in stops), schedule.distance(i, j))
+            self.assertAlmostEqual(sum(stop.transit_time for stop in stops), schedule.transit_time(i, j))
+            self.assertAlmostEqual(sum(stop.waiting_time for stop in stops), schedule.waiting_time(i, j))
+
+    def test_feasible_insertion(self):
+        route = generate_one_route(True, planned_trips_count=5)
+        trips = generate_trips(5, earliest=0.0)
+        strategy = jit.InsertionStrategy()
+
+        for trip, (i, j) in it.product(trips, it.combinations(range(len(route.stops)), 2)):
+            conjectured_route = strategy.compute(route, trip, i, j, only_feasible=False)[0]
+            if not conjectured_route.feasible:
+                continue
+            self.assertTrue(route.feasible_insertion(trip, i, j))
+
+    def test_feasible_insertion_with_duration(self):
+        surface = jit.GeometricSurface(jit.DistanceMetric.MANHATTAN)
+        a, b, c = (surface.get_or_create_position([x, 0.0]) for x in (0.0, 10.0, 20.0))
+        vehicle = jit.Vehicle("0", jit.Service(a), jit.Service(c), timeout=20.0)
+        first = jit.Trip("1", jit.Service(b, earliest=10.0), jit.Service(c))
+        second = jit.Trip("2", jit.Service(a, earliest=5.0), jit.Service(b))
+        strategy = jit.InsertionStrategy()
+
+        route = strategy.compute(jit.Route(vehicle), first, 0, 1)[0]
+        self.assertEqual(20.0, route.duration)
+
+        conjectured_route = strategy.compute(route, second, 0, 1, only_feasible=False)[0]
+        self.assertTrue(conjectured_route.feasible)
+        self.assertEqual(20.0, conjectured_route.duration)
+        self.assertTrue(route.feasible_insertion(second, 0, 1))
+
+    def test_feasible_insertion_with_ride_times(self):
+        loader = generate_one_loader()()
+        result = jit.InsertionAlgorithm(job=loader.job, fleet=loader.fleet).optimize()
+        strategy = jit.IntensiveInsertionStrategy()
+
+        feasibles = 0
+        for route in result.routes:
+            for trip in list(route.trips):
+                partial_route = route.clone()
+                partial_route.remove_trip(trip)
+
+                expected = strategy.compute(partial_route, trip, only_feasible=False)
+                expected = [(r.first_departure_time, r.duration) for r in expected if r.feasible]
+                obtained = strategy.compute(partial_route, trip, only_feasible=True)
+                obtained = [(r.first_departure_time, r.duration) for r in obtained]
+                self.assertEqual(expected, obtained)
+                feasibles += len(expected)
+        self.assertLess(0, feasibles)
+
+    def test_feasible_insertion_time_dependent(self):
+        profile = jit.SpeedProfile([0.0, 100.0], [0.1, 10.0])
+        surface = jit.TimeDependentSurface(jit.DistanceMetric.MANHATTAN, profile, bucket_size=1.0)
+        a, b = surface.get_or_create_position([0.0, 0.0]), surface.get_or_create_position([10.0, 0.0])
+        vehicle = jit.Vehicle("0", jit.Service(a), jit.Service(b), capacity=2.0)
+        first = jit.Trip("1", jit.Service(a), jit.Service(b, latest=101.0))
+        second = jit.Trip("2", jit.Service(a, earliest=60.0), jit.Service(b, latest=101.0))
+        strategy = jit.InsertionStrategy()
+
+        route = strategy.compute(jit.Route(vehicle), first, 0, 1)[0]
+        self.assertEqual([0.0, 0.0, 100.0, 100.0], [stop.starting_time for stop in route.stops])
+
+        conjectured_route = strategy.compute(route, second, 0, 3, only_feasible=False)[0]
+        self.assertTrue(conjectured_route.feasible)
+        self.assertEqual(
+            [60.0, 60.0, 60.0, 100.6, 100.6, 100.6],
+            [round(stop.starting_time, 6) for stop in conjectured_route.stops],
+        )
+        self.assertTrue(route.feasible_insertion(second, 0, 3))
+        self.assertEqual(4, len(jit.IntensiveInsertionStrategy().compute(route, second)))
+        self.assertEqual(1, len(jit.BestInsertionStrategy().compute(route, second)))
+
+    def test_flush(self):
+        route = generate_one_route()
+        schedule = route.schedule
+        self.assertTrue(schedule.computed)
+
+        stop = jit.Stop(route.vehicle, generate_one_position(), route.current_stop)
+        route.insert_stop(stop)
+        self.assertFalse(schedule.computed)
+
+        self.assertEqual(len(route.stops), len(route.schedule))
+        self.assertEqual(stop.position, route.schedule.positions[-2])
+        self.assertAlmostEqual(stop.departure_time, route.schedule.departure_times[-2])
+
+    def test_bind(self):
+        route = generate_one_route(planned_trips_count=5)
+        route.schedule.update()
+        threshold = 4
+
+        cloned_route = route.clone(threshold)
+        cloned_route.flush()
+        cloned_route.schedule.update()
+        shared = {id(stop) for stop in route.stops} & {id(stop) for stop in cloned_route.stops}
+        self.assertTrue(shared)
+        for idx, stop in enumerate(cloned_route.stops):
+            if id(stop) in shared:
+                self.assertIs(route, stop.route)
+            else:
+                self.assertIs(cloned_route, stop.route)
+                self.assertEqual(idx, stop.index)
+
+        cloned_route.schedule.bind()
+        for idx, stop in enumerate(cloned_route.stops):
+            self.assertIs(cloned_route, stop.route)
+            self.assertEqual(idx, stop.index)
+
+    def test_flush_shared_stop(self):
+        route = generate_one_route(planned_trips_count=5)
+        route.schedule.update()
+        threshold = 4
+
+        cloned_route = route.clone(threshold)
+        self.assertTrue(cloned_route.feasible)
+
+        stop = cloned_route.stops[1]
+        self.assertIs(route.stops[1], stop)
+        self.assertIs(route, stop.route)
+        stop.starting_time = stop.latest + 1.0
+
+        expected = jit.Route(cloned_route.vehicle, list(cloned_route.stops))
+        self.assertFalse(expected.feasible)
+        self.assertEqual(expected.feasible, cloned_route.feasible)
+        self.assertAlmostEqual(expected.duration, cloned_route.duration)
+        self.assertEqual(expected.feasible, route.feasible)
+
+        cloned_route.schedule.bind()
+        stop.starting_time = None
+        self.assertTrue(cloned_route.feasible)
+        self.assertTrue(route.feasible)
+
+    def test_flush_shared_stop_after_insertion(self):
+        route = generate_one_route(planned_trips_count=5)
+        route.schedule.update()
+        threshold = 4
+
+        cloned_route = route.clone(threshold)
+        cloned_route.insert_stop_at(1, jit.Stop(route.vehicle, generate_one_position(), cloned_route.stops[0]))
+        cloned_route.schedule.update()
+
+        stop = route.stops[2]
+        self.assertIn(stop, cloned_route.stops)
+        stop.starting_time = stop.latest + 1.0
+        self.assertFalse(route.feasible)
+        self.assertAlmostEqual(
+            jit.Route(cloned_route.vehicle, list(cloned_route.stops)).duration, cloned_route.duration,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from copy import deepcopy
 
@@ -106,6 +107,12 @@ class TestServices(unittest.TestCase):
         copied_position = deepcopy(position)
         self.assertEqual(position, copied_position)
 
+    def test_pickle(self):
+        service = jit.Service(generate_one_position(), earliest=3.0, latest=10.0, duration=2.0)
+        copied_service = pickle.loads(pickle.dumps(service))
+        self.assertEqual(tuple(service), tuple(copied_service))
+        self.assertEqual(hash(service), hash(copied_service))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -28,18 +28,10 @@ class TestStop(unittest.TestCase):
 
     def setUp(self) -> None:
         stop0 = jit.Stop(self.vehicle, self.position, None)
-
         stop1 = jit.Stop(self.vehicle, generate_one_position(), stop0)
-        stop0.following = stop1
-
         stop2 = jit.Stop(self.vehicle, generate_one_position(), stop1)
-        stop1.following = stop2
-
         stop3 = jit.Stop(self.vehicle, generate_one_position(), stop2)
-        stop2.following = stop3
-
         stop4 = jit.Stop(self.vehicle, generate_one_position(), stop3)
-        stop3.following = stop4
 
         stops = [stop0, stop1, stop2, stop3, stop4]
         self.stops = stops
@@ -47,8 +39,8 @@ class TestStop(unittest.TestCase):
     def test_creation(self):
         stop = jit.Stop(self.vehicle, self.position, None)
 
-        self.assertNotIn("arrival_time", stop.__dict__)
-        self.assertNotIn("departure_time", stop.__dict__)
+        self.assertIsNone(stop.route)
+        self.assertIsNone(stop.index)
 
         self.assertEqual(self.vehicle, stop.vehicle)
         self.assertEqual(self.position, stop.position)
@@ -63,14 +55,19 @@ class TestStop(unittest.TestCase):
         self.assertEqual(0, len(tuple(stop.planned_trips)))
         self.assertEqual(0, len(tuple(stop.trips)))
 
+    def test_slots(self):
+        stop = jit.Stop(self.vehicle, self.position, None)
+
+        self.assertFalse(hasattr(stop, "__dict__"))
+        with self.assertRaises(AttributeError):
+            stop.following = None
+
     def test_creation_with_previous(self):
         previous_position = generate_one_position()
         previous_stop = jit.Stop(self.vehicle, previous_position, None)
 
         stop = jit.Stop(self.vehicle, self.position, previous_stop)
-        previous_stop.following = stop
 
-        self.assertEqual(previous_stop.following, stop)
         self.assertEqual(self.vehicle, stop.vehicle)
         self.assertEqual(self.position, stop.position)
         self.assertEqual(previous_stop, stop.previous)
@@ -82,39 +79,62 @@ class TestStop(unittest.TestCase):
         )
 
     def test_flush(self):
-        stop = jit.Stop(self.vehicle, self.position, None)
-
-        self.assertNotIn("arrival_time", stop.__dict__)
-        self.assertNotIn("departure_time", stop.__dict__)
-
-        self.assertIsInstance(stop.departure_time, float)
+        schedule = jit.Route(self.vehicle, self.stops).schedule
+        self.assertTrue(schedule.computed)
 
-        self.assertIn("arrival_time", stop.__dict__)
-        self.assertIn("departure_time", stop.__dict__)
+        self.stops[2].flush()
+        self.assertFalse(schedule.computed)
+        self.assertEqual(2, schedule.dirty_from)
 
-        stop.flush()
-
-        self.assertNotIn("arrival_time", stop.__dict__)
-        self.assertNotIn("departure_time", stop.__dict__)
+        self.stops[3].flush()
+        self.assertEqual(2, schedule.dirty_from)
 
-    def test_cache(self):
         self.assertIsInstance(self.stops[-1].departure_time, float)
-        for stop in self.stops:
-            self.assertIn("arrival_time", stop.__dict__)
-            self.assertIn("departure_time", stop.__dict__)
-
-    def test_all_previous(self):
-        self.assertIsInstance(self.stops[-1].departure_time, float)
-
-        self.stops[2].flush_all_previous()
-
-        for stop in self.stops[:3]:
-            self.assertNotIn("arrival_time", stop.__dict__)
-            self.assertNotIn("departure_time", stop.__dict__)
+        self.assertTrue(schedule.computed)
+
+    def test_bound(self):
+        route = jit.Route(self.vehicle, self.stops)
+        self.assertTrue(route.schedule.computed)
+
+        for idx, stop in enumerate(self.stops):
+            self.assertEqual(route, stop.route)
+            self.assertEqual(idx, stop.index)
+            self.assertEqual(route.schedule.arrival_times[idx], stop.arrival_time)
+            self.assertEqual(route.schedule.departure_times[idx], stop.departure_time)
+
+        removed = route.remove_stop_at(2)
+        self.assertIsNone(removed.route)
+        self.assertIsNone(removed.index)
+
+    def test_unbound(self):
+        expected = [(stop.arrival_time, stop.departure_time) for stop in self.stops]
+
+        route = jit.Route(self.vehicle, self.stops)
+        self.assertTrue(route.schedule.computed)
+        for stop, (arrival_time, departure_time) in zip(self.stops, expected):
+            self.assertAlmostEqual(arrival_time, stop.arrival_time)
+            self.assertAlmostEqual(departure_time, stop.departure_time)
+
+    def test_starting_time(self):
+        schedule = jit.Route(self.vehicle, self.stops).schedule
+        self.assertTrue(schedule.computed)
+        departure_time = self.stops[-1].departure_time
+
+        self.stops[2].starting_time = self.stops[2].starting_time + 10.0
+        self.assertFalse(schedule.computed)
+        self.assertEqual(2, schedule.dirty_from)
+        self.assertLessEqual(departure_time, self.stops[-1].departure_time)
+
+    def test_flush_bounds(self):
+        stop = jit.Stop(self.vehicle, self.position, self.stops[0])
+        planned_trip = generate_one_planned_trip(feasible=True, vehicle=self.vehicle, pickup_stop=stop)
+        trip = planned_trip.trip
+        self.assertEqual(trip.origin_earliest, stop.earliest)
 
-        for stop in self.stops[3:]:
-            self.assertIn("arrival_time", stop.__dict__)
-            self.assertIn("departure_time", stop.__dict__)
+        trip.tighten(origin_earliest=trip.origin_earliest + 1.0, origin_latest=trip.origin_latest - 1.0)
+        stop.flush()
+        self.assertEqual(trip.origin_earliest, stop.earliest)
+        self.assertEqual(trip.origin_latest, stop.latest)
 
     def test_with_planned_trip(self):
         stop = jit.Stop(self.vehicle, self.position, self.stops[0])
@@ -131,6 +151,18 @@ class TestStop(unittest.TestCase):
         self.assertIn(pickup_planned_trip, stop.pickup_planned_trips)
         self.assertIsInstance(stop.identifier, str)
 
+        self.assertEqual(
+            max(delivery_planned_trip.trip.destination_earliest, pickup_planned_trip.trip.origin_earliest),
+            stop.earliest,
+        )
+        self.assertEqual(
+            min(delivery_planned_trip.trip.destination_latest, pickup_planned_trip.trip.origin_latest), stop.latest,
+        )
+        self.assertEqual(
+            max(delivery_planned_trip.trip.destination_duration, pickup_planned_trip.trip.origin_duration),
+            stop.load_time,
+        )
+
         iterable = it.chain(
             (f"P{planned_trip.trip_identifier}" for planned_trip in stop.pickup_planned_trips),
             (f"D{planned_trip.trip_identifier}" for planned_trip in stop.delivery_planned_trips),
@@ -1,8 +1,16 @@
+import itertools as it
+import pickle
 import unittest
 
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from uuid import UUID
 
+import networkx as nx
+import numpy as np
+
 import jinete as jit
+from jinete.utils import LRUCache
 from tests.utils import generate_positions
 
 
@@ -23,6 +31,237 @@ class TestSurfaces(unittest.TestCase):
         dist = surface.distance(a, b)
         self.assertAlmostEqual(dist, real_dist)
 
+    def test_dense_distance(self):
+        for metric in (jit.DistanceMetric.EUCLIDEAN, jit.DistanceMetric.MANHATTAN):
+            surface = jit.GeometricSurface(metric, dense=True)
+            positions = list(generate_positions(20, surface=surface))
+            surface.finalize()
+
+            for a, b in it.product(positions, repeat=2):
+                self.assertAlmostEqual(metric(a.coordinates, b.coordinates), surface.distance(a, b))
+
+    def test_dense_distance_float32(self):
+        surface = jit.GeometricSurface(jit.DistanceMetric.EUCLIDEAN, dense=True, dtype="float32")
+        a, b = surface.get_or_create_position([0.0, 0.0]), surface.get_or_create_position([3.0, 4.0])
+
+        self.assertEqual(5.0, surface.distance(a, b))
+        self.assertEqual(5.0, surface.distance(b, a))
+        self.assertEqual(0.0, surface.distance(a, a))
+
+        c = surface.get_or_create_position([6.0, 8.0])
+        self.assertEqual(5.0, surface.distance(b, c))
+
+    def test_time_dependent_surface(self):
+        profile = jit.SpeedProfile([0.0, 100.0, 200.0], [1.0, 0.5, 1.0])
+        surface = jit.TimeDependentSurface(jit.DistanceMetric.MANHATTAN, profile, bucket_size=50.0)
+        a, b = surface.get_or_create_position([0.0, 0.0]), surface.get_or_create_position([10.0, 0.0])
+
+        self.assertEqual(10.0, surface.distance(a, b))
+        self.assertEqual(10.0, surface.time(a, b))
+        for now in (0.0, 50.0, 100.0, 150.0, 200.0, 250.0):
+            self.assertAlmostEqual(profile.travel_time(10.0, now), surface.time(a, b, now=now))
+        self.assertAlmostEqual(10.0, a.time_to(b, 25.0))
+        self.assertAlmostEqual(12.0, a.time_to(b, 60.0))
+
+        arrival_times = [now + surface.time(a, b, now=now) for now in range(0, 300, 7)]
+        self.assertEqual(sorted(arrival_times), arrival_times)
+
+    def test_time_dependent_surface_with_zones(self):
+        slow = jit.SpeedProfile([0.0], [0.5])
+        surface = jit.TimeDependentSurface(
+            jit.DistanceMetric.MANHATTAN,
+            jit.SpeedProfile([0.0], [1.0]),
+            profiles={(True, False): slow},
+            zone=lambda position: position[0] < 5,
+        )
+        a, b = surface.get_or_create_position([0.0, 0.0]), surface.get_or_create_position([10.0, 0.0])
+
+        self.assertIs(slow, surface.profile(a, b))
+        self.assertEqual(20.0, surface.time(a, b, now=0.0))
+        self.assertEqual(10.0, surface.time(b, a, now=0.0))
+
+    def test_matrix_surface(self):
+        distance_matrix = np.array([[0.0, 1.0], [2.0, 0.0]])
+        time_matrix = np.array([[0.0, 10.0], [20.0, 0.0]])
+        surface = jit.MatrixSurface(distance_matrix, time_matrix)
+        a, b = surface.get_or_create_position(0), surface.get_or_create_position(1)
+
+        self.assertIsInstance(a, jit.MatrixPosition)
+        self.assertIs(a, surface.get_or_create_position(0))
+        self.assertEqual(1.0, surface.distance(a, b))
+        self.assertEqual(2.0, surface.distance(b, a))
+        self.assertEqual(10.0, surface.time(a, b))
+        self.assertEqual(20.0, a.time_to(b, now=0.0) + b.time_to(a) - 10.0)
+
+        with self.assertRaises(ValueError):
+            surface.get_or_create_position(2)
+        with self.assertRaises(ValueError):
+            jit.MatrixSurface(np.zeros((2, 3)))
+
+    def test_matrix_surface_from_files(self):
+        distance_matrix = np.arange(16, dtype=np.float32).reshape(4, 4)
+        with TemporaryDirectory() as directory:
+            npy_path, raw_path = Path(directory) / "distance.npy", Path(directory) / "time.bin"
+            np.save(npy_path, distance_matrix)
+            (distance_matrix * 2).tofile(raw_path)
+
+            surface = jit.MatrixSurface.from_files(npy_path, raw_path, dtype="float32")
+            a, b = surface.get_or_create_position(1), surface.get_or_create_position(3)
+
+            self.assertEqual(7.0, surface.distance(a, b))
+            self.assertEqual(14.0, surface.time(a, b))
+            del surface, a, b
+
+    def test_matrix_surface_pickle(self):
+        distance_matrix = np.arange(1_000_000, dtype=np.float64).reshape(1000, 1000)
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "distance.npy"
+            np.save(path, distance_matrix)
+
+            surface = jit.MatrixSurface.from_files(path)
+            a, b = surface.get_or_create_position(1), surface.get_or_create_position(3)
+            data = pickle.dumps(surface, protocol=pickle.HIGHEST_PROTOCOL)
+            self.assertLess(len(data), 10_000)
+
+            loaded = pickle.loads(data)
+            self.assertIsInstance(loaded.distance_matrix, np.memmap)
+            self.assertIs(loaded.distance_matrix, loaded.time_matrix)
+            self.assertEqual(surface.uuid, loaded.uuid)
+            self.assertIs(loaded, loaded.positions[0].surface)
+            self.assertEqual(1003.0, loaded.distance(*loaded.positions))
+            del surface, loaded, a, b
+
+        surface = jit.MatrixSurface(distance_matrix, distance_matrix * 2)
+        loaded = pickle.loads(pickle.dumps(surface, protocol=pickle.HIGHEST_PROTOCOL))
+        np.testing.assert_array_equal(distance_matrix * 2, loaded.time_matrix)
+
+    def test_graph_surface(self):
+        graph = nx.DiGraph()
+        graph.add_edge("a", "b", distance=1.0, time=5.0)
+        graph.add_edge("b", "c", distance=2.0, time=1.0)
+        graph.add_edge("a", "c", distance=4.0, time=2.0)
+        graph.add_node("d")
+        surface = jit.GraphSurface(graph, time_weight="time", cached_rows=LRUCache(1))
+        a, c, d = (surface.get_or_create_position(node) for node in ("a", "c", "d"))
+
+        self.assertIsInstance(a, jit.GraphPosition)
+        self.assertEqual(3.0, surface.distance(a, c))
+        self.assertEqual(2.0, surface.time(a, c))
+        self.assertEqual(jit.MAX_FLOAT, surface.distance(c, a))
+        self.assertEqual(jit.MAX_FLOAT, surface.distance(a, d))
+        self.assertEqual(1, len(surface.cached_rows))
+        self.assertEqual(2, surface.cached_rows.evictions)
+
+        with self.assertRaises(ValueError):
+            surface.get_or_create_position("e")
+
+    def test_graph_surface_precompute(self):
+        graph = nx.grid_2d_graph(5, 5)
+        nx.set_edge_attributes(graph, 1.0, "distance")
+        surface = jit.GraphSurface(graph, cached_rows=dict())
+        positions = [surface.get_or_create_position(node) for node in graph.nodes]
+
+        surface.precompute(positions[:10], processes=2)
+        surface.precompute(positions)
+        self.assertEqual(len(positions), len(surface.cached_rows))
+        self.assertEqual(8.0, surface.distance(positions[0], positions[-1]))
+        self.assertEqual(8.0, positions[-1].time_to(positions[0]))
+
+    def test_contraction_hierarchy_surface(self):
+        graph = nx.DiGraph()
+        graph.add_edge("a", "b", distance=1.0, time=5.0)
+        graph.add_edge("b", "c", distance=2.0, time=1.0)
+        graph.add_edge("a", "c", distance=4.0, time=2.0)
+        surface = jit.ContractionHierarchySurface(
+            jit.ContractionHierarchy.build(graph, "distance"), jit.ContractionHierarchy.build(graph, "time"),
+        )
+        a, c = surface.get_or_create_position("a"), surface.get_or_create_position("c")
+
+        self.assertIsInstance(a, jit.GraphPosition)
+        self.assertEqual(3.0, surface.distance(a, c))
+        self.assertEqual(2.0, surface.time(a, c))
+        self.assertEqual(jit.MAX_FLOAT, a.distance_to(c) + c.distance_to(a))
+
+        with self.assertRaises(ValueError):
+            surface.get_or_create_position("d")
+
+    def test_bounded_cache(self):
+        surface = jit.GeometricSurface(jit.DistanceMetric.EUCLIDEAN, cached_distance=LRUCache(2))
+        a, b, c = (surface.get_or_create_position([float(x), 0.0]) for x in range(3))
+
+        self.assertEqual(1.0, surface.distance(a, b))
+        self.assertEqual(1.0, surface.distance(a, b))
+        self.assertEqual(2.0, surface.distance(a, c))
+        self.assertEqual(1.0, surface.distance(b, c))
+        self.assertEqual(
+            {
+                "size": 2,
+                "max_size": 2,
+                "nbytes": 0,
+                "max_bytes": None,
+                "hits": 1,
+                "misses": 3,
+                "evictions": 1,
+                "hit_rate": 0.25,
+            },
+            surface.cached_distance.statistics,
+        )
+
+    def test_distance_many(self):
+        for metric in (jit.DistanceMetric.EUCLIDEAN, jit.DistanceMetric.MANHATTAN):
+            surface = jit.GeometricSurface(metric)
+            positions = list(generate_positions(10, surface=surface))
+            origins, destinations = zip(*it.product(positions, repeat=2))
+
+            expected = [surface.distance(a, b) for a, b in zip(origins, destinations)]
+            np.testing.assert_allclose(expected, surface.distance_many(origins, destinations))
+            np.testing.assert_allclose(expected, surface.time_many(origins, destinations))
+
+            ids = [position.index for position in origins], [position.index for position in destinations]
+            np.testing.assert_allclose(expected, surface.distance_many(*ids))
+            np.testing.assert_allclose(expected, surface.distance_many(*(np.array(values) for values in ids)))
+
+        with self.assertRaises(ValueError):
+            surface.distance_many(positions[:2], positions[:3])
+
+    def test_distance_many_matrix_surface(self):
+        distance_matrix = np.arange(9, dtype=float).reshape(3, 3)
+        surface = jit.MatrixSurface(distance_matrix, distance_matrix * 10)
+        a, b, c = (surface.get_or_create_position(node) for node in (2, 0, 1))
+
+        np.testing.assert_array_equal([6.0, 1.0, 5.0], surface.distance_many([a, b, c], [b, c, a]))
+        np.testing.assert_array_equal([60.0, 10.0, 50.0], surface.time_many([a, b, c], [b, c, a]))
+
+    def test_time_many_time_dependent_surface(self):
+        profile = jit.SpeedProfile([0.0, 100.0, 200.0], [1.0, 0.5, 1.0])
+        surface = jit.TimeDependentSurface(jit.DistanceMetric.MANHATTAN, profile, bucket_size=50.0)
+        a, b = surface.get_or_create_position([0.0, 0.0]), surface.get_or_create_position([10.0, 0.0])
+
+        np.testing.assert_allclose([10.0, 0.0], surface.distance_many([a, a], [b, a]))
+        np.testing.assert_allclose([20.0, 0.0], surface.time_many([a, b], [b, b], now=150.0))
+
+    def test_get_or_create_position(self):
+        surface = jit.GeometricSurface(jit.DistanceMetric.EUCLIDEAN)
+        a = surface.get_or_create_position([1.0, 2.0])
+        b = surface.get_or_create_position([3.0, 4.0])
+
+        self.assertIs(a, surface.get_or_create_position([1.0, 2.0]))
+        self.assertEqual([0, 1], [a.index, b.index])
+        self.assertEqual([a, b], surface.positions)
+        self.assertNotEqual(a, b)
+
+    def test_get_or_create_service(self):
+        surface = jit.GeometricSurface(jit.DistanceMetric.EUCLIDEAN)
+        position = surface.get_or_create_position([1.0, 2.0])
+        a = surface.get_or_create_service(position, earliest=10.0)
+        b = surface.get_or_create_service(position, earliest=20.0)
+
+        self.assertIs(a, surface.get_or_create_service(position, earliest=10.0))
+        self.assertEqual([0, 1], [a.index, b.index])
+        self.assertEqual([a, b], surface.services)
+        self.assertNotEqual(a, b)
+        self.assertEqual(a, jit.Service(position, earliest=10.0))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -108,6 +108,46 @@ class TestTrips(unittest.TestCase):
 
         self.assertEqual(expected, tuple(trip))
 
+    def test_flush(self):
+        origin = jit.Service(position=generate_one_position(), earliest=100, latest=200)
+        destination = jit.Service(position=generate_one_position())
+        trip = jit.Trip(identifier=str(), origin=origin, destination=destination, timeout=100)
+
+        self.assertEqual(300, trip.destination_latest)
+
+        trip.timeout = 200
+        self.assertEqual(300, trip.destination_latest)
+
+        trip.flush()
+        self.assertEqual(400, trip.destination_latest)
+
+    def test_tighten(self):
+        origin = jit.Service(position=generate_one_position(), earliest=100, latest=200)
+        destination = jit.Service(position=generate_one_position())
+        trip = jit.Trip(identifier=str(), origin=origin, destination=destination, timeout=100)
+
+        trip.tighten(origin_earliest=150, origin_latest=250, destination_latest=280)
+        self.assertEqual(150, trip.origin_earliest)
+        self.assertEqual(200, trip.origin_latest)
+        self.assertEqual(280, trip.destination_latest)
+
+        trip.flush()
+        self.assertEqual(100, trip.origin_earliest)
+        self.assertEqual(300, trip.destination_latest)
+
+    def test_index(self):
+        origin = jit.Service(position=generate_one_position())
+        destination = jit.Service(position=generate_one_position())
+        trip = jit.Trip(identifier=str(), origin=origin, destination=destination, index=3)
+
+        self.assertEqual(3, trip.index)
+        self.assertEqual(3, hash(trip))
+
+    def test_slots(self):
+        trip = jit.Trip(identifier=str(), origin=jit.Service(generate_one_position()), destination=None)
+
+        self.assertFalse(hasattr(trip, "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+
+import numpy as np
+
+from jinete.utils import (
+    ClockCache,
+    LRUCache,
+    estimate_size,
+)
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_creation(self):
+        cache = LRUCache(2)
+        self.assertEqual(2, cache.max_size)
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0.0, cache.hit_rate)
+
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+        with self.assertRaises(ValueError):
+            LRUCache()
+        with self.assertRaises(ValueError):
+            LRUCache(max_bytes=0)
+
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache["a"], cache["b"] = 1, 2
+        self.assertEqual(1, cache["a"])
+
+        cache["c"] = 3
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIsNone(cache.get("b"))
+        with self.assertRaises(KeyError):
+            cache["b"]  # noqa
+
+        self.assertEqual((1, 2, 1), (cache.hits, cache.misses, cache.evictions))
+        self.assertAlmostEqual(1 / 3, cache.hit_rate)
+
+    def test_eviction_by_bytes(self):
+        cache = LRUCache(max_bytes=2000)
+        cache["a"], cache["b"] = np.zeros(100), np.zeros(100)
+        self.assertEqual(1600, cache.nbytes)
+
+        self.assertEqual(100, len(cache["a"]))
+        cache["c"] = np.zeros(50, dtype=np.float32)
+        self.assertEqual(1800, cache.nbytes)
+        self.assertEqual(3, len(cache))
+
+        cache["d"] = np.zeros(100)
+        self.assertNotIn("b", cache)
+        self.assertEqual(1800, cache.nbytes)
+        self.assertEqual(1, cache.evictions)
+
+        cache["e"] = np.zeros(1000)
+        self.assertEqual(["e"], [key for key in "abcde" if key in cache])
+        self.assertEqual(8000, cache.nbytes)
+
+    def test_clear(self):
+        cache = LRUCache(2)
+        cache["a"] = 1
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
+
+class TestClockCache(unittest.TestCase):
+    def test_eviction(self):
+        cache = ClockCache(2)
+        cache["a"], cache["b"] = 1, 2
+        self.assertEqual(1, cache["a"])
+
+        cache["c"] = 3
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(3, cache["c"])
+
+        cache["d"] = 4
+        self.assertEqual(2, len(cache))
+        self.assertEqual((2, 0, 2), (cache.hits, cache.misses, cache.evictions))
+
+    def test_eviction_by_bytes(self):
+        cache = ClockCache(max_bytes=2000)
+        cache["a"], cache["b"] = np.zeros(100), np.zeros(100)
+        self.assertEqual(100, len(cache["a"]))
+
+        cache["c"] = np.zeros(100)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(1600, cache.nbytes)
+
+        cache["d"] = np.zeros(50)
+        self.assertEqual(2000, cache.nbytes)
+        self.assertEqual(3, len(cache))
+
+        cache["c"] = np.zeros(10)
+        self.assertEqual(1280, cache.nbytes)
+        self.assertEqual(1, cache.evictions)
+
+    def test_update(self):
+        cache = ClockCache(2)
+        cache["a"] = 1
+        cache["a"] = 2
+        self.assertEqual(1, len(cache))
+        self.assertEqual(2, cache["a"])
+
+    def test_clear(self):
+        cache = ClockCache(2)
+        cache["a"], cache["b"], cache["c"] = 1, 2, 3
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        cache["d"] = 4
+        self.assertEqual(4, cache["d"])
+
+
+class TestEstimateSize(unittest.TestCase):
+    def test_estimate_size(self):
+        self.assertEqual(400, estimate_size(np.zeros(100, dtype=np.float32)))
+        self.assertLess(800, estimate_size((np.zeros(100), np.zeros(0))))
+        self.assertLess(estimate_size({"a": 1.0}), estimate_size({"a": 1.0, "b": 2.0}))
+
+
+if __name__ == "__main__":
+    unittest.main()